@@ -70,6 +70,9 @@ public static function table(Table $table): Table
                 IconColumn::make('is_error')
                     ->label('에러 발생 여부')
                     ->boolean(),
+                TextColumn::make('scroll_yield_curve.stop_reason')
+                    ->label('스크롤 종료 사유')
+                    ->toggleable(isToggledHiddenByDefault: true),
                 TextColumn::make('created_at')
                     ->label('생성일')
                     ->sortable(),
@@ -20,6 +20,7 @@ class TiktokUser extends Model
         'profile_image' => 'string',
         'country' => 'string',
         'reviewed_at' => 'datetime',
+        'videos_scraped_at' => 'datetime',
     ];
 
     // 상태 상수 정의
@@ -11,4 +11,8 @@ class TiktokUserLog extends Model
     protected $table = 'tiktok_user_logs';
     public $timestamps = true;
     protected $guarded = [];
+
+    protected $casts = [
+        'scroll_yield_curve' => 'array',
+    ];
 }
@@ -0,0 +1,28 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        Schema::table('tiktok_user_logs', function (Blueprint $table) {
+            $table->json('scroll_yield_curve')->nullable()->after('is_error')->comment('스크롤별 신규 카드 수 / 조건 통과 수 / 수율');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('tiktok_user_logs', function (Blueprint $table) {
+            $table->dropColumn('scroll_yield_curve');
+        });
+    }
+};
@@ -0,0 +1,37 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        Schema::table('tiktok_users', function (Blueprint $table) {
+            $table->string('latest_video_url', 255)->nullable()->after('reviewed_by')->comment('마지막 비디오 수집 시 가장 최근 video_url (증분 수집 기준점)');
+            $table->timestamp('videos_scraped_at')->nullable()->after('latest_video_url')->comment('마지막 비디오 수집 시간');
+        });
+
+        Schema::table('tiktok_brand_accounts', function (Blueprint $table) {
+            $table->string('latest_repost_video_url', 255)->nullable()->after('last_scraped_at')->comment('마지막 리포스트 수집 시 가장 최근 video_url (증분 수집 기준점)');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('tiktok_users', function (Blueprint $table) {
+            $table->dropColumn(['latest_video_url', 'videos_scraped_at']);
+        });
+
+        Schema::table('tiktok_brand_accounts', function (Blueprint $table) {
+            $table->dropColumn('latest_repost_video_url');
+        });
+    }
+};
@@ -0,0 +1,102 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Log;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * 계정별 video_url 유니크 키 (백엔드 일괄 upsert 의 ON DUPLICATE KEY UPDATE 기준)
+     * tiktok_repost_videos 는 2025_09_17_000001 마이그레이션에 이미 같은 키가 있음
+     */
+    private array $uniqueKeys = [
+        'tiktok_videos' => ['tiktok_user_id', 'tiktok_videos_tiktok_user_id_video_url_unique'],
+    ];
+
+    /**
+     * 중복 행을 가리키는 참조 컬럼 (삭제 전에 남길 행으로 옮김, 그대로 두면 onDelete('set null') 로 연결이 끊김)
+     */
+    private array $references = [
+        'tiktok_videos' => [
+            ['tiktok_upload_requests', 'tiktok_video_id'],
+        ],
+    ];
+
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        foreach ($this->uniqueKeys as $table => [$ownerColumn, $indexName]) {
+            if ($this->indexExists($table, $indexName)) {
+                continue;
+            }
+
+            // 중복 행을 가리키는 참조를 가장 먼저 저장된 행으로 변경
+            foreach ($this->references[$table] ?? [] as [$refTable, $refColumn]) {
+                $moved = DB::update("
+                    UPDATE {$refTable} AS ref
+                    JOIN {$table} AS dup ON ref.{$refColumn} = dup.id
+                    JOIN (
+                        SELECT {$ownerColumn}, video_url, MIN(id) AS keep_id
+                        FROM {$table}
+                        GROUP BY {$ownerColumn}, video_url
+                        HAVING COUNT(*) > 1
+                    ) AS survivor
+                      ON survivor.{$ownerColumn} = dup.{$ownerColumn}
+                     AND survivor.video_url = dup.video_url
+                    SET ref.{$refColumn} = survivor.keep_id
+                    WHERE dup.id <> survivor.keep_id
+                ");
+                if ($moved > 0) {
+                    Log::info("{$table} 중복 정리: {$refTable}.{$refColumn} {$moved}건을 남길 행으로 변경");
+                }
+            }
+
+            // 기존 중복 행 정리 (가장 먼저 저장된 행만 남김)
+            $deleted = DB::delete("
+                DELETE newer FROM {$table} AS newer
+                JOIN {$table} AS older
+                  ON older.{$ownerColumn} = newer.{$ownerColumn}
+                 AND older.video_url = newer.video_url
+                 AND older.id < newer.id
+            ");
+            if ($deleted > 0) {
+                Log::info("{$table} 중복 정리: {$deleted}건 삭제");
+            }
+
+            Schema::table($table, function (Blueprint $table) use ($ownerColumn, $indexName) {
+                $table->unique([$ownerColumn, 'video_url'], $indexName);
+            });
+        }
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        foreach ($this->uniqueKeys as $table => [$ownerColumn, $indexName]) {
+            if ($this->indexExists($table, $indexName)) {
+                Schema::table($table, function (Blueprint $table) use ($indexName) {
+                    $table->dropUnique($indexName);
+                });
+            }
+        }
+    }
+
+    /**
+     * Check if an index exists on a table
+     */
+    private function indexExists($table, $index): bool
+    {
+        $indexes = collect(Schema::getConnection()->select("SHOW INDEX FROM {$table}"))
+            ->pluck('Key_name')
+            ->toArray();
+
+        return in_array($index, $indexes);
+    }
+};
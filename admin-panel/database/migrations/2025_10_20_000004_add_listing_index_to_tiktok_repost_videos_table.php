@@ -0,0 +1,49 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * 브랜드별 리포스트 목록 (posted_at, id) 커서 페이지네이션용 인덱스
+     */
+    private string $indexName = 'tiktok_repost_videos_tiktok_brand_account_id_posted_at_index';
+
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        if (!$this->indexExists('tiktok_repost_videos', $this->indexName)) {
+            Schema::table('tiktok_repost_videos', function (Blueprint $table) {
+                $table->index(['tiktok_brand_account_id', 'posted_at'], $this->indexName);
+            });
+        }
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        if ($this->indexExists('tiktok_repost_videos', $this->indexName)) {
+            Schema::table('tiktok_repost_videos', function (Blueprint $table) {
+                $table->dropIndex($this->indexName);
+            });
+        }
+    }
+
+    /**
+     * Check if an index exists on a table
+     */
+    private function indexExists($table, $index): bool
+    {
+        $indexes = collect(Schema::getConnection()->select("SHOW INDEX FROM {$table}"))
+            ->pluck('Key_name')
+            ->toArray();
+
+        return in_array($index, $indexes);
+    }
+};
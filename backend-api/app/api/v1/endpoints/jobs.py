@@ -0,0 +1,52 @@
+from fastapi import APIRouter, HTTPException
+from typing import Optional
+
+from app.services.job_manager import job_manager
+from app.utils.endpoint_helpers import handle_endpoint_error
+
+router = APIRouter()
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str):
+    """
+    비동기 작업 상태를 조회합니다.
+
+    Args:
+        job_id: 작업 제출 시 받은 job_id
+
+    Returns:
+        작업 상태, 진행 카운터, 완료 시 결과 (또는 에러)
+
+    Raises:
+        HTTPException: 없는(또는 JOB_RETENTION_HOURS 가 지나 삭제된) job_id 이면 404
+    """
+    try:
+        job = job_manager.get(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+        return {"success": True, "job": job}
+    except HTTPException:
+        raise
+    except Exception as e:
+        return handle_endpoint_error(e, "get_job")
+
+
+@router.get("")
+async def list_jobs(status: Optional[str] = None, limit: int = 50):
+    """
+    최근 비동기 작업 목록을 조회합니다. (결과 본문 제외)
+
+    Args:
+        status: 상태 필터 (queued / running / completed / failed)
+        limit: 조회할 최대 작업 수
+
+    Returns:
+        작업 목록
+    """
+    try:
+        jobs = job_manager.list(status=status, limit=limit)
+        return {"success": True, "jobs": jobs, "count": len(jobs)}
+    except Exception as e:
+        return handle_endpoint_error(e, "list_jobs")
@@ -0,0 +1,32 @@
+from fastapi import APIRouter
+
+from app.services.blocking_executor import app_executor
+from app.services.browser_pool import browser_pool
+from app.services.known_user_index import known_user_index
+from app.services.rate_limiter import navigation_limiter
+from app.utils.endpoint_helpers import handle_endpoint_error
+
+router = APIRouter()
+
+
+@router.get("/executor")
+async def get_executor_stats():
+    """
+    공용 스레드 풀, 브라우저 풀, 페이지 이동 속도 제한, 저장된 사용자 인덱스 지표를 조회합니다.
+
+    Returns:
+        executor: 대기열 길이(queued), 실행 중 워커 수(active), 누적 완료/실패 수 등
+        browser_pool: 브라우저별 대여 현황
+        navigation: 페이지 이동 토큰 버킷 설정과 누적 대기 통계
+        known_users: 저장된 사용자 인덱스 크기와 마지막 동기화 시각
+    """
+    try:
+        return {
+            "success": True,
+            "executor": app_executor.stats(),
+            "browser_pool": browser_pool.stats(),
+            "navigation": navigation_limiter.stats(),
+            "known_users": known_user_index.stats()
+        }
+    except Exception as e:
+        return handle_endpoint_error(e, "get_executor_stats")
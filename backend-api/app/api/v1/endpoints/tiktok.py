@@ -1,20 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException, Form
 from app.schemas.tiktok import ScrapeRequest, TikTokLoginRequest, SendMessageRequest, UploadSessionRequest, ScrapeVideoRequest, CollectRepostUsersRequest
 from app.services.tiktok_service import TikTokService
+from app.services.blocking_executor import app_executor
 from app.core.database import get_sync_db
 from app.utils.endpoint_helpers import (
     execute_tiktok_service, get_session_file_path, handle_endpoint_error,
-    create_success_response, validate_session_file, TikTokEndpointHelper
+    create_success_response, validate_session_file, TikTokEndpointHelper,
+    submit_background_job, encode_cursor, decode_cursor, cached_count,
+    project_columns, serialize_row
+)
+from app.services.tiktok_jobs import (
+    run_scrape_users, run_scrape_videos, run_scrape_repost_videos,
+    run_brand_repost_videos, run_collect_repost_users
 )
 from app.models.tiktok import (
     TikTokRepostVideo, TikTokUser, TikTokSender,
     TikTokBrandAccount, TikTokUploadRequest, TikTokVideo
 )
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import and_, or_
 from datetime import datetime, timedelta
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import requests
@@ -25,20 +30,16 @@ router = APIRouter()
 # === USER MANAGEMENT ===
 
 @router.post("/scrape")
-async def scrape_users(request: ScrapeRequest, db: Session = Depends(get_sync_db)):
+async def scrape_users(request: ScrapeRequest, async_job: bool = False, db: Session = Depends(get_sync_db)):
     try:
         print(f"Request received: {request}")
-        
-        result = await execute_tiktok_service(
-            db,
-            'scrape_users',
-            request.keyword,
-            request.min_followers,
-            request.scrolls,
-            True,
-            request.tiktok_user_log_id
-        )
-        
+
+        # async_job=true 이면 작업만 등록하고 job_id 즉시 반환
+        if async_job:
+            return submit_background_job("scrape_users", request)
+
+        result = await app_executor.run(run_scrape_users, db, request)
+
         return result
     except Exception as e:
         return handle_endpoint_error(e, "scrape_users")
@@ -100,109 +101,55 @@ async def upload_session(request: UploadSessionRequest):
 # === VIDEO SCRAPING ===
 
 @router.post("/scrape_video")
-async def scrape_videos(request: ScrapeVideoRequest, db: Session = Depends(get_sync_db)):
+async def scrape_videos(request: ScrapeVideoRequest, async_job: bool = False, db: Session = Depends(get_sync_db)):
     """
     TikTok 사용자들의 비디오 정보를 스크래핑합니다.
     
     Args:
         request: 사용자명 리스트, 세션 사용 여부, 세션 파일 경로, sender_id
+        async_job: True 이면 백그라운드 작업으로 제출하고 job_id 반환
         db: 데이터베이스 세션
         
     Returns:
-        스크래핑 결과
+        스크래핑 결과 (async_job 사용 시 job_id)
     """
     try:
         print(f"Scrape video request received for {len(request.usernames)} users")
         print(f"Use session: {request.use_session}")
         print(f"Sender ID: {request.sender_id}")
-        
-        # 비디오 스크래핑 파라미터 준비 (세션 파일 포함)
-        params = TikTokEndpointHelper.prepare_video_scraping_params(request, db)
-        print(f"Final session file: {params['session_file']}")
-        
-        result = await execute_tiktok_service(
-            db,
-            'scrape_user_videos',
-            params['usernames'],
-            params['use_session'],
-            params['session_file']
-        )
-        
+
+        if async_job:
+            return submit_background_job("scrape_videos", request)
+
+        result = await app_executor.run(run_scrape_videos, db, request)
+
         return result
     except Exception as e:
         return handle_endpoint_error(e, "scrape_videos")
 
 
 @router.post("/scrape_repost_video")
-async def scrape_repost_videos(request: ScrapeVideoRequest, db: Session = Depends(get_sync_db)):
+async def scrape_repost_videos(request: ScrapeVideoRequest, async_job: bool = False, db: Session = Depends(get_sync_db)):
     """
     TikTok 사용자들의 리포스트 비디오 정보를 스크래핑합니다.
     
     Args:
         request: 사용자명 리스트, 세션 사용 여부, 세션 파일 경로, sender_id
+        async_job: True 이면 백그라운드 작업으로 제출하고 job_id 반환
         db: 데이터베이스 세션
         
     Returns:
-        스크래핑 결과
+        스크래핑 결과 (async_job 사용 시 job_id)
     """
     try:
         print(f"Scrape repost video request received for {len(request.usernames)} users")
         print(f"Use session: {request.use_session}")
-        
-        # sender_id가 있으면 DB에서 해당 세션 파일 경로 조회
-        session_file_path = None
-        if request.sender_id:
-            sender = db.query(TikTokSender).filter(TikTokSender.id == request.sender_id).first()
-            if sender and sender.session_file_path:
-                session_file_path = sender.session_file_path
-                print(f"Using session file from DB for sender {request.sender_id}: {session_file_path}")
-        
-        # request에서 직접 전달된 세션 파일 경로가 있으면 우선 사용
-        if request.session_file:
-            session_file_path = request.session_file
-            print(f"Using session file from request: {session_file_path}")
-        
-        # 서비스 초기화 및 실행
-        scraper = TikTokService(db_session=db)
-        
-        # Windows 호환성을 위해 동기 함수를 ThreadPoolExecutor에서 실행
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(
-                executor,
-                scraper.scrape_user_repost_videos,
-                request.usernames,
-                request.use_session,
-                session_file_path if session_file_path else "tiktok_auth.json"
-            )
-        
-        # 응답에 타임스탬프 추가
-        result["timestamp"] = datetime.now().isoformat()
-        result["request_info"] = {
-            "total_users": len(request.usernames),
-            "use_session": request.use_session,
-            "sender_id": request.sender_id
-        }
-
-        # 리포스트 수집이 완료되면 관리페이지에 콜백
-        try:
-            admin_url = os.getenv("ADMIN_URL", "https://example.com")
-            callback_url = f"{admin_url}/api/tiktok/callback-collect-repost-users"
-            callback_data = {"limit": 100}
 
-            import requests
-            response = requests.post(callback_url, json=callback_data, timeout=10)
+        if async_job:
+            return submit_background_job("scrape_repost_videos", request)
 
-            if response.status_code == 200:
-                print(f"✅ 관리페이지 콜백 성공: {callback_url}")
-                result["callback_status"] = "success"
-            else:
-                print(f"⚠️ 관리페이지 콜백 실패: {response.status_code}")
-                result["callback_status"] = f"failed: {response.status_code}"
-
-        except Exception as callback_error:
-            print(f"❌ 관리페이지 콜백 오류: {callback_error}")
-            result["callback_status"] = f"error: {str(callback_error)}"
+        # 세션 파일 결정, 스크래핑, 관리페이지 콜백까지 처리
+        result = await app_executor.run(run_scrape_repost_videos, db, request)
 
         return result
     except Exception as e:
@@ -217,6 +164,7 @@ async def scrape_repost_videos(request: ScrapeVideoRequest, db: Session = Depend
 @router.post("/brand/repost-videos")
 async def scrape_brand_repost_videos(
     request: ScrapeVideoRequest,
+    async_job: bool = False,
     db: Session = Depends(get_sync_db)
 ):
     """
@@ -224,51 +172,19 @@ async def scrape_brand_repost_videos(
     
     Args:
         request: ScrapeVideoRequest (usernames 배열 포함)
+        async_job: True 이면 백그라운드 작업으로 제출하고 job_id 반환
     
     Returns:
         수집 결과 (브랜드 계정들 정보, 리포스트 비디오 목록, 통계)
     """
     try:
         print(f"Request received: {request}")
-        
-        tiktok_service = TikTokService(db_session=db)
-        all_results = []
-        total_stats = {
-            "total_videos": 0,
-            "new_videos": 0,
-            "updated_videos": 0,
-            "errors": 0
-        }
-        
-        # 각 브랜드 계정에 대해 수집
-        for brand_username in request.usernames:
-            print(f"Processing brand account: {brand_username}")
-            
-            # Windows 호환성을 위해 동기 함수를 ThreadPoolExecutor에서 실행
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor() as executor:
-                brand_result = await loop.run_in_executor(
-                    executor,
-                    tiktok_service.scrape_brand_repost_videos,
-                    brand_username,
-                    request.max_videos or 20,
-                    request.use_session or False,
-                    request.session_file or "tiktok_auth.json"
-                )
-            
-            all_results.append(brand_result)
-            
-            # 통계 합산
-            if "stats" in brand_result:
-                for key in total_stats:
-                    total_stats[key] += brand_result["stats"].get(key, 0)
-        
-        result = {
-            "results": all_results,
-            "total_stats": total_stats,
-            "processed_accounts": len(request.usernames)
-        }
-        
+
+        if async_job:
+            return submit_background_job("brand_repost_videos", request)
+
+        result = await app_executor.run(run_brand_repost_videos, db, request)
+
         return result
         
     except Exception as e:
@@ -282,24 +198,48 @@ async def scrape_brand_repost_videos(
 async def get_brand_accounts(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    fields: Optional[str] = None,
     db: Session = Depends(get_sync_db)
 ):
     """
-    등록된 브랜드 계정 목록을 조회합니다.
+    등록된 브랜드 계정 목록을 조회합니다. (id 오름차순)
     
     Args:
-        skip: 건너뛸 레코드 수
+        skip: 건너뛸 레코드 수 (cursor 가 있으면 무시)
         limit: 조회할 최대 레코드 수
+        cursor: 이전 응답의 next_cursor (id 기준 다음 페이지, 깊은 페이지도 OFFSET 없이 조회)
+        include_total: total 포함 여부 (LISTING_COUNT_CACHE_SECONDS 동안 캐시된 값)
+        fields: 응답에 포함할 컬럼 (쉼표 구분, 없으면 전체, id 는 항상 포함)
     
     Returns:
-        브랜드 계정 목록
+        브랜드 계정 목록, 다음 페이지 cursor (마지막 페이지면 None)
     """
     try:
-        accounts = db.query(TikTokBrandAccount).offset(skip).limit(limit).all()
-        return {
-            "accounts": [account.to_dict() for account in accounts],
-            "total": db.query(TikTokBrandAccount).count()
+        try:
+            columns = project_columns(TikTokBrandAccount, fields)
+            after = decode_cursor(cursor, ('i',)) if cursor else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        query = db.query(*columns) if columns else db.query(TikTokBrandAccount)
+        query = query.order_by(TikTokBrandAccount.id)
+        if after:
+            query = query.filter(TikTokBrandAccount.id > after['i'])
+        else:
+            query = query.offset(skip)
+        rows = query.limit(limit).all()
+
+        response = {
+            "accounts": [serialize_row(row) for row in rows] if columns else [account.to_dict() for account in rows],
+            "next_cursor": encode_cursor({'i': rows[-1].id}) if len(rows) == limit else None
         }
+        if include_total:
+            response["total"] = cached_count("brand_accounts", db.query(TikTokBrandAccount))
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error in get_brand_accounts: {e}")
         return {"error": str(e), "message": "Internal server error"}
@@ -310,32 +250,63 @@ async def get_brand_repost_videos(
     brand_id: int,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    fields: Optional[str] = None,
     db: Session = Depends(get_sync_db)
 ):
     """
-    특정 브랜드 계정의 리포스트 비디오 목록을 조회합니다.
+    특정 브랜드 계정의 리포스트 비디오 목록을 조회합니다. (posted_at, id 내림차순, posted_at 이 없는 항목은 마지막)
 
     Args:
         brand_id: 브랜드 계정 ID
-        skip: 건너뛸 레코드 수
+        skip: 건너뛸 레코드 수 (cursor 가 있으면 무시)
         limit: 조회할 최대 레코드 수
+        cursor: 이전 응답의 next_cursor ((posted_at, id) 기준 다음 페이지, 깊은 페이지도 OFFSET 없이 조회)
+        include_total: total 포함 여부 (LISTING_COUNT_CACHE_SECONDS 동안 캐시된 값)
+        fields: 응답에 포함할 컬럼 (쉼표 구분, 없으면 전체, id/posted_at 은 항상 포함)
 
     Returns:
-        리포스트 비디오 목록
+        리포스트 비디오 목록, 다음 페이지 cursor (마지막 페이지면 None)
     """
     try:
-        videos = db.query(TikTokRepostVideo).filter(
-            TikTokRepostVideo.tiktok_brand_account_id == brand_id
-        ).order_by(
-            TikTokRepostVideo.posted_at.desc()
-        ).offset(skip).limit(limit).all()
-
-        return {
-            "videos": [video.to_dict() for video in videos],
-            "total": db.query(TikTokRepostVideo).filter(
-                TikTokRepostVideo.tiktok_brand_account_id == brand_id
-            ).count()
+        try:
+            columns = project_columns(TikTokRepostVideo, fields, ('id', 'posted_at'))
+            after = decode_cursor(cursor, ('p', 'i')) if cursor else None
+            after_posted_at = datetime.fromisoformat(after['p']) if after and after['p'] else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        query = db.query(*columns) if columns else db.query(TikTokRepostVideo)
+        query = query.filter(TikTokRepostVideo.tiktok_brand_account_id == brand_id).order_by(
+            TikTokRepostVideo.posted_at.desc(),
+            TikTokRepostVideo.id.desc()
+        )
+        if after and after_posted_at:
+            # 내림차순에서 NULL 은 가장 뒤에 오므로 posted_at 이 없는 항목은 항상 다음 페이지 쪽
+            query = query.filter(or_(
+                TikTokRepostVideo.posted_at < after_posted_at,
+                and_(TikTokRepostVideo.posted_at == after_posted_at, TikTokRepostVideo.id < after['i']),
+                TikTokRepostVideo.posted_at.is_(None)
+            ))
+        elif after:
+            query = query.filter(TikTokRepostVideo.posted_at.is_(None), TikTokRepostVideo.id < after['i'])
+        else:
+            query = query.offset(skip)
+        rows = query.limit(limit).all()
+
+        response = {
+            "videos": [serialize_row(row) for row in rows] if columns else [video.to_dict() for video in rows],
+            "next_cursor": encode_cursor({'p': rows[-1].posted_at, 'i': rows[-1].id}) if len(rows) == limit else None
         }
+        if include_total:
+            response["total"] = cached_count(
+                f"brand_repost_videos:{brand_id}",
+                db.query(TikTokRepostVideo).filter(TikTokRepostVideo.tiktok_brand_account_id == brand_id)
+            )
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error in get_brand_repost_videos: {e}")
         return {"error": str(e), "message": "Internal server error"}
@@ -344,6 +315,7 @@ async def get_brand_repost_videos(
 @router.post("/collect-repost-users")
 async def collect_repost_users(
     request: CollectRepostUsersRequest,
+    async_job: bool = False,
     db: Session = Depends(get_sync_db)
 ):
     """
@@ -351,59 +323,19 @@ async def collect_repost_users(
 
     Args:
         request: CollectRepostUsersRequest (limit, user_agent, session_file 포함)
+        async_job: True 이면 백그라운드 작업으로 제출하고 job_id 반환
         db: 데이터베이스 세션
 
     Returns:
-        처리 결과
+        처리 결과 (async_job 사용 시 job_id)
     """
     try:
-        # 미확인 리포스트 비디오 조회
-        unchecked_videos = db.query(TikTokRepostVideo).filter(
-            TikTokRepostVideo.is_checked == 'N'
-        ).limit(request.limit).all()
+        if async_job:
+            return submit_background_job("collect_repost_users", request)
 
-        if not unchecked_videos:
-            return {
-                "message": "No unchecked videos found",
-                "processed": 0
-            }
+        result = await app_executor.run(run_collect_repost_users, db, request)
 
-        tiktok_service = TikTokService(db_session=db)
-
-        # 비디오 데이터 준비 (브랜드 계정 정보 포함)
-        video_data_list = []
-        for video in unchecked_videos:
-            # 브랜드 계정의 country 값 조회
-            brand_account = db.query(TikTokBrandAccount).filter(
-                TikTokBrandAccount.id == video.tiktok_brand_account_id
-            ).first()
-
-            video_data_list.append({
-                "video_url": video.video_url,
-                "video_id": video.id,
-                "country": brand_account.country if brand_account else None
-            })
-
-        # 브라우저를 재사용하여 여러 사용자 정보 수집
-        result = await execute_tiktok_service(
-            db,
-            'collect_multiple_users_from_videos',
-            video_data_list,
-            request.user_agent,  # user_agent 파라미터 추가
-            request.session_file  # session_file 파라미터 추가
-        )
-
-        processed_count = result.get('processed', 0)
-        collected_users = result.get('collected_users', [])
-        failed_videos = result.get('failed_videos', [])
-
-        return {
-            "message": "User collection completed",
-            "processed": processed_count,
-            "collected_users": collected_users,
-            "failed_videos": failed_videos,
-            "total_unchecked": len(unchecked_videos)
-        }
+        return result
 
     except Exception as e:
         print(f"Error in collect_repost_users: {e}")
@@ -435,22 +367,19 @@ async def send_message(request: SendMessageRequest, db: Session = Depends(get_sy
             )
         
         print(f"Using session file: {session_file}")
-        # Windows 호환성을 위해 동기 함수를 ThreadPoolExecutor에서 실행
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            # 여러 사용자에게 메시지 일괄 전송 (각 사용자마다 템플릿에서 랜덤 메시지 생성)
-            try:
-                result = await loop.run_in_executor(
-                    executor,
-                    tiktok_service.send_bulk_tiktok_messages,
-                    request.usernames,
-                    session_file,
-                    request.template_code,
-                    request.message_id  # message_id 전달
-                )
-            except ValueError as e:
-                # 템플릿이 없는 경우 404 에러
-                raise HTTPException(status_code=404, detail=str(e))
+        # 동기 함수를 공용 스레드 풀에서 실행
+        # 여러 사용자에게 메시지 일괄 전송 (각 사용자마다 템플릿에서 랜덤 메시지 생성)
+        try:
+            result = await app_executor.run(
+                tiktok_service.send_bulk_tiktok_messages,
+                request.usernames,
+                session_file,
+                request.template_code,
+                request.message_id  # message_id 전달
+            )
+        except ValueError as e:
+            # 템플릿이 없는 경우 404 에러
+            raise HTTPException(status_code=404, detail=str(e))
         
         return {
             "success": True,
@@ -504,14 +433,11 @@ async def upload_check(db: Session = Depends(get_sync_db)):
         
         tiktok_service = TikTokService(db_session=db)
         
-        # Windows 호환성을 위해 동기 함수를 ThreadPoolExecutor에서 실행
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(
-                executor,
-                tiktok_service.check_and_update_uploads,
-                pending_requests
-            )
+        # 동기 함수를 공용 스레드 풀에서 실행
+        result = await app_executor.run(
+            tiktok_service.check_and_update_uploads,
+            pending_requests
+        )
         
         return result
         
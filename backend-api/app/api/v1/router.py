@@ -1,5 +1,7 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import tiktok
+from app.api.v1.endpoints import tiktok, jobs, system
 
 api_router = APIRouter()
 api_router.include_router(tiktok.router, prefix="/tiktok", tags=["tiktok"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
+api_router.include_router(system.router, prefix="/system", tags=["system"])
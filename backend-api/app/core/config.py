@@ -19,7 +19,57 @@ class Settings(BaseSettings):
     
     # 관리페이지 URL
     ADMIN_URL: Optional[str] = None
-    
+
+    # 브라우저 풀 설정
+    BROWSER_POOL_SIZE: int = 2  # 유지할 Chromium 인스턴스 수 (headless 모드별)
+    BROWSER_POOL_MAX_USES: int = 50  # 브라우저 하나당 최대 대여 횟수 (초과 시 재기동)
+    BROWSER_CAPTURE_RESPONSES: bool = False  # 페이지의 데이터 API(JSON) 응답을 캡처해 정확한 통계 사용
+    BROWSER_TEXT_ONLY_BLOCK: str = "media,font,image"  # 텍스트 위주 수집에서 차단할 리소스 타입 (쉼표 구분, 빈 값이면 차단 안 함)
+
+    # 페이지 대기 설정 (고정 sleep 대신 조건 기반 대기)
+    WAIT_TIMEOUT_MS: int = 15000  # 셀렉터/응답/네트워크 유휴 대기 최대 시간
+    NETWORK_IDLE_MS: int = 500  # 이 시간 동안 요청이 없으면 네트워크 유휴로 판단
+    NETWORK_IDLE_MAX_INFLIGHT: int = 0  # 유휴로 간주할 최대 진행 중 요청 수
+    POLITENESS_DELAY_MIN: float = 5.0  # 프로필/계정 방문 사이 최소 대기 (초)
+    POLITENESS_DELAY_MAX: float = 10.0  # 프로필/계정 방문 사이 최대 대기 (초)
+    NAVIGATION_RATE_PER_MINUTE: float = 20  # 전체 페이지 이동(goto) 속도 예산 (분당, 0 이면 제한 없음)
+    NAVIGATION_BURST: int = 3  # 연속으로 허용할 최대 페이지 이동 수
+    SCRAPE_MAX_CONCURRENCY: int = 4  # 동시 프로필 수집 시 최대 페이지(컨텍스트) 수
+    REPOST_MAX_SCROLLS: int = 50  # 브랜드 리포스트 깊은 수집 시 최대 스크롤(다음 페이지 요청) 횟수
+    SCROLL_IDLE_LIMIT: int = 2  # 새 항목 없이 이 횟수만큼 연속 스크롤하면 무한 스크롤 종료
+    ADAPTIVE_SCROLL_MIN_YIELD: float = 0.05  # 적응형 스크롤: 새 카드 중 min_followers 통과 비율이 이보다 낮으면 저수율
+    ADAPTIVE_SCROLL_PATIENCE: int = 2  # 적응형 스크롤: 저수율 스크롤이 이 횟수만큼 연속되면 종료
+
+    # 증분 수집 (지난 수집 이후 새 비디오만 처리)
+    INCREMENTAL_KNOWN_WINDOW: int = 100  # 계정별로 비교할 최근 저장 video_url 수
+    INCREMENTAL_PINNED_SLOTS: int = 3  # 고정 게시물이 올 수 있는 맨 앞 칸 수 (이 안의 저장된 항목으로는 멈추지 않음)
+    INCREMENTAL_REFRESH_SAMPLE: int = 3  # 저장된 항목 중 통계(조회수 등) 갱신을 위해 다시 저장할 수
+
+    # 저장된 사용자 인덱스 (검색 수집에서 변경 없는 사용자 저장 생략)
+    KNOWN_USER_INDEX_FULL_RELOAD_SECONDS: int = 3600  # 이 시간이 지나면 변경분이 아닌 전체를 다시 읽음
+
+    # 스크랩 결과 처리 파이프라인 (추출 → DB 배치 기록 → 이미지 다운로드 → 업로드)
+    PIPELINE_QUEUE_SIZE: int = 100  # 단계별 대기열 최대 길이 (가득 차면 앞 단계가 대기)
+    PIPELINE_DB_BATCH_SIZE: int = 20  # 한 번에 기록할 최대 항목 수
+    PIPELINE_FLUSH_INTERVAL: float = 1.0  # 배치가 덜 찼어도 이 시간(초)이 지나면 기록
+    PIPELINE_IMAGE_WORKERS: int = 4  # 이미지 다운로드 동시 실행 수
+    PIPELINE_UPLOAD_WORKERS: int = 2  # 관리페이지 업로드 동시 실행 수
+
+    # DB 쓰기 묶음 (UnitOfWork: 행마다 커밋하지 않고 모아서 한 트랜잭션으로 커밋)
+    UOW_FLUSH_SIZE: int = 50  # 이 개수만큼 변경이 쌓이면 커밋
+    UOW_FLUSH_INTERVAL_MS: int = 2000  # 첫 변경 후 이 시간(ms)이 지나면 커밋
+
+    # 목록 조회
+    LISTING_COUNT_CACHE_SECONDS: int = 30  # 목록 total(COUNT) 캐시 유지 시간 (초)
+
+    # 공용 스레드 풀 설정
+    EXECUTOR_MAX_WORKERS: int = 8  # 엔드포인트에서 동기 서비스 함수를 실행할 워커 수
+
+    # 비동기 작업(Job) 설정
+    JOB_DB_PATH: str = "tiktok_jobs.sqlite3"  # 작업 상태 저장용 SQLite 파일
+    JOB_MAX_WORKERS: int = 2  # 동시에 실행할 수 있는 무거운 작업 수
+    JOB_RETENTION_HOURS: int = 168  # 끝난 작업(완료/실패)을 보관할 시간, 지나면 삭제 (0 이면 삭제 안 함)
+
     @property
     def SYNC_DATABASE_URL(self) -> str:
         return f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
@@ -1,6 +1,9 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import api_router
+from app.services.browser_loop import browser_loop
+from app.services.job_manager import job_manager
+from app.services.blocking_executor import app_executor
 import time
 import asyncio
 import sys
@@ -47,6 +50,15 @@ app.include_router(api_router, prefix="/api/v1")
 # 모든 라우트 출력 (디버깅용)
 @app.on_event("startup")
 async def startup_event():
+    # 엔드포인트용 공용 스레드 풀 생성
+    app_executor.start()
+
+    # Playwright 전용 이벤트 루프 스레드 및 브라우저 풀 시작
+    await asyncio.to_thread(browser_loop.start)
+
+    # 비동기 작업 관리자 시작 (재시작 전 대기 중이던 작업 재실행)
+    job_manager.start()
+
     print("SERVER STARTED!")
     print("Available endpoints:")
     print("  GET  / - Root endpoint")
@@ -54,6 +66,20 @@ async def startup_event():
     print("  POST /api/v1/tiktok/save_session - Save session2")
     print("  POST /api/v1/tiktok/send_message - Send message3")
     print("  POST /api/v1/tiktok/scrape_video - Scrape user videos")
+    print("  GET  /api/v1/jobs/{job_id} - Background job status")
+    print("  GET  /api/v1/system/executor - Thread pool / browser pool stats")
     print("  GET  /docs - API documentation (Swagger)")
     print("  GET  /redoc - API documentation (ReDoc)")
-    print("Server running on http://localhost:8085")
\ No newline at end of file
+    print("Server running on http://localhost:8085")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # 새 작업 실행 중지
+    job_manager.shutdown()
+
+    # 브라우저 풀 종료 후 루프 스레드 정지
+    await asyncio.to_thread(browser_loop.stop)
+
+    # 공용 스레드 풀 종료 (실행 중인 요청은 완료까지 대기)
+    await asyncio.to_thread(app_executor.shutdown)
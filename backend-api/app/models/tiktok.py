@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List, Dict
-from sqlalchemy import Column, BigInteger, String, Integer, Text, TIMESTAMP, select, update, and_, Boolean, Enum, JSON
+from sqlalchemy import Column, BigInteger, String, Integer, Text, TIMESTAMP, select, insert, update, bindparam, and_, Boolean, Enum, JSON, UniqueConstraint, Index
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -33,6 +33,8 @@ class TikTokUser(Base):
     review_comment = Column(Text, nullable=True, comment='심사 코멘트')
     reviewed_at = Column(TIMESTAMP, nullable=True, comment='심사 일시')
     reviewed_by = Column(BigInteger, nullable=True, comment='심사자 ID')
+    latest_video_url = Column(String(255), nullable=True, comment='마지막 비디오 수집 시 가장 최근 video_url (증분 수집 기준점)')
+    videos_scraped_at = Column(TIMESTAMP, nullable=True, comment='마지막 비디오 수집 시간')
 
     def __repr__(self):
         return f"<TikTokUser(username='{self.username}', followers={self.followers})>"
@@ -60,7 +62,9 @@ class TikTokUser(Base):
             'review_score': self.review_score,
             'review_comment': self.review_comment,
             'reviewed_at': self.reviewed_at.isoformat() if self.reviewed_at else None,
-            'reviewed_by': self.reviewed_by
+            'reviewed_by': self.reviewed_by,
+            'latest_video_url': self.latest_video_url,
+            'videos_scraped_at': self.videos_scraped_at.isoformat() if self.videos_scraped_at else None
         }
 
     @classmethod
@@ -91,6 +95,7 @@ class TikTokUserLog(Base):
     search_user_count = Column(Integer, nullable=True, default=0, comment='탐지한 유저 수')
     save_user_count = Column(Integer, nullable=True, default=0, comment='저장한 유저 수')
     is_error = Column(Boolean, nullable=True, default=False, comment='에러발생 여부')
+    scroll_yield_curve = Column(JSON, nullable=True, comment='스크롤별 신규 카드 수 / 조건 통과 수 / 수율')
     created_at = Column(TIMESTAMP, server_default=func.now(), nullable=True)
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=True)
 
@@ -101,6 +106,13 @@ class TikTokUserLog(Base):
 class TikTokUserRepository:
     """TikTok 사용자 데이터 동기 저장소"""
 
+    # upsert_from_scrape 에서 한 번에 조회/저장할 사용자 수
+    UPSERT_CHUNK_SIZE = 500
+    # 새 사용자 INSERT 컬럼 (TikTokUser.from_scrape_data 와 동일)
+    SCRAPE_INSERT_COLUMNS = ('username', 'keyword', 'nickname', 'followers', 'profile_url', 'profile_image', 'bio', 'country')
+    # 기존 사용자의 팔로워 수가 바뀌었을 때 갱신할 컬럼
+    SCRAPE_UPDATE_COLUMNS = ('followers', 'bio', 'nickname', 'profile_image', 'country')
+
     def __init__(self, db_session: Session):
         self.session = db_session
 
@@ -151,43 +163,96 @@ class TikTokUserRepository:
     def upsert_from_scrape(self, users_data: List[Dict]) -> Dict:
         """스크래핑 데이터 upsert (있으면 업데이트, 없으면 생성)
 
+        UPSERT_CHUNK_SIZE 명 단위로 기존 사용자를 IN 조회 한 번으로 가져와 비교하고,
+        새 사용자는 다중 행 INSERT 한 번, 팔로워 수가 바뀐 사용자는 일괄 UPDATE 한 번으로 저장합니다.
+        커밋은 마지막에 한 번만 합니다.
+
         Returns:
-            처리 결과 통계
+            처리 결과 통계 (ids: 생성/업데이트/스킵된 사용자의 username → id)
         """
         stats = {
             'created': 0,
             'updated': 0,
-            'skipped': 0
+            'skipped': 0,
+            'ids': {}
         }
 
+        # 같은 username 이 여러 번 오면 마지막 값 사용 (앞의 것은 스킵)
+        by_username: Dict[str, Dict] = {}
         for data in users_data:
             username = data.get('username')
             if not username:
                 stats['skipped'] += 1
                 continue
+            if username in by_username:
+                stats['skipped'] += 1
+            by_username[username] = data
+
+        usernames = list(by_username)
+        update_stmt = update(TikTokUser.__table__).where(
+            TikTokUser.__table__.c.id == bindparam('_id')
+        ).values({column: bindparam(column) for column in self.SCRAPE_UPDATE_COLUMNS + ('updated_at',)})
+
+        try:
+            for start in range(0, len(usernames), self.UPSERT_CHUNK_SIZE):
+                chunk = usernames[start:start + self.UPSERT_CHUNK_SIZE]
+                existing = self._get_active_by_usernames(chunk)
+                now = datetime.now()
+
+                inserts, updates = [], []
+                for username in chunk:
+                    data = by_username[username]
+                    row = existing.get(username)
+                    if row is None:
+                        inserts.append(self._scrape_insert_values(data, now))
+                        continue
+
+                    stats['ids'][username] = row.id
+                    # 팔로워 수가 변경된 경우만 업데이트
+                    if row.followers != data.get('followers'):
+                        values = {column: data.get(column) for column in self.SCRAPE_UPDATE_COLUMNS}
+                        values.update({'_id': row.id, 'updated_at': now})
+                        updates.append(values)
+                    else:
+                        stats['skipped'] += 1
+
+                if inserts:
+                    self.session.execute(insert(TikTokUser.__table__), inserts)
+                    created = self._get_active_by_usernames([values['username'] for values in inserts])
+                    stats['ids'].update({username: row.id for username, row in created.items()})
+                    stats['created'] += len(inserts)
+                if updates:
+                    self.session.execute(update_stmt, updates)
+                    stats['updated'] += len(updates)
 
-            existing_user = self.get_by_username(username)
-
-            if existing_user:
-                # 팔로워 수가 변경된 경우만 업데이트
-                if existing_user.followers != data.get('followers'):
-                    self.update(existing_user.id, {
-                        'followers': data.get('followers'),
-                        'bio': data.get('bio'),
-                        'nickname': data.get('nickname'),
-                        'profile_image': data.get('profile_image'),
-                        'country': data.get('country'),
-                        'updated_at': datetime.now()
-                    })
-                    stats['updated'] += 1
-                else:
-                    stats['skipped'] += 1
-            else:
-                self.create(data)
-                stats['created'] += 1
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
 
         return stats
 
+    def _get_active_by_usernames(self, usernames: List[str]) -> Dict:
+        """username 목록을 IN 조회 한 번으로 가져옴 (같은 username 이 여럿이면 get_by_username 처럼 먼저 저장된 행)"""
+        rows = self.session.query(TikTokUser.id, TikTokUser.username, TikTokUser.followers).filter(
+            and_(
+                TikTokUser.username.in_(usernames),
+                TikTokUser.deleted_at.is_(None)
+            )
+        ).order_by(TikTokUser.id).all()
+
+        found = {}
+        for row in rows:
+            found.setdefault(row.username, row)
+        return found
+
+    @classmethod
+    def _scrape_insert_values(cls, data: Dict, now: datetime) -> Dict:
+        """from_scrape_data 와 같은 컬럼의 INSERT 값 (다중 행 INSERT 를 위해 모든 행이 같은 키를 가짐)"""
+        values = {column: data.get(column) for column in cls.SCRAPE_INSERT_COLUMNS}
+        values['created_at'] = values['updated_at'] = now
+        return values
+
     def get_by_keyword(self, keyword: str, min_followers: Optional[int] = None) -> List[TikTokUser]:
         """키워드로 사용자 목록 조회"""
         query = self.session.query(TikTokUser).filter(
@@ -326,8 +391,13 @@ class TikTokVideo(Base):
     """TikTok 비디오 정보 모델"""
     
     __tablename__ = 'tiktok_videos'
+    __table_args__ = (
+        # 일괄 upsert(ON DUPLICATE KEY UPDATE) 기준 키
+        UniqueConstraint('tiktok_user_id', 'video_url', name='tiktok_videos_tiktok_user_id_video_url_unique'),
+    )
     
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # SQLite(로컬 테스트)에서는 INTEGER PRIMARY KEY 여야 자동 증가
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
     tiktok_user_id = Column(BigInteger, nullable=False, comment='틱톡 사용자 ID')
     video_url = Column(String(255), nullable=False, comment='동영상 주소')
     title = Column(String(255), nullable=False, comment='제목')
@@ -369,6 +439,10 @@ class TikTokVideo(Base):
             title=data.get('alt', ''),
             thumbnail_url=data.get('src', ''),
             view_count=data.get('views', 0),
+            posted_at=data.get('posted_at'),
+            like_count=data.get('like_count', 0),
+            comment_count=data.get('comment_count', 0),
+            share_count=data.get('share_count', 0),
             created_at=datetime.now()  # 현재 시간으로 created_at 설정
         )
 
@@ -477,6 +551,7 @@ class TikTokBrandAccount(Base):
     bio = Column(Text, nullable=True, comment='계정 소개')
     is_verified = Column(Boolean, nullable=False, default=False, comment='공식 인증 여부')
     last_scraped_at = Column(TIMESTAMP, nullable=True, comment='마지막 스크랩 시간')
+    latest_repost_video_url = Column(String(255), nullable=True, comment='마지막 리포스트 수집 시 가장 최근 video_url (증분 수집 기준점)')
     repost_accounts = Column(JSON, nullable=True, comment='리포스트 계정 목록')
     status = Column(String(20), nullable=False, default='active', comment='계정 상태')
     memo = Column(String(255), nullable=True, comment='비고')
@@ -503,6 +578,7 @@ class TikTokBrandAccount(Base):
             'bio': self.bio,
             'is_verified': self.is_verified,
             'last_scraped_at': self.last_scraped_at.isoformat() if self.last_scraped_at else None,
+            'latest_repost_video_url': self.latest_repost_video_url,
             'repost_accounts': self.repost_accounts,
             'status': self.status,
             'memo': self.memo,
@@ -515,8 +591,15 @@ class TikTokRepostVideo(Base):
     """TikTok 리포스트 비디오 모델"""
     
     __tablename__ = 'tiktok_repost_videos'
-    
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    __table_args__ = (
+        # 일괄 upsert(ON DUPLICATE KEY UPDATE) 기준 키
+        UniqueConstraint('tiktok_brand_account_id', 'video_url', name='tiktok_repost_videos_tiktok_brand_account_id_video_url_unique'),
+        # 브랜드별 목록 (posted_at, id) 커서 페이지네이션
+        Index('tiktok_repost_videos_tiktok_brand_account_id_posted_at_index', 'tiktok_brand_account_id', 'posted_at'),
+    )
+    
+    # SQLite(로컬 테스트)에서는 INTEGER PRIMARY KEY 여야 자동 증가
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
     tiktok_brand_account_id = Column(BigInteger, nullable=False, comment='브랜드 계정 ID')
     video_url = Column(String(255), nullable=False, comment='동영상 주소')
     title = Column(String(255), nullable=False, comment='제목')
@@ -6,6 +6,9 @@ class ScrapeRequest(BaseModel):
     min_followers: Optional[int] = 10000
     tiktok_user_log_id: Optional[int] = None
     scrolls: Optional[int] = 9
+    max_users: Optional[int] = None  # 검색 카드를 이 개수만큼 확인하면 스크롤 종료
+    adaptive_scroll: Optional[bool] = False  # 조건 통과 비율(수율)이 낮아지면 scrolls 전에 종료
+    min_yield: Optional[float] = None  # 적응형 스크롤 수율 기준 (없으면 ADAPTIVE_SCROLL_MIN_YIELD 설정값)
 
 class TikTokLoginRequest(BaseModel):
     username: str
@@ -27,6 +30,10 @@ class ScrapeVideoRequest(BaseModel):
     use_session: Optional[bool] = True  # 세션 사용 여부
     session_file: Optional[str] = "tiktok_auth.json"  # 세션 파일 경로
     sender_id: Optional[int] = 0  # 비로그인 세션용 sender ID (기본값 0)
+    max_videos: Optional[int] = 20  # 브랜드 리포스트 수집 시 계정당 최대 비디오 수
+    deep_pagination: Optional[bool] = False  # 브랜드 리포스트를 스크롤로 계속 불러와 max_videos 또는 저장된 비디오까지 수집
+    concurrency: Optional[int] = 1  # 동시에 수집할 프로필(페이지) 수 (1 이면 순서대로 방문)
+    incremental: Optional[bool] = False  # 지난 수집 이후 새 비디오와 일부 최근 비디오(통계 갱신)만 처리
 
 class CollectRepostUsersRequest(BaseModel):
     limit: Optional[int] = 10  # 처리할 최대 비디오 수
@@ -0,0 +1,114 @@
+"""
+애플리케이션 공용 스레드 풀 모듈
+
+FastAPI 핸들러에서 동기(블로킹) 서비스 함수를 실행할 때 사용하는 단일 실행기
+- 요청마다 ThreadPoolExecutor 를 새로 만들고 닫지 않음
+- 서버 시작 시 생성, 종료 시 정리 (EXECUTOR_MAX_WORKERS 로 크기 설정)
+- 대기열 길이/실행 중 워커 수 등 지표를 stats() 로 제공
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+
+
+class BlockingExecutor:
+    """크기가 고정된 애플리케이션 범위 스레드 풀"""
+
+    def __init__(self, max_workers: int, name: str = "tiktok-worker"):
+        self.max_workers = max(1, max_workers)
+        self.name = name
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # 지표
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._peak_queued = 0
+        self._total_wait = 0.0
+
+    # === LIFECYCLE ===
+    def start(self):
+        """스레드 풀 생성 (이미 생성되어 있으면 무시)"""
+        with self._lock:
+            if self._executor:
+                return
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        print(f"🧰 공용 스레드 풀 시작 (워커 수: {self.max_workers})")
+
+    def shutdown(self, wait: bool = True):
+        """스레드 풀 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=wait)
+            print("🔚 공용 스레드 풀 종료")
+
+    # === RUN ===
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        동기 함수를 공용 스레드 풀에서 실행하고 결과를 await
+
+        Args:
+            func: 실행할 동기 함수
+            *args, **kwargs: 함수 인수
+
+        Returns:
+            함수 실행 결과
+        """
+        if not self._executor:
+            self.start()
+
+        with self._lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self._call, time.monotonic(), func, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    def stats(self) -> Dict:
+        """스레드 풀 지표 반환"""
+        with self._lock:
+            started = self._completed + self._failed + self._active
+            return {
+                "running": self._executor is not None,
+                "max_workers": self.max_workers,
+                "queued": self._queued,
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "peak_queued": self._peak_queued,
+                "avg_wait_ms": round(self._total_wait / started * 1000, 1) if started else 0.0
+            }
+
+    # === INTERNAL ===
+    def _call(self, submitted_at: float, func: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._total_wait += time.monotonic() - submitted_at
+
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+
+
+app_executor = BlockingExecutor(settings.EXECUTOR_MAX_WORKERS)
@@ -0,0 +1,131 @@
+"""
+TikTok 브라우저 전용 이벤트 루프 모듈
+
+모든 Playwright 작업을 하나의 장기 실행 이벤트 루프에서 처리하기 위한 전용 스레드
+- 호출마다 asyncio.run / new_event_loop / nest_asyncio 로 루프를 만들지 않음
+- 브라우저 풀이 이 루프에 바인딩되어 요청 간 브라우저를 공유
+- 동기 코드에서는 run(), FastAPI 핸들러에서는 await run_async() 로 사용
+"""
+
+import asyncio
+import sys
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+from app.services.browser_pool import browser_pool
+
+
+class BrowserLoopThread:
+    """Playwright 작업 전용 이벤트 루프 스레드"""
+
+    def __init__(self, name: str = "tiktok-browser-loop"):
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._start_lock = threading.Lock()
+
+    # === LIFECYCLE ===
+    def start(self):
+        """루프 스레드 시작 및 브라우저 풀 바인딩 (이미 실행 중이면 무시)"""
+        with self._start_lock:
+            if self.is_running:
+                return
+
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._run_forever, name=self.name, daemon=True)
+            self._thread.start()
+            self._ready.wait()
+
+            # 브라우저 풀을 이 루프에 바인딩
+            asyncio.run_coroutine_threadsafe(browser_pool.start(), self.loop).result()
+            print(f"🧵 브라우저 루프 스레드 시작: {self.name}")
+
+    def stop(self, timeout: float = 30):
+        """브라우저 풀 종료 후 루프 스레드 정지"""
+        with self._start_lock:
+            if not self.is_running:
+                return
+
+            try:
+                asyncio.run_coroutine_threadsafe(browser_pool.close(), self.loop).result(timeout)
+            except Exception as e:
+                print(f"⚠️ 브라우저 풀 종료 중 오류: {e}")
+
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+            self._thread = None
+            self.loop = None
+            print(f"🔚 브라우저 루프 스레드 종료: {self.name}")
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_loop_thread(self) -> bool:
+        """현재 스레드가 브라우저 루프 스레드인지 확인"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    # === SUBMIT / AWAIT ===
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        코루틴을 브라우저 루프에 제출
+
+        Args:
+            coro: 실행할 코루틴
+
+        Returns:
+            concurrent.futures.Future
+        """
+        if not self.is_running:
+            self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        코루틴을 브라우저 루프에서 실행하고 결과를 기다림 (동기 호출용)
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            코루틴 실행 결과
+        """
+        if self.is_loop_thread():
+            coro.close()
+            raise RuntimeError("브라우저 루프 스레드 안에서는 run()을 호출할 수 없습니다. await 를 사용하세요.")
+        return self.submit(coro).result(timeout)
+
+    async def run_async(self, coro: Coroutine) -> Any:
+        """
+        다른 이벤트 루프(FastAPI 등)에서 코루틴을 브라우저 루프로 넘기고 await
+
+        Args:
+            coro: 실행할 코루틴
+
+        Returns:
+            코루틴 실행 결과
+        """
+        if self.is_loop_thread():
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    # === INTERNAL ===
+    def _run_forever(self):
+        if sys.platform == "win32":
+            # Playwright 서브프로세스 실행을 위해 Windows 에서는 Proactor 루프 사용
+            self.loop = asyncio.ProactorEventLoop()
+        else:
+            self.loop = asyncio.new_event_loop()
+
+        asyncio.set_event_loop(self.loop)
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+
+browser_loop = BrowserLoopThread()
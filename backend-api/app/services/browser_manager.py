@@ -9,12 +9,19 @@ TikTok 브라우저 관리 모듈
 """
 
 import os
+import re
 import time
 import random
-from typing import Optional, Dict, Any
+import asyncio
+from typing import Optional, Dict, Any, List, Callable, Awaitable, AsyncIterator
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from playwright.sync_api import sync_playwright, Browser as SyncBrowser, BrowserContext as SyncBrowserContext, Page as SyncPage
 
+from app.core.config import settings
+from app.services.browser_pool import browser_pool, BrowserLease
+from app.services.rate_limiter import navigation_limiter
+from app.services.tiktok_utils import TikTokApiParser
+
 
 class TikTokBrowserConfig:
     """TikTok 브라우저 설정 상수"""
@@ -47,6 +54,35 @@ class TikTokBrowserConfig:
     TIKTOK_MAIN_URL = "https://www.tiktok.com/?lang=ko-KR"
     
     # 대기 시간 범위
+    # 패스키 설정 모달 및 닫기 버튼 (위에서부터 순서대로 시도)
+    PASSKEY_MODAL_SELECTOR = '[role="dialog"]'
+    PASSKEY_MODAL_TEXT = r"passkey|패스키"  # 자동 핸들러는 이 문구가 있는 모달만 닫음
+    PASSKEY_CLOSE_SELECTORS = [
+        '[role="dialog"] button[aria-label*="Close"]',
+        '[role="dialog"] button[aria-label*="close"]',
+        '[role="dialog"] svg[width="24"]',  # X 아이콘
+        '[role="dialog"] button:has-text("나중에")',
+        '[role="dialog"] button:has-text("Skip")',
+        '[role="dialog"] button:has-text("Not now")',
+        'button:has-text("건너뛰기")',
+        'button:has-text("Later")',
+        '[role="dialog"] [aria-label="Close"]',
+        '[role="dialog"] button[type="button"]'  # 가장 마지막 폴백
+    ]
+
+    # 리소스 차단 시 타입별 평균 응답 크기 추정치 (bytes, 절약량 통계용)
+    BLOCKED_RESOURCE_ESTIMATED_BYTES = {
+        "media": 1_500_000,
+        "image": 60_000,
+        "font": 40_000,
+        "stylesheet": 30_000
+    }
+
+    @staticmethod
+    def text_only_block_resources() -> List[str]:
+        """텍스트/URL 만 필요한 수집에서 차단할 리소스 타입 (BROWSER_TEXT_ONLY_BLOCK 설정)"""
+        return [t.strip() for t in settings.BROWSER_TEXT_ONLY_BLOCK.split(",") if t.strip()]
+
     WAIT_TIMES = {
         "page_load": (5000, 10000),
         "scroll": (1000, 3000),
@@ -54,33 +90,424 @@ class TikTokBrowserConfig:
         "interaction": (500, 1000)
     }
 
+    # 비디오 그리드 일괄 추출 스크립트 (컨테이너별 첫 번째 a 태그 기준)
+    VIDEO_GRID_SCRIPT = """
+    () => Array.from(document.querySelectorAll('[id^="column-item-video-container-"]'))
+        .map(container => {
+            const link = container.querySelector('a');
+            if (!link) return null;
+            const img = link.querySelector('picture img');
+            const views = link.querySelector('strong[data-e2e="video-views"]');
+            return {
+                link: link.getAttribute('href'),
+                alt: img ? img.getAttribute('alt') : null,
+                src: img ? img.getAttribute('src') : null,
+                views: views ? views.innerText : null
+            };
+        })
+        .filter(item => item !== null)
+    """
+
+    # 프로필 게시물/리포스트 그리드 일괄 추출 스크립트 (onlyNew 이면 이전 호출 이후 새로 나타난 항목만)
+    POST_ITEMS_SCRIPT = """
+    (onlyNew) => {
+        let items = Array.from(document.querySelectorAll('[data-e2e="user-post-item"]'))
+            .filter(item => {
+                const link = item.querySelector('a');
+                return link && link.getAttribute('href');
+            });
+
+        // 링크가 렌더링된 항목만 읽은 것으로 표시 (빈 자리표시자는 다음 호출에서 다시 확인)
+        if (onlyNew) {
+            items = items.filter(item => !item.hasAttribute('data-scrape-seen'));
+            items.forEach(item => item.setAttribute('data-scrape-seen', '1'));
+        }
+
+        return items.map(item => {
+            const img = item.querySelector('img');
+            const views = item.querySelector('[data-e2e="video-views"]');
+            const repostInfo = item.querySelector('[data-e2e="repost-info"], .repost-info');
+            const originalUser = repostInfo ? repostInfo.querySelector('a') : null;
+            return {
+                link: item.querySelector('a').getAttribute('href'),
+                alt: img ? img.getAttribute('alt') : null,
+                src: img ? img.getAttribute('src') : null,
+                views: views ? views.innerText : null,
+                original_user: originalUser ? originalUser.innerText : null
+            };
+        });
+    }
+    """
+
+    # 응답 캡처 대상 데이터 API (URL 경로 → 응답 종류)
+    CAPTURE_ENDPOINTS = {
+        "/api/post/item_list": "item_list",
+        "/api/repost/item_list": "item_list",
+        "/api/user/detail": "user_detail",
+        "/api/search/user/full": "search_user"
+    }
+
+    # 커서(cursor/hasMore) 를 추적할 목록 API
+    CURSOR_LIST_ENDPOINTS = ("/api/post/item_list", "/api/repost/item_list")
+
+    # 프로필 HTML 에 포함된 하이드레이션 JSON 스크립트 태그 (앞에서부터 우선)
+    HYDRATION_SCRIPT_SELECTORS = [
+        'script#__UNIVERSAL_DATA_FOR_REHYDRATION__',
+        'script#SIGI_STATE'
+    ]
+
+    # 검색 결과 사용자 카드 셀렉터 (앞에서부터 결과가 있는 첫 번째 셀렉터 사용)
+    SEARCH_USER_CONTAINER_SELECTORS = [
+        'div[data-e2e="search-user-container"]',
+        'div[data-e2e="search-user-item"]',
+        'div[class*="UserItemContainer"]',
+        'a[href*="/@"][class*="StyledLink"]'
+    ]
+
+    # 검색 결과 사용자 카드 공통 JS 함수 (필드별 대체 셀렉터 체인)
+    # Playwright 전용 :has-text() 는 DOM 에서 쓸 수 없으므로 텍스트 포함 여부로 직접 비교
+    SEARCH_USER_CARD_HELPERS = """
+        const first = (root, selectors) => {
+            for (const selector of selectors) {
+                const el = root.querySelector(selector);
+                if (el) return el;
+            }
+            return null;
+        };
+        const firstWithText = (root, tags, needle) =>
+            Array.from(root.querySelectorAll(tags)).find(el => (el.innerText || '').includes(needle)) || null;
+        const text = el => el ? el.innerText : null;
+    """
+
+    # 1단계: 카드별 사용자명/팔로워 수만 추출하고 2단계에서 다시 찾을 수 있도록 data-scrape-id 부여
+    SEARCH_USER_SUMMARY_SCRIPT = """
+    ([containerSelectors, onlyNew]) => {
+    """ + SEARCH_USER_CARD_HELPERS + """
+        let cards = [];
+        let selector = null;
+        for (const candidate of containerSelectors) {
+            cards = Array.from(document.querySelectorAll(candidate));
+            if (cards.length > 0) {
+                selector = candidate;
+                break;
+            }
+        }
+
+        // 증분 수집: 이전 호출에서 읽은 카드는 건너뛰고 새 카드에 표시
+        if (onlyNew) {
+            cards = cards.filter(card => !card.hasAttribute('data-scrape-seen'));
+            cards.forEach(card => card.setAttribute('data-scrape-seen', '1'));
+        }
+
+        return {
+            selector: selector,
+            cards: cards.map(card => {
+                if (!card.hasAttribute('data-scrape-id')) {
+                    window.__scrapeCardSeq = (window.__scrapeCardSeq || 0) + 1;
+                    card.setAttribute('data-scrape-id', String(window.__scrapeCardSeq));
+                }
+                const usernameEl = first(card, [
+                    'p[data-e2e="search-user-unique-id"]',
+                    'h3[data-e2e="search-user-unique-id"]'
+                ]) || firstWithText(card, 'p, span', '@');
+                const followersEl = first(card, [
+                    'span[data-e2e="search-follow-count"]',
+                    'strong[data-e2e="search-follow-count"]',
+                    'strong[data-e2e="search-user-count"]',
+                    'span[data-e2e="search-user-count"]'
+                ]) || firstWithText(card, 'span, strong', '팔로워');
+
+                return {
+                    id: card.getAttribute('data-scrape-id'),
+                    username: text(usernameEl),
+                    followers: text(followersEl)
+                };
+            })
+        };
+    }
+    """
+
+    # 2단계: 기준을 통과한 카드(data-scrape-id)의 나머지 필드와 프로필 이미지 추출
+    SEARCH_USER_DETAILS_SCRIPT = """
+    (ids) => {
+    """ + SEARCH_USER_CARD_HELPERS + """
+        const details = {};
+        for (const id of ids) {
+            const card = document.querySelector(`[data-scrape-id="${id}"]`);
+            if (!card) continue;
+            const nicknameEl = first(card, [
+                'p[data-e2e="search-user-nickname"]',
+                'h4[data-e2e="search-user-nickname"]'
+            ]);
+            const bioEl = first(card, ['[data-e2e="search-user-desc"]', 'span[class*="SpanText"]']);
+            const linkEl = first(card, ['a[data-e2e="search-user-container"]', 'a[href*="/@"]']);
+            const avatarBox = card.querySelector('[data-e2e="search-user-avatar"]');
+            const avatarEl = avatarBox
+                ? avatarBox.querySelector('img')
+                : first(card, ['img[data-e2e="search-user-avatar"]', 'img[class*="Avatar"]']);
+
+            details[id] = {
+                nickname: text(nicknameEl),
+                bio: text(bioEl),
+                href: linkEl ? linkEl.getAttribute('href') : null,
+                profile_image_url: avatarEl ? avatarEl.getAttribute('src') : null
+            };
+        }
+        return details;
+    }
+    """
+
+
+class NetworkActivityTracker:
+    """페이지의 진행 중인 네트워크 요청 추적 (네트워크 유휴 대기용)
+
+    동영상 스트림/웹소켓처럼 끝나지 않는 요청은 유휴 판정에서 제외합니다.
+    """
+
+    IGNORED_RESOURCE_TYPES = ("media", "websocket", "eventsource")
+
+    def __init__(self):
+        self.inflight = 0
+        self.last_activity = time.monotonic()
+
+    def attach(self, page: Page):
+        page.on("request", self._on_request_started)
+        page.on("requestfinished", self._on_request_done)
+        page.on("requestfailed", self._on_request_done)
+
+    async def wait_for_idle(self, idle_ms: int, timeout_ms: int, max_inflight: int = 0) -> bool:
+        """
+        진행 중인 요청 수가 max_inflight 이하인 상태가 idle_ms 동안 유지될 때까지 대기
+
+        Returns:
+            유휴 상태 도달 여부 (timeout 시 False)
+        """
+        deadline = time.monotonic() + timeout_ms / 1000
+        while time.monotonic() < deadline:
+            idle_for = (time.monotonic() - self.last_activity) * 1000
+            if self.inflight <= max_inflight and idle_for >= idle_ms:
+                return True
+            await asyncio.sleep(0.05)
+        return False
+
+    def _on_request_started(self, request):
+        if request.resource_type in self.IGNORED_RESOURCE_TYPES:
+            return
+        self.inflight += 1
+        self.last_activity = time.monotonic()
+
+    def _on_request_done(self, request):
+        if request.resource_type in self.IGNORED_RESOURCE_TYPES:
+            return
+        self.inflight = max(0, self.inflight - 1)
+        self.last_activity = time.monotonic()
+
+
+class ResourceBlocker:
+    """컨텍스트의 요청 중 지정한 리소스 타입을 중단(abort)하고 차단 통계를 기록"""
+
+    def __init__(self, resource_types: List[str]):
+        self.resource_types = set(resource_types)
+        self.blocked_by_type: Dict[str, int] = {}
+
+    async def attach(self, context: BrowserContext):
+        await context.route("**/*", self._handle_route)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        차단한 요청 수와 추정 절약 bytes
+
+        차단한 요청은 응답을 받지 않으므로 실제 크기를 알 수 없어, 절약량은 타입별 평균 크기
+        (BLOCKED_RESOURCE_ESTIMATED_BYTES) 로 계산한 추정치입니다.
+        """
+        estimated = sum(
+            count * TikTokBrowserConfig.BLOCKED_RESOURCE_ESTIMATED_BYTES.get(resource_type, 0)
+            for resource_type, count in self.blocked_by_type.items()
+        )
+        return {
+            "blocked_types": sorted(self.resource_types),
+            "blocked_requests": sum(self.blocked_by_type.values()),
+            "blocked_by_type": dict(self.blocked_by_type),
+            "estimated_bytes_saved": estimated
+        }
+
+    async def _handle_route(self, route):
+        resource_type = route.request.resource_type
+        try:
+            if resource_type in self.resource_types:
+                self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+                await route.abort("blockedbyclient")
+            else:
+                await route.continue_()
+        except Exception:
+            # 페이지가 이미 닫힌 경우 등은 무시
+            pass
+
+
+class ResponseCapture:
+    """페이지가 받는 TikTok 데이터 API 응답 수집기
+
+    page.on("response") 로 CAPTURE_ENDPOINTS 응답을 가로채 JSON 을 파싱하고
+    비디오 ID / 사용자명 기준으로 보관합니다.
+    """
+
+    def __init__(self):
+        self.videos: Dict[str, Dict] = {}
+        self.users: Dict[str, Dict] = {}
+        self.captured_responses = 0
+        self._tasks: set = set()
+
+    def attach(self, page: Page):
+        """페이지에 응답 리스너 등록"""
+        page.on("response", self._on_response)
+
+    def get_video(self, video_id: Optional[str]) -> Optional[Dict]:
+        return self.videos.get(video_id) if video_id else None
+
+    def get_user(self, username: Optional[str]) -> Optional[Dict]:
+        return self.users.get(username) if username else None
+
+    async def drain(self, timeout: float = 5):
+        """처리 중인 응답 파싱이 끝날 때까지 대기"""
+        if self._tasks:
+            await asyncio.wait(list(self._tasks), timeout=timeout)
+
+    def _on_response(self, response):
+        kind = next(
+            (kind for path, kind in TikTokBrowserConfig.CAPTURE_ENDPOINTS.items() if path in response.url),
+            None
+        )
+        if not kind:
+            return
+
+        task = asyncio.ensure_future(self._consume(kind, response))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _consume(self, kind: str, response):
+        try:
+            payload = await response.json()
+        except Exception:
+            # 본문이 없거나 JSON 이 아닌 응답 (프리플라이트, 리다이렉트 등)
+            return
+
+        self.captured_responses += 1
+        if kind == "item_list":
+            for video in TikTokApiParser.parse_item_list(payload):
+                self.videos[video['video_id']] = video
+        elif kind == "user_detail":
+            user = TikTokApiParser.parse_user_detail(payload)
+            if user:
+                self.users[user['username']] = user
+        elif kind == "search_user":
+            for user in TikTokApiParser.parse_search_users(payload):
+                self.users[user['username']] = user
+
+
+class ListCursorTracker:
+    """목록 API(item_list) 응답의 커서/hasMore 추적
+
+    무한 스크롤이 다음 페이지를 요청할 때마다 마지막 커서와 남은 페이지 여부를 기록해
+    더 불러올 항목이 없는지(hasMore=false) 판단할 수 있게 합니다.
+    """
+
+    def __init__(self):
+        self.lists: Dict[str, Dict] = {}
+        self._tasks: set = set()
+
+    def attach(self, page: Page):
+        """페이지에 응답 리스너 등록"""
+        page.on("response", self._on_response)
+
+    def reset(self):
+        """다른 프로필로 이동하기 전 기록 초기화"""
+        self.lists.clear()
+
+    def get(self, path: str) -> Optional[Dict]:
+        """{cursor, has_more, pages} (아직 응답이 없으면 None)"""
+        return self.lists.get(path)
+
+    def has_more(self, path: str) -> Optional[bool]:
+        """다음 페이지 존재 여부 (아직 응답이 없으면 None)"""
+        state = self.lists.get(path)
+        return state["has_more"] if state else None
+
+    def _on_response(self, response):
+        path = next((path for path in TikTokBrowserConfig.CURSOR_LIST_ENDPOINTS if path in response.url), None)
+        if not path:
+            return
+
+        task = asyncio.ensure_future(self._consume(path, response))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _consume(self, path: str, response):
+        try:
+            payload = await response.json()
+        except Exception:
+            return
+
+        cursor = TikTokApiParser.parse_list_cursor(payload)
+        if not cursor:
+            return
+        state = self.lists.setdefault(path, {"pages": 0})
+        state.update(cursor)
+        state["pages"] += 1
+
 
 class AsyncBrowserManager:
-    """비동기 브라우저 관리 클래스"""
-    
+    """비동기 브라우저 관리 클래스
+
+    브라우저 풀이 현재 이벤트 루프에서 실행 중이면 풀에서 브라우저를 대여하고
+    작업 전용 BrowserContext 만 생성합니다. 그 외에는 직접 브라우저를 실행합니다.
+    """
+
     def __init__(self):
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-    
+        self.lease: Optional[BrowserLease] = None
+        self.failed = False
+        self.capture: Optional[ResponseCapture] = None
+        self.network: Optional[NetworkActivityTracker] = None
+        self.list_cursors: Optional[ListCursorTracker] = None
+        self.blocker: Optional[ResourceBlocker] = None
+        self.last_scroll_stats: Optional[Dict[str, Any]] = None
+
     async def __aenter__(self):
         """컨텍스트 매니저 진입"""
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """컨텍스트 매니저 종료"""
+        if exc_type is not None:
+            self.failed = True
         await self.close()
-    
-    async def initialize(self, headless: bool = False, session_file: Optional[str] = None, user_agent: Optional[str] = None):
-        """브라우저 초기화"""
-        self.playwright = await async_playwright().start()
 
-        # 브라우저 실행
-        self.browser = await self.playwright.chromium.launch(
-            headless=headless,
-            args=TikTokBrowserConfig.BROWSER_ARGS
-        )
+    def mark_failed(self):
+        """작업 실패 표시 (반납 시 풀 브라우저 재기동)"""
+        self.failed = True
+
+    async def initialize(self, headless: bool = False, session_file: Optional[str] = None, user_agent: Optional[str] = None, use_pool: bool = True, capture_responses: Optional[bool] = None, block_resources: Optional[List[str]] = None):
+        """브라우저 초기화
+
+        Args:
+            capture_responses: 데이터 API 응답 캡처 사용 여부 (None 이면 BROWSER_CAPTURE_RESPONSES 설정값)
+            block_resources: 중단할 리소스 타입 목록 (예: ["media", "font", "image"], 없으면 차단 안 함)
+        """
+        if use_pool and browser_pool.owns_running_loop():
+            # 풀에서 브라우저 대여 (컨텍스트만 새로 생성)
+            self.lease = await browser_pool.acquire(headless=headless)
+            self.browser = self.lease.browser
+        else:
+            self.playwright = await async_playwright().start()
+
+            # 브라우저 실행
+            self.browser = await self.playwright.chromium.launch(
+                headless=headless,
+                args=TikTokBrowserConfig.BROWSER_ARGS
+            )
 
         # 컨텍스트 생성
         context_config = TikTokBrowserConfig.CONTEXT_CONFIG.copy()
@@ -93,27 +520,51 @@ class AsyncBrowserManager:
             context_config["storage_state"] = session_file
 
         self.context = await self.browser.new_context(**context_config)
+
+        # 불필요한 리소스(동영상 스트림/폰트/이미지 등) 요청 차단
+        if block_resources:
+            self.blocker = ResourceBlocker(block_resources)
+            await self.blocker.attach(self.context)
         
         # 페이지 생성
         self.page = await self.context.new_page()
 
+        # 패스키 설정 모달은 나타날 때만 자동으로 닫기
+        await self.register_passkey_modal_handler()
+
+        # 네트워크 유휴 대기를 위한 요청 추적
+        self.network = NetworkActivityTracker()
+        self.network.attach(self.page)
+
+        # 무한 스크롤 목록의 다음 페이지 존재 여부 추적
+        self.list_cursors = ListCursorTracker()
+        self.list_cursors.attach(self.page)
+
+        # 데이터 API 응답 캡처 (정확한 조회수/좋아요/게시일 등)
+        if settings.BROWSER_CAPTURE_RESPONSES if capture_responses is None else capture_responses:
+            self.capture = ResponseCapture()
+            self.capture.attach(self.page)
+
         # 봇 탐지 회피 스크립트는 오히려 캡챠를 유발하므로 사용하지 않음
         # TikTok은 스크립트 injection을 감지하는 것으로 보임
 
-        print(f"✅ 브라우저 초기화 완료 (세션: {'사용' if session_file else '미사용'})")
+        print(f"✅ 브라우저 초기화 완료 (세션: {'사용' if session_file else '미사용'}, 풀: {'사용' if self.lease else '미사용'}, 차단: {','.join(block_resources) if block_resources else '없음'})")
     
+    async def goto(self, url: str, **kwargs):
+        """페이지 이동 (모든 이동은 공유 속도 제한 navigation_limiter 를 거침)"""
+        waited = await navigation_limiter.acquire()
+        if waited >= 1:
+            print(f"🚦 페이지 이동 속도 제한으로 {waited:.1f}초 대기")
+        return await self.page.goto(url, **kwargs)
+
     async def navigate_to_main_page(self):
         """TikTok 메인 페이지로 이동"""
         if not self.page:
             raise RuntimeError("브라우저가 초기화되지 않았습니다.")
 
         print("🏠 TikTok 메인 페이지로 이동...")
-        await self.page.goto(TikTokBrowserConfig.TIKTOK_MAIN_URL, wait_until="load")
-        await self.page.wait_for_timeout(random.uniform(*TikTokBrowserConfig.WAIT_TIMES["page_load"]))
-
-        # 패스키 모달 처리
-        await self.page.wait_for_timeout(2000)  # 모달이 나타날 시간을 주기 위해 짧은 대기
-        await self.handle_passkey_modal()
+        await self.goto(TikTokBrowserConfig.TIKTOK_MAIN_URL, wait_until="load")
+        await self.wait_for_network_idle()
 
         # 사람처럼 스크롤 시뮬레이션
         await self.simulate_human_behavior()
@@ -135,9 +586,170 @@ class AsyncBrowserManager:
             print(f"→ 스크롤 {i+1}/{scrolls} (딜레이 {delay:.1f}s)")
             await self.page.wait_for_timeout(delay * 1000)
     
+    async def iter_scroll_items(
+        self,
+        extract: Callable[[], Awaitable[Optional[List[Dict]]]],
+        key: Callable[[Dict], Optional[str]],
+        max_scrolls: int = 5,
+        idle_scrolls: Optional[int] = None,
+        target_count: Optional[int] = None,
+        jitter_range: tuple = (0.5, 1.5),
+        on_round_end: Optional[Callable[[int], bool]] = None,
+        has_more: Optional[Callable[[], Optional[bool]]] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        무한 스크롤 목록을 스크롤하면서 새로 나타난 항목만 순서대로 yield
+
+        스크롤마다 extract() 로 새 항목을 읽고 key 로 중복을 제거합니다.
+        새 항목이 idle_scrolls 번 연속 없거나, target_count 에 도달하거나,
+        max_scrolls 를 모두 사용하면 멈춥니다. 종료 정보는 last_scroll_stats 에 기록됩니다.
+
+        Args:
+            extract: 새 항목 리스트를 반환하는 함수 (None 이면 추출 불가로 보고 종료)
+            key: 항목의 고유 키 (href, username 등)
+            max_scrolls: 최대 스크롤 횟수
+            idle_scrolls: 새 항목 없이 허용할 연속 스크롤 수 (None 이면 SCROLL_IDLE_LIMIT 설정값)
+            target_count: 이 개수만큼 모이면 종료
+            jitter_range: 스크롤 후 네트워크 유휴 대기에 더하는 랜덤 딜레이 범위 (초)
+            on_round_end: 한 번의 추출분을 모두 yield 한 뒤 새 항목 수를 받아 호출 (False 반환 시 종료)
+            has_more: 목록 API 의 다음 페이지 존재 여부 (False 인데 새 항목이 없으면 idle 을 기다리지 않고 종료)
+        """
+        idle_scrolls = settings.SCROLL_IDLE_LIMIT if idle_scrolls is None else idle_scrolls
+        seen = set()
+        new_per_scroll: List[int] = []
+        stats = {"scrolls": 0, "items": 0, "stop_reason": "max_scrolls", "new_per_scroll": new_per_scroll}
+        self.last_scroll_stats = stats
+        idle = 0
+
+        if not self.page:
+            stats["stop_reason"] = "no_page"
+            return
+
+        while True:
+            items = await extract()
+            if items is None:
+                stats["stop_reason"] = "extract_failed"
+                return
+
+            new_count = 0
+            for item in items:
+                item_key = key(item)
+                if not item_key or item_key in seen:
+                    continue
+                seen.add(item_key)
+                new_count += 1
+                stats["items"] = len(seen)
+                yield item
+
+                if target_count and len(seen) >= target_count:
+                    new_per_scroll.append(new_count)
+                    if on_round_end:
+                        on_round_end(new_count)
+                    stats["stop_reason"] = "target_reached"
+                    print(f"🎯 목표 {target_count}개 도달, 스크롤 종료")
+                    return
+
+            new_per_scroll.append(new_count)
+            idle = idle + 1 if new_count == 0 else 0
+            print(f"→ 스크롤 {stats['scrolls']}/{max_scrolls}: 신규 {new_count}개 (누적 {len(seen)}개)")
+            keep_going = on_round_end(new_count) if on_round_end else True
+
+            if idle >= idle_scrolls:
+                stats["stop_reason"] = "idle"
+                print(f"⏹️ {idle}회 연속 새 항목 없음, 스크롤 종료")
+                return
+            if new_count == 0 and has_more and has_more() is False:
+                stats["stop_reason"] = "end_of_list"
+                print("⏹️ 목록의 마지막 페이지까지 불러옴, 스크롤 종료")
+                return
+            if keep_going is False:
+                stats["stop_reason"] = "caller"
+                return
+            if stats["scrolls"] >= max_scrolls:
+                return
+
+            # 다음 페이지 로드: 스크롤 후 추가 요청이 끝날 때까지 대기
+            await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
+            stats["scrolls"] += 1
+            await self.wait_for_network_idle()
+            await self.page.wait_for_timeout(random.uniform(*jitter_range) * 1000)
+
+    async def iter_search_user_cards(self, max_scrolls: int = 5, idle_scrolls: Optional[int] = None, target_count: Optional[int] = None, on_round_end: Optional[Callable[[int], bool]] = None, qualify: Optional[Callable[[Dict], Awaitable[bool]]] = None) -> AsyncIterator[Dict]:
+        """
+        검색 결과 사용자 카드를 스크롤하면서 새 카드만 yield (id/username 기준 중복 제거)
+
+        qualify 를 주면 extract_search_user_cards 와 같이 통과한 카드만 나머지 필드를 채웁니다.
+
+        일괄 추출 스크립트가 실패하면 아무것도 yield 하지 않고
+        last_scroll_stats["stop_reason"] 이 "extract_failed" 가 됩니다.
+        """
+        selector_logged = False
+
+        async def extract() -> Optional[List[Dict]]:
+            nonlocal selector_logged
+            batch = await self.extract_search_user_cards(only_new=True, qualify=qualify)
+            if batch is None:
+                return None
+            if not selector_logged and batch['selector'] and batch['selector'] != TikTokBrowserConfig.SEARCH_USER_CONTAINER_SELECTORS[0]:
+                print(f"⚠️ search-user-container를 찾을 수 없음. 대체 셀렉터 사용: {batch['selector']}")
+                selector_logged = True
+            return batch['cards']
+
+        async for card in self.iter_scroll_items(
+            extract,
+            key=lambda card: card.get('username') or card.get('id'),
+            max_scrolls=max_scrolls,
+            idle_scrolls=idle_scrolls,
+            target_count=target_count,
+            on_round_end=on_round_end
+        ):
+            yield card
+
+    async def iter_post_items(self, list_path: str = "/api/repost/item_list", max_scrolls: int = 5, target_count: Optional[int] = None) -> AsyncIterator[Dict]:
+        """
+        프로필 게시물/리포스트 그리드를 계속 불러오면서 새 항목만 yield (href 기준 중복 제거)
+
+        list_path 목록 API 가 hasMore=false 를 돌려주면 마지막 페이지로 보고 멈춥니다.
+        """
+        async def extract() -> Optional[List[Dict]]:
+            return await self.extract_post_items(only_new=True)
+
+        async for item in self.iter_scroll_items(
+            extract,
+            key=lambda item: item.get('link'),
+            max_scrolls=max_scrolls,
+            target_count=target_count,
+            has_more=lambda: self.list_cursors.has_more(list_path) if self.list_cursors else None
+        ):
+            yield item
+
+    async def register_passkey_modal_handler(self) -> None:
+        """
+        패스키 설정 모달 자동 닫기 핸들러 등록 (페이지당 1회)
+
+        Playwright 가 클릭/입력 등 동작 전에 모달이 보이면 그때만 닫기를 실행하므로
+        탐색마다 고정 대기 후 모달을 찾는 과정이 필요 없습니다.
+        """
+        if not self.page:
+            return
+
+        try:
+            # 다른 다이얼로그(DM 등)는 건드리지 않도록 패스키 문구가 있는 모달로 한정
+            passkey_modal = self.page.locator(TikTokBrowserConfig.PASSKEY_MODAL_SELECTOR).filter(
+                has_text=re.compile(TikTokBrowserConfig.PASSKEY_MODAL_TEXT, re.IGNORECASE)
+            )
+            await self.page.add_locator_handler(
+                passkey_modal,
+                self._dismiss_passkey_modal,
+                no_wait_after=True
+            )
+        except Exception as e:
+            # 구버전 Playwright 등으로 등록 실패 시 handle_passkey_modal() 수동 호출로 대체
+            print(f"⚠️ 패스키 모달 핸들러 등록 실패 (무시): {e}")
+
     async def handle_passkey_modal(self) -> bool:
         """
-        패스키 설정 모달을 감지하고 닫기
+        패스키 설정 모달이 지금 떠 있으면 닫기 (대기 없이 즉시 확인)
 
         Returns:
             bool: 모달을 처리했으면 True, 모달이 없었으면 False
@@ -146,54 +758,32 @@ class AsyncBrowserManager:
             return False
 
         try:
-            # 패스키 설정 모달이 나타나면 닫기
-            passkey_modal = await self.page.query_selector('[role="dialog"]')
-            if passkey_modal:
-                # 닫기 버튼 찾기 - 다양한 셀렉터 시도
-                close_button = None
-
-                # X 버튼 또는 Close 버튼 찾기
-                selectors = [
-                    '[role="dialog"] button[aria-label*="Close"]',
-                    '[role="dialog"] button[aria-label*="close"]',
-                    '[role="dialog"] svg[width="24"]',  # X 아이콘
-                    '[role="dialog"] button:has-text("나중에")',
-                    '[role="dialog"] button:has-text("Skip")',
-                    '[role="dialog"] button:has-text("Not now")',
-                    'button:has-text("건너뛰기")',
-                    'button:has-text("Later")',
-                    '[role="dialog"] [aria-label="Close"]',
-                    '[role="dialog"] button[type="button"]'  # 가장 마지막 폴백
-                ]
-
-                for selector in selectors:
-                    try:
-                        close_button = await self.page.query_selector(selector)
-                        if close_button:
-                            # 버튼이 클릭 가능한지 확인
-                            is_visible = await close_button.is_visible()
-                            if is_visible:
-                                await close_button.click()
-                                print("✅ 패스키 설정 모달을 닫았습니다")
-                                await self.page.wait_for_timeout(1000)
-                                return True
-                    except:
-                        continue
-
-                if not close_button:
-                    # ESC 키로 모달 닫기 시도
-                    await self.page.keyboard.press('Escape')
-                    print("ℹ️ ESC 키로 모달 닫기 시도")
-                    await self.page.wait_for_timeout(1000)
-                    return True
-
-            return False
+            if not await self.page.locator(TikTokBrowserConfig.PASSKEY_MODAL_SELECTOR).first.is_visible():
+                return False
+            return await self._dismiss_passkey_modal()
 
         except Exception as e:
             # 모달 처리 실패해도 계속 진행
             print(f"⚠️ 패스키 모달 처리 중 오류 (무시): {e}")
             return False
 
+    async def _dismiss_passkey_modal(self) -> bool:
+        """표시된 패스키 모달의 닫기 버튼 클릭 (없으면 ESC)"""
+        for selector in TikTokBrowserConfig.PASSKEY_CLOSE_SELECTORS:
+            try:
+                close_button = self.page.locator(selector).first
+                if await close_button.is_visible():
+                    await close_button.click(timeout=2000)
+                    print("✅ 패스키 설정 모달을 닫았습니다")
+                    return True
+            except Exception:
+                continue
+
+        # ESC 키로 모달 닫기 시도
+        await self.page.keyboard.press('Escape')
+        print("ℹ️ ESC 키로 모달 닫기 시도")
+        return True
+
     async def simulate_human_behavior(self):
         """사람처럼 행동 시뮬레이션"""
         if not self.page:
@@ -214,8 +804,7 @@ class AsyncBrowserManager:
             profile_url = f"https://www.tiktok.com/@{username}"
             print(f"사용자 프로필로 이동: {profile_url}")
 
-            await self.page.goto(profile_url, wait_until="networkidle", timeout=60000)
-            await self.page.wait_for_timeout(random.uniform(*TikTokBrowserConfig.WAIT_TIMES["page_load"]))
+            await self.goto(profile_url, wait_until="networkidle", timeout=60000)
             
             # CAPTCHA 확인
             if await self.is_captcha_present():
@@ -261,7 +850,7 @@ class AsyncBrowserManager:
             print(f"    생성된 메시지: {message[:50]}..." if len(message) > 50 else f"    생성된 메시지: {message}")
             
             # 프로필 페이지로 이동
-            await self.page.goto(profile_url, wait_until="networkidle", timeout=60000)
+            await self.goto(profile_url, wait_until="networkidle", timeout=60000)
             await self.page.wait_for_timeout(random.uniform(5000, 10000))
             
             # CAPTCHA 감지
@@ -435,19 +1024,125 @@ class AsyncBrowserManager:
             return
         
         search_url = f"https://www.tiktok.com/search/user?q={keyword}"
-        await self.page.goto(search_url, wait_until="load")
-        await self.page.wait_for_timeout(5000)
+        await self.goto(search_url, wait_until="load")
+        await self.wait_for_search_results()
+
+    async def wait_for_search_results(self) -> bool:
+        """검색 결과 사용자 카드가 나타나고 네트워크가 잠잠해질 때까지 대기"""
+        return await self.wait_for_ready(
+            selector=", ".join(TikTokBrowserConfig.SEARCH_USER_CONTAINER_SELECTORS)
+        )
     
     async def wait_for_video_containers(self, timeout: int = 10000):
-        """비디오 컨테이너 로딩 대기"""
+        """비디오 컨테이너 로딩 대기 (컨테이너 표시 후 네트워크 유휴까지)"""
         if not self.page:
             return
-        
-        try:
-            await self.page.wait_for_selector('[id^="column-item-video-container-"]', timeout=timeout)
-            await self.page.wait_for_timeout(random.uniform(3000, 5000))
-        except:
+
+        if not await self.wait_for_ready(selector='[id^="column-item-video-container-"]', timeout=timeout):
             print("⚠️ 비디오 컨테이너를 찾는 중 타임아웃. 계속 진행합니다...")
+
+    # === WAIT STRATEGY ===
+    async def wait_for_selector_ready(self, selector: str, timeout: Optional[int] = None, state: str = "attached") -> bool:
+        """
+        셀렉터가 나타날 때까지 대기
+
+        Returns:
+            timeout 안에 나타났으면 True
+        """
+        if not self.page:
+            return False
+
+        try:
+            await self.page.wait_for_selector(selector, state=state, timeout=timeout or settings.WAIT_TIMEOUT_MS)
+            return True
+        except Exception:
+            return False
+
+    async def wait_for_network_idle(self, idle_ms: Optional[int] = None, timeout: Optional[int] = None) -> bool:
+        """
+        진행 중인 요청이 없는 상태가 idle_ms 동안 유지될 때까지 대기
+
+        Returns:
+            timeout 안에 유휴 상태가 되었으면 True
+        """
+        if not self.page:
+            return False
+
+        idle_ms = settings.NETWORK_IDLE_MS if idle_ms is None else idle_ms
+        timeout = timeout or settings.WAIT_TIMEOUT_MS
+
+        if self.network:
+            return await self.network.wait_for_idle(idle_ms, timeout, settings.NETWORK_IDLE_MAX_INFLIGHT)
+
+        # 추적기가 없는 페이지는 Playwright 기본 networkidle 상태로 대체
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    async def wait_for_response(self, url_part: str, action: Optional[Callable[[], Awaitable]] = None, timeout: Optional[int] = None) -> bool:
+        """
+        URL 에 url_part 가 포함된 응답을 받을 때까지 대기
+
+        Args:
+            url_part: 기다릴 응답 URL 일부 (예: "/api/repost/item_list")
+            action: 응답을 유발하는 동작 (대기 등록 후 실행, 동작의 예외는 그대로 전달)
+            timeout: 최대 대기 시간 (ms)
+
+        Returns:
+            timeout 안에 응답을 받았으면 True
+        """
+        if not self.page:
+            return False
+
+        waiter = asyncio.ensure_future(self.page.wait_for_event(
+            "response",
+            predicate=lambda response: url_part in response.url,
+            timeout=timeout or settings.WAIT_TIMEOUT_MS
+        ))
+        try:
+            if action:
+                await action()
+        except Exception:
+            waiter.cancel()
+            raise
+
+        try:
+            await waiter
+            return True
+        except Exception:
+            return False
+
+    async def wait_for_ready(self, selector: Optional[str] = None, network_idle: bool = True, timeout: Optional[int] = None) -> bool:
+        """
+        페이지 준비 대기: 셀렉터 표시 → 네트워크 유휴 순서로 조건 확인
+
+        Returns:
+            셀렉터 조건을 만족했으면 True (셀렉터가 없으면 네트워크 유휴 결과)
+        """
+        ready = True
+        if selector:
+            ready = await self.wait_for_selector_ready(selector, timeout=timeout)
+        if network_idle:
+            idle = await self.wait_for_network_idle(timeout=timeout)
+            if not selector:
+                ready = idle
+        return ready
+
+    async def politeness_delay(self, reason: str = "다음 요청") -> float:
+        """
+        연속 방문 사이의 의도적인 간격 (POLITENESS_DELAY_MIN~MAX 초)
+
+        Returns:
+            실제 대기한 시간 (초)
+        """
+        delay = random.uniform(settings.POLITENESS_DELAY_MIN, settings.POLITENESS_DELAY_MAX)
+        if delay <= 0:
+            return 0.0
+        print(f"⏳ {reason} 전 {delay:.1f}초 대기...")
+        await asyncio.sleep(delay)
+        return delay
     
     async def get_video_containers(self):
         """비디오 컨테이너 요소들 조회"""
@@ -461,24 +1156,146 @@ class AsyncBrowserManager:
             first_link = await container.query_selector('a')
             if first_link:
                 video_containers.append(first_link)
-        
-        # 대체 방법: 직접 ID로 찾기
-        if len(video_containers) == 0:
-            for i in range(100):  # 최대 100개까지 확인
-                container = await self.page.query_selector(f'#column-item-video-container-{i}')
-                if container:
-                    first_link = await container.query_selector('a')
-                    if first_link:
-                        video_containers.append(first_link)
-                else:
-                    # 연속된 번호가 없으면 중단 (처음 몇 개는 스킵 가능)
-                    if i > 10 and len(video_containers) > 0:
-                        break
-        
+
+        # ID 를 0~99 까지 하나씩 조회하던 대체 경로는 위 접두사 셀렉터와 같은 요소만 찾으므로 제거
         return video_containers
 
+    async def extract_video_grid(self) -> Optional[List[Dict]]:
+        """
+        비디오 그리드 전체를 한 번의 page.evaluate 로 추출
+
+        Returns:
+            [{link, alt, src, views}, ...] (값이 없으면 None), 스크립트 실행 실패 시 None
+        """
+        if not self.page:
+            return None
+
+        try:
+            return await self.page.evaluate(TikTokBrowserConfig.VIDEO_GRID_SCRIPT)
+        except Exception as e:
+            print(f"⚠️ 비디오 그리드 일괄 추출 실패: {e}")
+            return None
+
+    async def extract_post_items(self, only_new: bool = False) -> Optional[List[Dict]]:
+        """
+        프로필 게시물/리포스트 그리드([data-e2e="user-post-item"])를 한 번의 page.evaluate 로 추출
+
+        Args:
+            only_new: True 면 이전 호출 이후 새로 나타난 항목만 추출
+
+        Returns:
+            [{link, alt, src, views, original_user}, ...], 스크립트 실행 실패 시 None
+        """
+        if not self.page:
+            return None
+
+        try:
+            return await self.page.evaluate(TikTokBrowserConfig.POST_ITEMS_SCRIPT, only_new)
+        except Exception as e:
+            print(f"⚠️ 게시물 그리드 일괄 추출 실패: {e}")
+            return None
+
+    async def extract_search_user_cards(self, only_new: bool = False, qualify: Optional[Callable[[Dict], Awaitable[bool]]] = None) -> Optional[Dict]:
+        """
+        검색 결과 사용자 카드를 두 단계로 추출
+
+        1단계에서 모든 카드의 사용자명/팔로워 수만 한 번의 page.evaluate 로 읽고,
+        qualify 를 통과한 카드만 2단계에서 닉네임/소개/프로필 URL/프로필 이미지를 읽습니다.
+        (qualify 가 없으면 모든 카드가 통과)
+
+        Args:
+            only_new: True 면 이전 호출 이후 새로 나타난 카드만 추출
+            qualify: 1단계 카드({id, username, followers})를 받아 나머지 필드를 읽을지 판단하는 async 함수
+
+        Returns:
+            {"selector": 사용된 컨테이너 셀렉터,
+             "cards": [{id, username, followers, details_loaded, (통과 시) nickname, bio, href, profile_image_url}, ...]}
+            스크립트 실행 실패 시 None
+        """
+        if not self.page:
+            return None
+
+        try:
+            batch = await self.page.evaluate(
+                TikTokBrowserConfig.SEARCH_USER_SUMMARY_SCRIPT,
+                [TikTokBrowserConfig.SEARCH_USER_CONTAINER_SELECTORS, only_new]
+            )
+
+            survivors = []
+            for card in batch['cards']:
+                card['details_loaded'] = False
+                if qualify is None or await qualify(card):
+                    survivors.append(card)
+
+            if survivors:
+                details = await self.page.evaluate(
+                    TikTokBrowserConfig.SEARCH_USER_DETAILS_SCRIPT,
+                    [card['id'] for card in survivors]
+                )
+                for card in survivors:
+                    card.update(details.get(card['id']) or {})
+                    card['details_loaded'] = True
+
+            return batch
+        except Exception as e:
+            print(f"⚠️ 검색 사용자 카드 일괄 추출 실패: {e}")
+            return None
+
+    async def extract_hydration_user(self) -> Optional[Dict]:
+        """
+        프로필 페이지의 하이드레이션 JSON 에서 사용자 정보 추출
+
+        domcontentloaded 직후 스크립트 태그 내용을 한 번 읽고 Python 에서 파싱합니다.
+
+        Returns:
+            {username, nickname, followers, following_count, video_count, bio, profile_image, is_verified}
+            스크립트가 없거나 사용자 정보가 없으면 None
+        """
+        if not self.page:
+            return None
+
+        try:
+            script_text = await self.page.evaluate(
+                """(selectors) => {
+                    for (const selector of selectors) {
+                        const el = document.querySelector(selector);
+                        if (el && el.textContent) return el.textContent;
+                    }
+                    return null;
+                }""",
+                TikTokBrowserConfig.HYDRATION_SCRIPT_SELECTORS
+            )
+        except Exception as e:
+            print(f"⚠️ 하이드레이션 데이터 읽기 실패: {e}")
+            return None
+
+        return TikTokApiParser.parse_hydration_user(script_text)
+
+    def blocked_resource_stats(self) -> Optional[Dict[str, Any]]:
+        """리소스 차단 통계 (차단을 사용하지 않으면 None)"""
+        return self.blocker.stats() if self.blocker else None
+
     async def close(self):
-        """브라우저 종료"""
+        """브라우저 종료 (풀에서 대여한 경우 컨텍스트만 닫고 반납)"""
+        if self.blocker:
+            stats = self.blocker.stats()
+            print(
+                f"🚫 차단한 요청 {stats['blocked_requests']}개 "
+                f"(추정 절약량 약 {stats['estimated_bytes_saved'] / 1_000_000:.1f}MB, 타입별 평균 크기 기준)"
+            )
+
+        if self.lease:
+            try:
+                if self.context:
+                    await self.context.close()
+            except Exception as e:
+                print(f"⚠️ 컨텍스트 종료 중 오류: {e}")
+                self.failed = True
+            await browser_pool.release(self.lease, failed=self.failed)
+            self.lease = None
+            print("🔚 브라우저 컨텍스트 반납 완료")
+            return
+
         if self.browser:
             await self.browser.close()
         if self.playwright:
@@ -0,0 +1,203 @@
+"""
+TikTok 브라우저 풀 모듈
+
+프로세스 전역에서 Chromium 인스턴스를 미리 띄워두고 재사용하는 풀
+- playwright 드라이버와 N개의 브라우저를 한 번만 실행
+- 작업마다 브라우저가 아닌 새 BrowserContext 만 생성
+- 작업 실패 / 연결 끊김 / 사용 횟수 초과 시 브라우저 재기동(recycle)
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+from playwright.async_api import async_playwright, Browser
+
+from app.core.config import settings
+
+
+class BrowserLease:
+    """풀에서 대여한 브라우저 슬롯 정보"""
+
+    def __init__(self, slot: "_BrowserSlot"):
+        self.slot = slot
+        self.browser: Browser = slot.browser
+        self.released = False
+
+
+class _BrowserSlot:
+    """풀 내부의 브라우저 한 개"""
+
+    def __init__(self, browser: Browser, headless: bool):
+        self.browser = browser
+        self.headless = headless
+        self.active_leases = 0
+        self.total_leases = 0
+        self.needs_recycle = False
+
+    @property
+    def is_healthy(self) -> bool:
+        return not self.needs_recycle and self.browser.is_connected()
+
+
+class TikTokBrowserPool:
+    """프로세스 전역 Chromium 브라우저 풀
+
+    풀은 start() 를 호출한 이벤트 루프에 묶입니다. Playwright 객체는 생성된
+    루프 밖에서 사용할 수 없으므로 다른 루프에서는 owns_running_loop() 가
+    False 를 반환하고, 호출자는 기존처럼 직접 브라우저를 띄워야 합니다.
+    """
+
+    def __init__(self, size: int = 2, max_uses: int = 50):
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.playwright = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._slots: Dict[bool, List[_BrowserSlot]] = {True: [], False: []}
+
+    # === LIFECYCLE ===
+    async def start(self):
+        """현재 이벤트 루프에 풀을 바인딩하고 playwright 드라이버를 실행"""
+        if self._loop is not None:
+            return
+
+        from app.services.browser_manager import TikTokBrowserConfig  # 순환 import 방지
+
+        self._browser_args = TikTokBrowserConfig.BROWSER_ARGS
+        self._loop = asyncio.get_running_loop()
+        self._lock = asyncio.Lock()
+        self.playwright = await async_playwright().start()
+        print(f"🧰 브라우저 풀 시작 (크기: {self.size})")
+
+    async def close(self):
+        """풀의 모든 브라우저와 playwright 드라이버 종료"""
+        if self._loop is None:
+            return
+
+        for slots in self._slots.values():
+            for slot in slots:
+                await self._close_browser(slot)
+            slots.clear()
+
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+        self._loop = None
+        self._lock = None
+        print("🔚 브라우저 풀 종료 완료")
+
+    def owns_running_loop(self) -> bool:
+        """현재 실행 중인 루프가 풀이 바인딩된 루프인지 확인"""
+        if self._loop is None:
+            return False
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    # === LEASE ===
+    async def acquire(self, headless: bool = False) -> BrowserLease:
+        """
+        브라우저 대여
+
+        빈 슬롯이 남아 있으면 새 브라우저를 띄우고, 모두 차 있으면 대여 수가
+        가장 적은 브라우저를 공유합니다. (컨텍스트는 호출자가 따로 생성)
+
+        Args:
+            headless: 헤드리스 모드 여부
+
+        Returns:
+            BrowserLease 인스턴스
+        """
+        if not self.owns_running_loop():
+            raise RuntimeError("브라우저 풀이 현재 이벤트 루프에서 시작되지 않았습니다.")
+
+        async with self._lock:
+            slots = self._slots[headless]
+
+            # 재기동 대상이면서 사용 중이 아닌 슬롯 정리
+            for slot in [s for s in slots if not s.is_healthy and s.active_leases == 0]:
+                await self._close_browser(slot)
+                slots.remove(slot)
+
+            healthy = [s for s in slots if s.is_healthy]
+            if len(slots) < self.size and (not healthy or all(s.active_leases > 0 for s in healthy)):
+                slot = await self._launch(headless)
+                slots.append(slot)
+            elif healthy:
+                slot = min(healthy, key=lambda s: s.active_leases)
+            else:
+                # 모든 슬롯이 재기동 대기 중이고 풀이 가득 찬 경우 (사용 중인 작업이 끝나기 전)
+                slot = await self._launch(headless)
+                slots.append(slot)
+
+            slot.active_leases += 1
+            slot.total_leases += 1
+            if self.max_uses and slot.total_leases >= self.max_uses:
+                slot.needs_recycle = True
+
+            return BrowserLease(slot)
+
+    async def release(self, lease: BrowserLease, failed: bool = False):
+        """
+        대여한 브라우저 반납
+
+        Args:
+            lease: acquire() 로 받은 BrowserLease
+            failed: 작업 실패 여부 (True 면 해당 브라우저를 재기동 대상으로 표시)
+        """
+        if lease.released:
+            return
+        lease.released = True
+
+        async with self._lock:
+            slot = lease.slot
+            slot.active_leases = max(0, slot.active_leases - 1)
+            if failed:
+                slot.needs_recycle = True
+
+            if not slot.is_healthy and slot.active_leases == 0:
+                slots = self._slots[slot.headless]
+                if slot in slots:
+                    slots.remove(slot)
+                await self._close_browser(slot)
+                print("♻️ 브라우저 재기동 대상 정리 완료")
+
+    def stats(self) -> Dict:
+        """풀 상태 통계"""
+        return {
+            "size": self.size,
+            "running": self._loop is not None,
+            "browsers": [
+                {
+                    "headless": slot.headless,
+                    "active_leases": slot.active_leases,
+                    "total_leases": slot.total_leases,
+                    "healthy": slot.is_healthy
+                }
+                for slots in self._slots.values()
+                for slot in slots
+            ]
+        }
+
+    # === INTERNAL ===
+    async def _launch(self, headless: bool) -> _BrowserSlot:
+        browser = await self.playwright.chromium.launch(
+            headless=headless,
+            args=self._browser_args
+        )
+        print(f"🚀 풀 브라우저 실행 (headless: {headless})")
+        return _BrowserSlot(browser, headless)
+
+    async def _close_browser(self, slot: _BrowserSlot):
+        try:
+            if slot.browser.is_connected():
+                await slot.browser.close()
+        except Exception as e:
+            print(f"⚠️ 풀 브라우저 종료 중 오류 (무시): {e}")
+
+
+browser_pool = TikTokBrowserPool(
+    size=settings.BROWSER_POOL_SIZE,
+    max_uses=settings.BROWSER_POOL_MAX_USES
+)
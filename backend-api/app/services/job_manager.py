@@ -0,0 +1,304 @@
+"""
+TikTok 비동기 작업(Job) 관리 모듈
+
+오래 걸리는 스크랩 요청을 HTTP 요청과 분리해서 백그라운드로 실행
+- 제출 즉시 job_id 반환, 실제 작업은 크기가 제한된 워커 풀에서 실행
+- 작업 상태/진행 카운터/결과는 로컬 SQLite 파일에 저장 (서버 재시작 후에도 조회 가능)
+- 작업마다 자체 DB 세션을 열고 닫으므로 요청의 커넥션을 오래 점유하지 않음
+- 끝난 작업은 JOB_RETENTION_HOURS 가 지나면 삭제 (시작 시 + 작업 제출 시 최대 한 시간에 한 번)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+
+
+class JobStatus:
+    """작업 상태 상수"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class JobStore:
+    """SQLite 기반 작업 상태 저장소"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def initialize(self):
+        """테이블 생성"""
+        with self._lock, self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    params TEXT,
+                    progress TEXT,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status_index ON jobs (status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_finished_at_index ON jobs (finished_at)")
+
+    def create(self, job_type: str, params: Dict) -> str:
+        job_id = uuid.uuid4().hex
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, job_type, status, params, progress, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, job_type, JobStatus.QUEUED, _dumps(params), _dumps({}), _now())
+            )
+        return job_id
+
+    def update(self, job_id: str, **fields):
+        """작업 필드 업데이트 (dict 값은 JSON 으로 저장)"""
+        if not fields:
+            return
+        columns = ", ".join(f"{key} = ?" for key in fields)
+        values = [_dumps(v) if isinstance(v, (dict, list)) else v for v in fields.values()]
+        with self._lock, self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*values, job_id))
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_dict(row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        query = "SELECT * FROM jobs"
+        params: List[Any] = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [_row_to_dict(row, include_result=False) for row in rows]
+
+    def find_by_status(self, *statuses: str) -> List[Dict]:
+        placeholders = ", ".join("?" for _ in statuses)
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM jobs WHERE status IN ({placeholders}) ORDER BY created_at",
+                statuses
+            ).fetchall()
+        return [_row_to_dict(row) for row in rows]
+
+    def delete_finished_before(self, cutoff: datetime) -> int:
+        """cutoff 이전에 끝난(완료/실패) 작업 삭제
+
+        Returns:
+            삭제한 작업 수
+        """
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (JobStatus.COMPLETED, JobStatus.FAILED, cutoff.isoformat())
+            )
+        return cursor.rowcount
+
+
+class JobProgress:
+    """작업 진행 카운터 (서비스 코드에서 update/increment 로 갱신)"""
+
+    def __init__(self, store: JobStore, job_id: str):
+        self.store = store
+        self.job_id = job_id
+        self.counters: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def update(self, **counters):
+        """카운터 값 설정"""
+        with self._lock:
+            self.counters.update(counters)
+            snapshot = dict(self.counters)
+        self.store.update(self.job_id, progress=snapshot)
+
+    def increment(self, key: str, amount: int = 1):
+        """카운터 값 증가"""
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+            snapshot = dict(self.counters)
+        self.store.update(self.job_id, progress=snapshot)
+
+
+JobHandler = Callable[..., Dict]
+
+
+class JobManager:
+    """작업 제출/실행/조회 관리 클래스"""
+
+    # 보관 기간이 지난 작업 정리 간격 (초, 작업 제출 시 확인)
+    PURGE_INTERVAL_SECONDS = 3600
+
+    def __init__(self, db_path: str, max_workers: int = 2, retention_hours: int = 0):
+        self.store = JobStore(db_path)
+        self.max_workers = max(1, max_workers)
+        self.retention_hours = retention_hours
+        self._handlers: Dict[str, JobHandler] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._last_purge_at: Optional[float] = None
+
+    def register(self, job_type: str, handler: JobHandler):
+        """
+        작업 핸들러 등록
+
+        Args:
+            job_type: 작업 타입명
+            handler: handler(db, params, progress) -> 결과 dict
+        """
+        self._handlers[job_type] = handler
+
+    # === LIFECYCLE ===
+    def start(self):
+        """저장소 초기화, 보관 기간이 지난 작업 삭제, 워커 풀 생성, 이전 프로세스의 미완료 작업 복구"""
+        if self._executor:
+            return
+
+        self.store.initialize()
+        self.purge_expired()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tiktok-job")
+
+        # 실행 중이던 작업은 중단 처리, 대기 중이던 작업은 다시 큐에 등록
+        for job in self.store.find_by_status(JobStatus.RUNNING, JobStatus.QUEUED):
+            if job["status"] == JobStatus.RUNNING:
+                self.store.update(
+                    job["id"],
+                    status=JobStatus.FAILED,
+                    error="서버 재시작으로 작업이 중단되었습니다.",
+                    finished_at=_now()
+                )
+            else:
+                self._executor.submit(self._run, job["id"], job["job_type"], job["params"] or {})
+
+        print(f"🗂️ 작업 관리자 시작 (워커 수: {self.max_workers}, 저장소: {self.store.db_path})")
+
+    def shutdown(self):
+        """워커 풀 종료 (대기 중인 작업은 다음 시작 시 다시 실행)"""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # === SUBMIT / QUERY ===
+    def submit(self, job_type: str, params: Dict) -> str:
+        """
+        작업 제출
+
+        Args:
+            job_type: 등록된 작업 타입명
+            params: JSON 직렬화 가능한 작업 파라미터
+
+        Returns:
+            생성된 job_id
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"등록되지 않은 작업 타입입니다: {job_type}")
+        if not self._executor:
+            self.start()
+
+        if self._last_purge_at is None or time.monotonic() - self._last_purge_at >= self.PURGE_INTERVAL_SECONDS:
+            self.purge_expired()
+
+        job_id = self.store.create(job_type, params)
+        self._executor.submit(self._run, job_id, job_type, params)
+        print(f"📥 작업 제출: {job_type} ({job_id})")
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        return self.store.get(job_id)
+
+    def purge_expired(self) -> int:
+        """
+        retention_hours 가 지난 끝난 작업(파라미터/결과 포함) 삭제 (0 이하이면 삭제 안 함)
+
+        Returns:
+            삭제한 작업 수
+        """
+        self._last_purge_at = time.monotonic()
+        if self.retention_hours <= 0:
+            return 0
+
+        deleted = self.store.delete_finished_before(datetime.now() - timedelta(hours=self.retention_hours))
+        if deleted:
+            print(f"🧹 보관 기간({self.retention_hours}시간)이 지난 작업 {deleted}개 삭제")
+        return deleted
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        return self.store.list(status=status, limit=limit)
+
+    # === INTERNAL ===
+    def _run(self, job_id: str, job_type: str, params: Dict):
+        from app.core.database import SessionLocal
+
+        handler = self._handlers.get(job_type)
+        progress = JobProgress(self.store, job_id)
+        self.store.update(job_id, status=JobStatus.RUNNING, started_at=_now())
+
+        db = SessionLocal()
+        try:
+            result = handler(db, params, progress)
+            db.commit()
+            self.store.update(job_id, status=JobStatus.COMPLETED, result=result, finished_at=_now())
+            print(f"✅ 작업 완료: {job_type} ({job_id})")
+        except Exception as e:
+            db.rollback()
+            traceback.print_exc()
+            self.store.update(job_id, status=JobStatus.FAILED, error=str(e), finished_at=_now())
+            print(f"❌ 작업 실패: {job_type} ({job_id}): {e}")
+        finally:
+            db.close()
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _row_to_dict(row: sqlite3.Row, include_result: bool = True) -> Dict:
+    job = {
+        "id": row["id"],
+        "job_type": row["job_type"],
+        "status": row["status"],
+        "params": json.loads(row["params"]) if row["params"] else {},
+        "progress": json.loads(row["progress"]) if row["progress"] else {},
+        "error": row["error"],
+        "created_at": row["created_at"],
+        "started_at": row["started_at"],
+        "finished_at": row["finished_at"]
+    }
+    if include_result:
+        job["result"] = json.loads(row["result"]) if row["result"] else None
+    return job
+
+
+job_manager = JobManager(
+    settings.JOB_DB_PATH,
+    max_workers=settings.JOB_MAX_WORKERS,
+    retention_hours=settings.JOB_RETENTION_HOURS
+)
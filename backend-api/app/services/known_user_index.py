@@ -0,0 +1,97 @@
+"""
+저장된 사용자 인덱스 모듈
+
+tiktok_users 의 username → 마지막 팔로워 수를 메모리에 유지
+- 검색 수집에서 이미 저장된 사용자이고 팔로워 수가 같으면 DB 조회/업서트/이미지 업로드를 모두 건너뜀
+- 처음에는 전체를 읽고, 이후 작업 시작마다 updated_at 기준 변경분만 반영
+- KNOWN_USER_INDEX_FULL_RELOAD_SECONDS 가 지나면 전체를 다시 읽어 관리페이지에서 삭제된 행도 정리
+- 여러 작업 스레드가 함께 쓰므로 갱신은 잠금 안에서 처리
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.tiktok import TikTokUser
+
+
+class KnownUserIndex:
+    """username → 팔로워 수 인덱스 (soft delete 된 사용자 제외)"""
+
+    # 변경분 조회 시 이전 갱신 시각보다 이만큼 앞에서부터 다시 읽음 (같은 초 안의 변경 누락 방지)
+    OVERLAP = timedelta(seconds=5)
+
+    def __init__(self):
+        self._followers: Dict[str, Optional[int]] = {}
+        self._synced_at: Optional[datetime] = None  # 마지막 갱신 시작 시각 (DB 시계)
+        self._full_loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def refresh(self, session: Session) -> int:
+        """
+        DB 와 동기화 (처음이거나 전체 재로딩 주기가 지났으면 전체, 아니면 변경분만)
+
+        Returns:
+            읽은 행 수
+        """
+        with self._lock:
+            db_now = session.query(func.now()).scalar()
+            full = (
+                self._synced_at is None
+                or time.monotonic() - self._full_loaded_at >= settings.KNOWN_USER_INDEX_FULL_RELOAD_SECONDS
+            )
+
+            query = session.query(TikTokUser.username, TikTokUser.followers, TikTokUser.deleted_at)
+            if full:
+                query = query.filter(TikTokUser.deleted_at.is_(None))
+                followers: Dict[str, Optional[int]] = {}
+            else:
+                query = query.filter(TikTokUser.updated_at >= self._synced_at - self.OVERLAP)
+                followers = self._followers
+
+            rows = 0
+            for username, follower_count, deleted_at in query.yield_per(5000):
+                rows += 1
+                if not username:
+                    continue
+                if deleted_at is not None:
+                    followers.pop(username, None)
+                else:
+                    followers[username] = follower_count
+
+            # 조회 트랜잭션 종료 (세션을 다른 스레드에서 이어 씀)
+            session.commit()
+
+            self._followers = followers
+            self._synced_at = db_now
+            if full:
+                self._full_loaded_at = time.monotonic()
+
+            print(f"📇 저장된 사용자 인덱스 {'전체' if full else '변경분'} 갱신: {rows}행 (총 {len(self._followers):,}명)")
+            return rows
+
+    def is_unchanged(self, username: str, followers: Optional[int]) -> bool:
+        """이미 저장된 사용자이고 팔로워 수가 같으면 True"""
+        return username in self._followers and self._followers[username] == followers
+
+    def remember(self, users_data: List[Dict]) -> None:
+        """방금 저장한 사용자의 팔로워 수 반영"""
+        with self._lock:
+            for data in users_data:
+                if data.get('username'):
+                    self._followers[data['username']] = data.get('followers')
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._followers),
+            "synced_at": self._synced_at.isoformat() if self._synced_at else None
+        }
+
+
+# 작업 간에 공유하는 저장된 사용자 인덱스
+known_user_index = KnownUserIndex()
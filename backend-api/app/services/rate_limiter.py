@@ -0,0 +1,75 @@
+"""
+페이지 이동 속도 제한 모듈
+
+브라우저 루프의 모든 페이지 이동(goto)이 공유하는 토큰 버킷
+- 동시 수집 모드에서 페이지 수를 늘려도 전체 요청 속도가 설정한 예산을 넘지 않도록 함
+- 버킷은 처음 사용한 이벤트 루프(browser_loop)에서만 사용
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+
+class TokenBucket:
+    """분당 rate_per_minute 개, 최대 burst 개까지 모아둘 수 있는 토큰 버킷
+
+    rate_per_minute 가 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        self.rate_per_minute = rate_per_minute
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait_seconds = 0.0
+
+    async def acquire(self) -> float:
+        """토큰 하나를 사용 (없으면 채워질 때까지 대기, 대기 순서는 요청 순)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if self.rate_per_minute <= 0:
+            self.acquired += 1
+            return 0.0
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            self._refill()
+            wait = 0.0
+            if self.tokens < 1:
+                wait = (1 - self.tokens) * 60 / self.rate_per_minute
+                await asyncio.sleep(wait)
+                self._refill()
+                self.waited += 1
+                self.total_wait_seconds += wait
+            self.tokens -= 1
+            self.acquired += 1
+            return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """설정값과 누적 사용/대기 통계"""
+        return {
+            "rate_per_minute": self.rate_per_minute,
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "total_wait_seconds": round(self.total_wait_seconds, 3)
+        }
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated_at) * self.rate_per_minute / 60)
+        self._updated_at = now
+
+
+# 모든 브라우저 페이지 이동이 공유하는 속도 제한
+navigation_limiter = TokenBucket(settings.NAVIGATION_RATE_PER_MINUTE, settings.NAVIGATION_BURST)
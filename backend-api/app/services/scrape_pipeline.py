@@ -0,0 +1,238 @@
+"""
+스크랩 결과 처리 파이프라인 모듈
+
+브라우저 추출 → (bounded queue) → DB 기록(배치) → 이미지 다운로드 워커 → 업로드 워커
+- 단계마다 큐 크기와 워커 수를 따로 두어 느린 단계가 앞 단계를 적당히 막도록(backpressure) 함
+- 페이지 작업은 put() 만 하고 바로 다음 추출로 넘어가므로, 스크랩 시간이
+  DB 커밋/이미지 다운로드/관리페이지 업로드 시간의 합이 아니라 페이지 시간에 가까워짐
+- 블로킹 작업은 asyncio.to_thread 로 실행 (브라우저 루프를 막지 않음)
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+
+
+_STOP = object()
+
+
+class ScrapePipeline:
+    """브라우저 루프에서 사용하는 스크랩 결과 처리 파이프라인
+
+    사용 예:
+        async with ScrapePipeline("users", write_batch, download, upload) as pipeline:
+            async for item in ...:
+                await pipeline.put(item)
+        print(pipeline.stats())
+
+    Args:
+        name: 로그용 이름
+        write_batch: 항목 리스트를 DB에 기록하고 이미지 작업(dict) 리스트를 반환하는 동기 함수
+            (DB 세션을 쓰므로 항상 한 번에 하나씩만 실행됨)
+        download: 이미지 작업을 받아 로컬 파일 경로(또는 None)를 반환하는 동기 함수
+        upload: (이미지 작업, 로컬 경로) 를 받아 업로드 및 URL 갱신을 하는 동기 함수
+            (별도 DB 세션을 사용해야 함)
+        on_finish: 모든 단계가 끝난 뒤 한 번 실행할 동기 함수 (업로드 단계에서 모아둔 DB 변경 커밋 등)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        write_batch: Callable[[List[Any]], Optional[List[Dict]]],
+        download: Optional[Callable[[Dict], Optional[str]]] = None,
+        upload: Optional[Callable[[Dict, str], Any]] = None,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        image_workers: Optional[int] = None,
+        upload_workers: Optional[int] = None,
+        on_finish: Optional[Callable[[], Any]] = None
+    ):
+        self.name = name
+        self.write_batch = write_batch
+        self.download = download
+        self.upload = upload
+        self.on_finish = on_finish
+        self.queue_size = queue_size or settings.PIPELINE_QUEUE_SIZE
+        self.batch_size = batch_size or settings.PIPELINE_DB_BATCH_SIZE
+        self.flush_interval = settings.PIPELINE_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.image_workers = image_workers or settings.PIPELINE_IMAGE_WORKERS
+        self.upload_workers = upload_workers or settings.PIPELINE_UPLOAD_WORKERS
+
+        self._items: Optional[asyncio.Queue] = None
+        self._images: Optional[asyncio.Queue] = None
+        self._uploads: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._image_tasks: List[asyncio.Task] = []
+        self._upload_tasks: List[asyncio.Task] = []
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._stats = {
+            stage: {"processed": 0, "failed": 0, "busy_seconds": 0.0, "max_queue": 0}
+            for stage in ("db", "image", "upload")
+        }
+        self._stats["db"]["batches"] = 0
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # 추출 중 오류가 나도 이미 넘겨받은 항목은 끝까지 저장
+        await self.finish()
+
+    # === LIFECYCLE ===
+    def start(self):
+        """큐와 단계별 워커 태스크 생성 (실행 중인 이벤트 루프 필요)"""
+        if self._writer is not None:
+            return
+
+        self._started_at = time.monotonic()
+        self._items = asyncio.Queue(maxsize=self.queue_size)
+        self._images = asyncio.Queue(maxsize=self.queue_size)
+        self._uploads = asyncio.Queue(maxsize=self.queue_size)
+
+        self._writer = asyncio.create_task(self._db_writer())
+        if self.download:
+            self._image_tasks = [asyncio.create_task(self._image_worker()) for _ in range(self.image_workers)]
+            if self.upload:
+                self._upload_tasks = [asyncio.create_task(self._upload_worker()) for _ in range(self.upload_workers)]
+
+    async def put(self, item: Any):
+        """추출한 항목을 DB 기록 큐에 넣음 (큐가 가득 차면 자리가 날 때까지 대기)"""
+        if self._writer is None:
+            raise RuntimeError("파이프라인이 시작되지 않았습니다.")
+        await self._items.put(item)
+        self._track_queue("db", self._items)
+
+    async def finish(self) -> Dict[str, Any]:
+        """남은 항목을 모두 처리하고 워커 종료 (앞 단계부터 순서대로 비움)"""
+        if self._writer is None or self._finished_at is not None:
+            return self.stats()
+
+        await self._items.put(_STOP)
+        await self._writer
+
+        for _ in self._image_tasks:
+            await self._images.put(_STOP)
+        await asyncio.gather(*self._image_tasks)
+
+        for _ in self._upload_tasks:
+            await self._uploads.put(_STOP)
+        await asyncio.gather(*self._upload_tasks)
+
+        if self.on_finish:
+            try:
+                await asyncio.to_thread(self.on_finish)
+            except Exception as e:
+                print(f"⚠️ [{self.name}] 마무리 작업 실패: {e}")
+
+        self._finished_at = time.monotonic()
+        stats = self.stats()
+        print(
+            f"🏁 [{self.name}] 파이프라인 완료: DB {stats['db']['processed']}건/{stats['db']['batches']}배치, "
+            f"이미지 {stats['image']['processed']}건, 업로드 {stats['upload']['processed']}건 "
+            f"({stats['elapsed_seconds']:.1f}s)"
+        )
+        return stats
+
+    def stats(self) -> Dict[str, Any]:
+        """단계별 처리/실패 건수, 작업 시간 합계, 최대 대기열 길이"""
+        end = self._finished_at or time.monotonic()
+        stats = {stage: dict(values) for stage, values in self._stats.items()}
+        for values in stats.values():
+            values["busy_seconds"] = round(values["busy_seconds"], 3)
+        stats["elapsed_seconds"] = round(end - self._started_at, 3) if self._started_at else 0.0
+        return stats
+
+    # === STAGES ===
+    async def _db_writer(self):
+        """항목을 batch_size 개 또는 flush_interval 초 단위로 모아 기록"""
+        batch: List[Any] = []
+        while True:
+            try:
+                timeout = self.flush_interval if batch else None
+                item = await asyncio.wait_for(self._items.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                await self._flush(batch)
+                batch = []
+                continue
+
+            if item is _STOP:
+                break
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+
+        if batch:
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Any]):
+        if not batch:
+            return
+
+        stage = self._stats["db"]
+        started = time.monotonic()
+        try:
+            image_tasks = await asyncio.to_thread(self.write_batch, batch) or []
+            stage["processed"] += len(batch)
+        except Exception as e:
+            stage["failed"] += len(batch)
+            print(f"❗ [{self.name}] DB 배치 기록 실패 ({len(batch)}건): {e}")
+            image_tasks = []
+        finally:
+            stage["busy_seconds"] += time.monotonic() - started
+            stage["batches"] += 1
+
+        if not self.download:
+            return
+        for task in image_tasks:
+            await self._images.put(task)
+            self._track_queue("image", self._images)
+
+    async def _image_worker(self):
+        stage = self._stats["image"]
+        while True:
+            task = await self._images.get()
+            if task is _STOP:
+                return
+
+            started = time.monotonic()
+            try:
+                local_path = await asyncio.to_thread(self.download, task)
+                stage["processed"] += 1
+            except Exception as e:
+                stage["failed"] += 1
+                print(f"⚠️ [{self.name}] 이미지 다운로드 실패: {e}")
+                local_path = None
+            finally:
+                stage["busy_seconds"] += time.monotonic() - started
+
+            if local_path and self.upload:
+                await self._uploads.put((task, local_path))
+                self._track_queue("upload", self._uploads)
+
+    async def _upload_worker(self):
+        stage = self._stats["upload"]
+        while True:
+            job = await self._uploads.get()
+            if job is _STOP:
+                return
+
+            task, local_path = job
+            started = time.monotonic()
+            try:
+                await asyncio.to_thread(self.upload, task, local_path)
+                stage["processed"] += 1
+            except Exception as e:
+                stage["failed"] += 1
+                print(f"⚠️ [{self.name}] 이미지 업로드 실패: {e}")
+            finally:
+                stage["busy_seconds"] += time.monotonic() - started
+
+    def _track_queue(self, stage: str, queue: asyncio.Queue):
+        stats = self._stats[stage]
+        stats["max_queue"] = max(stats["max_queue"], queue.qsize())
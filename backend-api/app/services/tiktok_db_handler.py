@@ -1,12 +1,16 @@
 """
 TikTok 데이터베이스 작업을 통합 관리하는 헬퍼 클래스
 """
+import threading
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 
+from app.core.config import settings
 from app.models.tiktok import (
     TikTokBrandAccount, TikTokRepostVideo, TikTokVideo, TikTokUser, 
     TikTokUserLog, TikTokMessage, TikTokUploadRequest
@@ -15,6 +19,9 @@ from app.models.tiktok import (
 
 class TikTokDatabaseHandler:
     """TikTok 관련 데이터베이스 작업을 통합 관리하는 클래스"""
+
+    # 일괄 upsert 시 기존 행에서 갱신할 컬럼 (썸네일은 관리페이지 업로드 URL 로 바뀌므로 제외)
+    VIDEO_UPDATE_COLUMNS = ('title', 'view_count', 'posted_at', 'like_count', 'comment_count', 'share_count')
     
     def __init__(self, db_session: Session):
         self.db_session = db_session
@@ -149,6 +156,104 @@ class TikTokDatabaseHandler:
         
         return video_record
     
+    def bulk_upsert_videos(self, videos_data: List[Dict], tiktok_user_id: int) -> Dict:
+        """
+        한 사용자의 비디오를 한 번에 저장합니다. ((tiktok_user_id, video_url) 유니크 키 기준)
+
+        Args:
+            videos_data: TikTokVideo.from_scrape_data 형식 데이터 리스트 (link, alt, src, views, ...)
+            tiktok_user_id: TikTok 사용자 ID
+
+        Returns:
+            {"created": 생성 수, "updated": 갱신 수, "ids": {video_url: id}}
+        """
+        rows = [(data, TikTokVideo.from_scrape_data(data, tiktok_user_id)) for data in videos_data if data.get('link')]
+        return self._bulk_upsert(TikTokVideo, TikTokVideo.tiktok_user_id, tiktok_user_id, rows)
+
+    def bulk_upsert_repost_videos(self, videos_data: List[Dict], brand_account_id: int, extra_update_columns: Tuple[str, ...] = ()) -> Dict:
+        """
+        한 브랜드 계정의 리포스트 비디오를 한 번에 저장합니다. ((tiktok_brand_account_id, video_url) 유니크 키 기준)
+
+        Args:
+            videos_data: TikTokRepostVideo.from_scrape_data 형식 데이터 리스트 (video_url, title, ...)
+            brand_account_id: 브랜드 계정 ID
+            extra_update_columns: 기존 행에서 추가로 갱신할 컬럼 (예: 업로드하지 않는 썸네일 URL)
+
+        Returns:
+            {"created": 생성 수, "updated": 갱신 수, "ids": {video_url: id}}
+        """
+        rows = [(data, TikTokRepostVideo.from_scrape_data(data, brand_account_id)) for data in videos_data if data.get('video_url')]
+        return self._bulk_upsert(TikTokRepostVideo, TikTokRepostVideo.tiktok_brand_account_id, brand_account_id, rows, extra_update_columns)
+
+    def _bulk_upsert(self, model, owner_column, owner_id: int, rows: List[Tuple[Dict, Any]], extra_update_columns: Tuple[str, ...] = ()) -> Dict:
+        """
+        INSERT ... ON DUPLICATE KEY UPDATE (MySQL) / ON CONFLICT DO UPDATE (SQLite, PostgreSQL) 로 일괄 저장
+
+        갱신 컬럼은 데이터에 실제로 있는 값만 사용합니다. (응답 캡처가 없을 때 기존 좋아요 수 등을 0 으로 덮지 않도록)
+        컬럼 구성이 같은 행끼리 묶어 묶음마다 한 문장으로 실행하고, 성공 시 커밋합니다.
+        """
+        result = {"created": 0, "updated": 0, "ids": {}}
+        if not rows:
+            return result
+
+        table = model.__table__
+        now = datetime.now()
+
+        # 같은 video_url 이 여러 번 오면 마지막 값 사용
+        by_url: Dict[str, Tuple[Dict, Any]] = {}
+        for data, record in rows:
+            by_url[record.video_url] = (data, record)
+        urls = list(by_url)
+
+        url_filter = (owner_column == owner_id) & (model.video_url.in_(urls))
+        existing = set(self.db_session.execute(select(model.video_url).where(url_filter)).scalars())
+
+        groups: Dict[Tuple, List[Dict]] = {}
+        for data, record in by_url.values():
+            values = {
+                column.name: getattr(record, column.key)
+                for column in table.columns
+                if column.name != 'id' and getattr(record, column.key) is not None
+            }
+            values.setdefault('title', '')
+            values['updated_at'] = now
+            values.setdefault('created_at', now)
+            update_columns = tuple(
+                column for column in self.VIDEO_UPDATE_COLUMNS + tuple(extra_update_columns)
+                if column in values and (column in ('title', 'view_count') or data.get(column) is not None)
+            ) + ('updated_at',)
+            groups.setdefault((tuple(sorted(values)), update_columns), []).append(values)
+
+        dialect = self.db_session.get_bind().dialect.name
+        try:
+            for (_, update_columns), values_list in groups.items():
+                if dialect == 'mysql':
+                    stmt = mysql.insert(table).values(values_list)
+                    stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in update_columns})
+                elif dialect in ('sqlite', 'postgresql'):
+                    insert = sqlite.insert if dialect == 'sqlite' else postgresql.insert
+                    stmt = insert(table).values(values_list)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[owner_column.name, 'video_url'],
+                        set_={column: stmt.excluded[column] for column in update_columns}
+                    )
+                else:
+                    raise RuntimeError(f"일괄 upsert 를 지원하지 않는 데이터베이스입니다: {dialect}")
+                self.db_session.execute(stmt)
+
+            result["ids"] = {
+                video_url: record_id
+                for record_id, video_url in self.db_session.execute(select(model.id, model.video_url).where(url_filter))
+            }
+            self.db_session.commit()
+        except Exception:
+            self.safe_rollback()
+            raise
+
+        result["updated"] = len(existing)
+        result["created"] = len(urls) - len(existing)
+        return result
+
     def get_user_by_username(self, username: str) -> Optional[TikTokUser]:
         """사용자명으로 TikTok 사용자 조회"""
         return self.db_session.query(TikTokUser).filter(
@@ -321,6 +426,17 @@ class TikTokDatabaseHandler:
             self.safe_rollback()
             return False
     
+    def unit_of_work(self, name: str = "uow", flush_size: Optional[int] = None, flush_interval_ms: Optional[int] = None) -> 'UnitOfWork':
+        """
+        이 핸들러의 세션으로 변경을 모아 커밋하는 UnitOfWork 생성
+
+        Args:
+            name: 로그용 이름
+            flush_size: 이 개수만큼 쌓이면 커밋 (기본 UOW_FLUSH_SIZE)
+            flush_interval_ms: 첫 변경 후 이 시간(ms)이 지나면 커밋 (기본 UOW_FLUSH_INTERVAL_MS)
+        """
+        return UnitOfWork(self.db_session, name, flush_size, flush_interval_ms)
+
     def safe_commit(self) -> bool:
         """
         안전한 커밋 실행
@@ -373,4 +489,144 @@ class TikTokDatabaseHandler:
         except SQLAlchemyError as e:
             print(f"❗ 플러시 실패: {e}")
             self.safe_rollback()
-            return False
\ No newline at end of file
+            return False
+
+class UnitOfWork:
+    """
+    행마다 커밋하지 않고 변경을 모아 한 트랜잭션으로 커밋하는 헬퍼
+
+    사용 예:
+        with handler.unit_of_work("image_urls") as uow:
+            for ...:
+                uow.add(lambda session: session.execute(stmt, params))
+
+    - add() 로 넣은 변경(session 을 받는 함수)은 flush_size 개가 쌓이거나
+      첫 변경 후 flush_interval_ms 가 지나면 한 트랜잭션에서 실행 후 커밋
+      (시간 기준은 첫 변경 때 건 타이머 스레드가 확인하므로 이후 add() 가 없어도 커밋됨)
+    - 전용 세션으로 만든 경우 다 쓰고 close() 로 남은 변경 커밋 후 세션 반납
+    - 변경마다 SAVEPOINT 로 감싸 실패한 행만 되돌리고 나머지는 그대로 커밋
+    - 커밋 자체가 실패하면(데드락 등) 묶음 전체를 다시 실행하므로 변경은 여러 번 실행해도 같은 결과여야 함
+    - 여러 스레드에서 add() 해도 되며, 세션은 잠금 안에서만 사용
+    """
+
+    MAX_COMMIT_RETRIES = 3
+
+    def __init__(self, db_session: Session, name: str = "uow", flush_size: Optional[int] = None, flush_interval_ms: Optional[int] = None):
+        self.db_session = db_session
+        self.name = name
+        self.flush_size = max(1, flush_size or settings.UOW_FLUSH_SIZE)
+        self.flush_interval = (settings.UOW_FLUSH_INTERVAL_MS if flush_interval_ms is None else flush_interval_ms) / 1000
+        self._pending: List[Tuple[Callable[[Session], Any], str]] = []
+        self._first_added_at: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._stats = {"added": 0, "applied": 0, "failed": 0, "commits": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def add(self, change: Callable[[Session], Any], label: str = "") -> None:
+        """변경 추가 (기준을 넘으면 바로 flush)"""
+        with self._lock:
+            if not self._pending:
+                self._first_added_at = time.monotonic()
+            self._pending.append((change, label))
+            self._stats["added"] += 1
+            due = (
+                len(self._pending) >= self.flush_size
+                or time.monotonic() - self._first_added_at >= self.flush_interval
+            )
+            if not due and self._timer is None:
+                # 이후 add() 가 없어도 flush_interval 뒤에 커밋
+                self._timer = threading.Timer(self.flush_interval, self._flush_on_deadline)
+                self._timer.daemon = True
+                self._timer.start()
+        if due:
+            self.flush()
+
+    def _flush_on_deadline(self) -> None:
+        """타이머 스레드에서 flush_interval 이 지난 변경 커밋"""
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"❗ [{self.name}] 시간 기준 커밋 실패: {e}")
+
+    def flush(self) -> Dict[str, int]:
+        """
+        쌓인 변경을 실행하고 커밋
+
+        Returns:
+            {"applied": 커밋된 변경 수, "failed": 실패한 변경 수}
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._first_added_at = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return {"applied": 0, "failed": 0}
+
+        failed = len(pending)
+        for attempt in range(self.MAX_COMMIT_RETRIES):
+            if attempt:
+                # 재시도 대기는 잠금 밖에서 (업로드 워커의 add() 를 막지 않도록)
+                time.sleep(0.1 * attempt)
+            with self._lock:
+                try:
+                    failed = self._apply(pending)
+                    self.db_session.commit()
+                except SQLAlchemyError as e:
+                    self.safe_rollback()
+                    failed = len(pending)
+                    if attempt == self.MAX_COMMIT_RETRIES - 1:
+                        print(f"❗ [{self.name}] {len(pending)}건 커밋 실패: {e}")
+                    continue
+                self._stats["commits"] += 1
+                break
+
+        applied = len(pending) - failed
+        with self._lock:
+            self._stats["applied"] += applied
+            self._stats["failed"] += failed
+        return {"applied": applied, "failed": failed}
+
+    def _apply(self, pending: List[Tuple[Callable[[Session], Any], str]]) -> int:
+        """변경마다 SAVEPOINT 로 감싸 실행하고 실패한 변경 수 반환 (커밋은 하지 않음, 잠금 안에서 호출)"""
+        failed = 0
+        for change, label in pending:
+            try:
+                with self.db_session.begin_nested():
+                    change(self.db_session)
+            except Exception as e:
+                failed += 1
+                print(f"⚠️ [{self.name}] 변경 실패 (해당 행만 롤백){f' {label}' if label else ''}: {e}")
+        return failed
+
+    def close(self) -> Dict[str, int]:
+        """
+        남은 변경을 커밋하고 세션을 닫음 (이 UnitOfWork 전용 세션일 때 사용)
+
+        Returns:
+            마지막 flush() 결과
+        """
+        try:
+            return self.flush()
+        finally:
+            try:
+                self.db_session.close()
+            except SQLAlchemyError as e:
+                print(f"❗ [{self.name}] 세션 종료 실패: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """누적 추가/커밋/실패 건수와 성공한 커밋 횟수"""
+        return dict(self._stats, pending=len(self._pending))
+
+    def safe_rollback(self) -> None:
+        try:
+            self.db_session.rollback()
+        except SQLAlchemyError as e:
+            print(f"❗ [{self.name}] 롤백 실패: {e}")
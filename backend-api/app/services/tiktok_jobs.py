@@ -0,0 +1,179 @@
+"""
+TikTok 스크랩 작업 실행 함수 모음
+
+엔드포인트의 동기 실행 경로와 비동기 작업(Job) 경로가 같은 로직을 사용하도록
+스크랩 엔드포인트의 본문을 (db, request, progress) 형태의 함수로 분리
+"""
+import os
+from datetime import datetime
+from typing import Dict, Optional
+
+import requests
+from sqlalchemy.orm import Session
+
+from app.models.tiktok import TikTokRepostVideo, TikTokBrandAccount
+from app.schemas.tiktok import ScrapeRequest, ScrapeVideoRequest, CollectRepostUsersRequest
+from app.services.job_manager import job_manager, JobProgress
+from app.services.tiktok_service import TikTokService
+from app.utils.endpoint_helpers import get_session_file_path, TikTokEndpointHelper
+
+
+def run_scrape_users(db: Session, request: ScrapeRequest, progress: Optional[JobProgress] = None) -> Dict:
+    """키워드 검색 사용자 스크랩"""
+    tiktok_service = TikTokService(db_session=db, progress=progress)
+    return tiktok_service.scrape_users(
+        request.keyword,
+        request.min_followers,
+        request.scrolls,
+        True,
+        request.tiktok_user_log_id,
+        request.max_users,
+        request.adaptive_scroll or False,
+        request.min_yield
+    )
+
+
+def run_scrape_videos(db: Session, request: ScrapeVideoRequest, progress: Optional[JobProgress] = None) -> Dict:
+    """사용자 비디오 스크랩"""
+    # 비디오 스크래핑 파라미터 준비 (세션 파일 포함)
+    params = TikTokEndpointHelper.prepare_video_scraping_params(request, db)
+    print(f"Final session file: {params['session_file']}")
+
+    tiktok_service = TikTokService(db_session=db, progress=progress)
+    return tiktok_service.scrape_user_videos(
+        params['usernames'],
+        params['use_session'],
+        params['session_file'],
+        request.concurrency or 1,
+        request.incremental or False
+    )
+
+
+def run_scrape_repost_videos(db: Session, request: ScrapeVideoRequest, progress: Optional[JobProgress] = None) -> Dict:
+    """사용자 리포스트 비디오 스크랩 후 관리페이지 콜백"""
+    # sender_id가 있으면 DB에서 해당 세션 파일 경로 조회, request 에 직접 전달된 경로가 있으면 우선 사용
+    session_file_path = get_session_file_path(db, request.sender_id)
+    if request.session_file:
+        session_file_path = request.session_file
+        print(f"Using session file from request: {session_file_path}")
+
+    tiktok_service = TikTokService(db_session=db, progress=progress)
+    result = tiktok_service.scrape_user_repost_videos(
+        request.usernames,
+        request.use_session,
+        session_file_path if session_file_path else "tiktok_auth.json",
+        request.concurrency or 1,
+        request.incremental or False
+    )
+
+    # 응답에 타임스탬프 추가
+    result["timestamp"] = datetime.now().isoformat()
+    result["request_info"] = {
+        "total_users": len(request.usernames),
+        "use_session": request.use_session,
+        "sender_id": request.sender_id,
+        "concurrency": request.concurrency or 1,
+        "incremental": request.incremental or False
+    }
+
+    # 리포스트 수집이 완료되면 관리페이지에 콜백
+    try:
+        admin_url = os.getenv("ADMIN_URL", "https://example.com")
+        callback_url = f"{admin_url}/api/tiktok/callback-collect-repost-users"
+        callback_data = {"limit": 100}
+
+        response = requests.post(callback_url, json=callback_data, timeout=10)
+
+        if response.status_code == 200:
+            print(f"✅ 관리페이지 콜백 성공: {callback_url}")
+            result["callback_status"] = "success"
+        else:
+            print(f"⚠️ 관리페이지 콜백 실패: {response.status_code}")
+            result["callback_status"] = f"failed: {response.status_code}"
+
+    except Exception as callback_error:
+        print(f"❌ 관리페이지 콜백 오류: {callback_error}")
+        result["callback_status"] = f"error: {str(callback_error)}"
+
+    return result
+
+
+def run_brand_repost_videos(db: Session, request: ScrapeVideoRequest, progress: Optional[JobProgress] = None) -> Dict:
+    """브랜드 계정들의 리포스트 비디오 수집 (하나의 브라우저 세션에서 계정을 차례로 방문)"""
+    tiktok_service = TikTokService(db_session=db, progress=progress)
+
+    return tiktok_service.scrape_brand_repost_videos_batch(
+        request.usernames,
+        request.max_videos or 20,
+        request.use_session or False,
+        request.session_file or "tiktok_auth.json",
+        request.deep_pagination or False
+    )
+
+
+def run_collect_repost_users(db: Session, request: CollectRepostUsersRequest, progress: Optional[JobProgress] = None) -> Dict:
+    """미확인 리포스트 비디오의 원본 사용자 정보 수집"""
+    # 미확인 리포스트 비디오 조회
+    unchecked_videos = db.query(TikTokRepostVideo).filter(
+        TikTokRepostVideo.is_checked == 'N'
+    ).limit(request.limit).all()
+
+    if not unchecked_videos:
+        return {
+            "message": "No unchecked videos found",
+            "processed": 0
+        }
+
+    # 비디오 데이터 준비 (브랜드 계정 정보 포함)
+    video_data_list = []
+    for video in unchecked_videos:
+        # 브랜드 계정의 country 값 조회
+        brand_account = db.query(TikTokBrandAccount).filter(
+            TikTokBrandAccount.id == video.tiktok_brand_account_id
+        ).first()
+
+        video_data_list.append({
+            "video_url": video.video_url,
+            "video_id": video.id,
+            "country": brand_account.country if brand_account else None
+        })
+
+    # 브라우저를 재사용하여 여러 사용자 정보 수집
+    tiktok_service = TikTokService(db_session=db, progress=progress)
+    result = tiktok_service.collect_multiple_users_from_videos(
+        video_data_list,
+        request.user_agent,
+        request.session_file
+    )
+
+    return {
+        "message": "User collection completed",
+        "processed": result.get('processed', 0),
+        "collected_users": result.get('collected_users', []),
+        "failed_videos": result.get('failed_videos', []),
+        "total_unchecked": len(unchecked_videos),
+        "resource_blocking": result.get('resource_blocking')
+    }
+
+
+# 비동기 작업 핸들러 등록 (params 는 요청 스키마의 dict)
+job_manager.register(
+    "scrape_users",
+    lambda db, params, progress: run_scrape_users(db, ScrapeRequest(**params), progress)
+)
+job_manager.register(
+    "scrape_videos",
+    lambda db, params, progress: run_scrape_videos(db, ScrapeVideoRequest(**params), progress)
+)
+job_manager.register(
+    "scrape_repost_videos",
+    lambda db, params, progress: run_scrape_repost_videos(db, ScrapeVideoRequest(**params), progress)
+)
+job_manager.register(
+    "brand_repost_videos",
+    lambda db, params, progress: run_brand_repost_videos(db, ScrapeVideoRequest(**params), progress)
+)
+job_manager.register(
+    "collect_repost_users",
+    lambda db, params, progress: run_collect_repost_users(db, CollectRepostUsersRequest(**params), progress)
+)
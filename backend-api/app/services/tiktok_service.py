@@ -3,6 +3,7 @@ import json
 import random
 import time
 import asyncio
+import threading
 from contextlib import contextmanager
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
@@ -11,6 +12,9 @@ from sqlalchemy.orm import Session
 from app.models.tiktok import TikTokUserRepository, TikTokUserLog, TikTokMessageLog, TikTokMessage, TikTokUser, TikTokVideo, TikTokUploadRequest, TikTokBrandAccount, TikTokRepostVideo
 from app.core.config import settings
 from app.services.browser_manager import AsyncBrowserManager, SyncBrowserManager, TikTokBrowserConfig
+from app.services.browser_loop import browser_loop
+from app.services.scrape_pipeline import ScrapePipeline
+from app.services.known_user_index import known_user_index
 from app.services.tiktok_utils import (
     TikTokDataParser, TikTokWaitUtils, TikTokImageUtils, 
     TikTokDatabaseUtils, TikTokValidationUtils, TikTokUrlUtils
@@ -37,49 +41,148 @@ load_dotenv()
 
 class TikTokService:
     """TikTok 데이터 수집 및 처리를 위한 서비스 클래스 (Windows 호환)"""
+
+    # 응답 캡처 시에만 채워지는 비디오 통계 필드
+    CAPTURED_STAT_FIELDS = ('posted_at', 'like_count', 'comment_count', 'share_count')
+
+    # 이미지 업로드 후 URL 을 기록할 테이블/컬럼
+    IMAGE_URL_COLUMNS = {
+        'user': ('tiktok_users', 'profile_image'),
+        'video': ('tiktok_videos', 'thumbnail_url'),
+        'repost_video': ('tiktok_repost_videos', 'thumbnail_url')
+    }
+
+    # 브랜드 리포스트 수집 결과 통계 키 (배치 수집 시 합산)
+    BRAND_STAT_KEYS = ('total_videos', 'new_videos', 'updated_videos', 'errors')
     
     # === INITIALIZATION ===
-    def __init__(self, db_session: Optional[Session] = None):
+    def __init__(self, db_session: Optional[Session] = None, progress=None):
         self.db_session = db_session
+
+        # 비동기 작업(Job) 진행 카운터 (update(**counters) 를 제공하는 객체, 없으면 무시)
+        self.progress = progress
         
         # 메시지 템플릿 매니저 초기화
         self.template_manager = TikTokMessageTemplateManager()
         
         # 데이터베이스 핸들러 초기화
         self.db_handler = TikTokDatabaseHandler(db_session) if db_session else None
+
+        # 이미지 URL 갱신을 모아 커밋하는 UnitOfWork (업로드 워커 스레드용 별도 세션, 처음 사용할 때 생성)
+        self._image_url_uow = None
+        self._image_url_lock = threading.Lock()
         
         # 이미지 저장 디렉토리 설정
         self.image_base_dir = Path("tiktok_images")
         self.image_base_dir.mkdir(exist_ok=True)
 
+    def _report_progress(self, **counters) -> None:
+        """작업 진행 카운터 갱신 (progress 가 없으면 아무것도 하지 않음)"""
+        if not self.progress:
+            return
+        try:
+            self.progress.update(**counters)
+        except Exception as e:
+            print(f"⚠️ 진행 상태 갱신 실패: {e}")
+
     # === USER MANAGEMENT & SCRAPING ===
-    def scrape_users(self, keyword: str, min_followers: int = 10000, scrolls: int = 5, save_to_db: bool = True, tiktok_user_log_id: int = None) -> Dict:
+    def scrape_users(self, keyword: str, min_followers: int = 10000, scrolls: int = 5, save_to_db: bool = True, tiktok_user_log_id: int = None, max_users: Optional[int] = None, adaptive_scroll: bool = False, min_yield: Optional[float] = None) -> Dict:
         """TikTok 사용자 검색 및 데이터 수집
         
         Args:
             keyword: 검색 키워드
             min_followers: 최소 팔로워 수
-            scrolls: 스크롤 횟수
+            scrolls: 최대 스크롤 횟수 (새 카드가 더 나오지 않으면 먼저 종료)
             save_to_db: 데이터베이스 저장 여부
             tiktok_user_log_id: TikTok 사용자 로그 ID
+            max_users: 검색 카드를 이 개수만큼 확인하면 스크롤 종료 (None 이면 제한 없음)
+            adaptive_scroll: 새 카드 중 min_followers 통과 비율(수율)이 min_yield 미만인 스크롤이
+                ADAPTIVE_SCROLL_PATIENCE 회 연속되면 스크롤 종료
+            min_yield: 적응형 스크롤 수율 기준 (None 이면 ADAPTIVE_SCROLL_MIN_YIELD 설정값)
             
         Returns:
             수집된 사용자 데이터와 통계
         """
         
+        yield_threshold = settings.ADAPTIVE_SCROLL_MIN_YIELD if min_yield is None else min_yield
+
+        # 저장된 사용자 인덱스 갱신 (변경 없는 사용자는 저장 단계 전체 생략)
+        use_index = False
+        if save_to_db and self.db_session:
+            try:
+                known_user_index.refresh(self.db_session)
+                use_index = True
+            except Exception as e:
+                self.db_session.rollback()
+                print(f"⚠️ 저장된 사용자 인덱스 갱신 실패, 모든 사용자를 저장 단계로 보냅니다: {e}")
+
         async def _scrape_users_async():
             """내부 비동기 사용자 스크래핑 함수"""
             results = {
                 'data': [],
                 'search_user_count': 0,
                 'save_user_count': 0,
+                'unchanged_user_count': 0,
                 'db_stats': None
             }
+            # 이번 검색에서 이미 처리한 username (카드 중복 제거)
+            seen_usernames = set()
+            # 스크롤별 수율 곡선 (TikTokUserLog.scroll_yield_curve 에 기록)
+            yield_curve = {
+                'adaptive': adaptive_scroll,
+                'min_yield': yield_threshold if adaptive_scroll else None,
+                'stop_reason': None,
+                'scrolls': []
+            }
+            results['scroll_yield_curve'] = yield_curve
+
+            def write_users(batch: List[Dict]) -> List[Dict]:
+                """파이프라인 DB 단계: 사용자 배치 저장 후 프로필 이미지 업로드 작업 반환"""
+                stats, image_tasks = self._save_user_batch(batch)
+                results['save_user_count'] += stats.get('created', 0)
+                known_user_index.remember(batch)
+                return image_tasks
+
+            # 추출 → DB 배치 저장 → 로컬 프로필 이미지 확인 → 관리페이지 업로드
+            pipeline = ScrapePipeline(
+                "scrape_users",
+                write_batch=write_users,
+                download=self._find_local_profile_image,
+                upload=self._upload_image_task,
+                on_finish=self._flush_image_urls
+            ) if save_to_db and self.db_session else None
+            round_state = {'qualified': 0, 'low_yield_streak': 0}
+
+            def on_round_end(new_count: int) -> bool:
+                """스크롤 한 번 분량 처리 후 수율 기록, 적응형이면 계속 스크롤할지 결정"""
+                qualified = round_state['qualified']
+                round_yield = qualified / new_count if new_count else 0.0
+                yield_curve['scrolls'].append({
+                    'scroll': len(yield_curve['scrolls']),
+                    'new': new_count,
+                    'qualified': qualified,
+                    'yield': round(round_yield, 3)
+                })
+                round_state['qualified'] = 0
+
+                if not adaptive_scroll:
+                    return True
+                round_state['low_yield_streak'] = round_state['low_yield_streak'] + 1 if round_yield < yield_threshold else 0
+                if round_state['low_yield_streak'] >= settings.ADAPTIVE_SCROLL_PATIENCE:
+                    print(f"📉 수율 {round_yield:.1%} < {yield_threshold:.1%} 가 {round_state['low_yield_streak']}회 연속, 스크롤 종료")
+                    return False
+                return True
 
             try:
+                if pipeline:
+                    pipeline.start()
                 async with AsyncBrowserManager() as browser_manager:
-                    # 브라우저 초기화 (비로그인 상태로 검색, 헤드리스 모드)
-                    await browser_manager.initialize(headless=False, session_file=None)
+                    # 브라우저 초기화 (비로그인 상태로 검색, 헤드리스 모드, 텍스트만 필요하므로 리소스 차단)
+                    await browser_manager.initialize(
+                        headless=False,
+                        session_file=None,
+                        block_resources=TikTokBrowserConfig.text_only_block_resources()
+                    )
                     print("⚠️ 비로그인 상태로 검색을 실행합니다. (헤드리스 모드)")
                     
                     # TikTok 메인 페이지로 이동하여 세션 활성화
@@ -89,87 +192,135 @@ class TikTokService:
         
                     # TikTok 검색 페이지로 이동
                     print(f"🔍 '{keyword}' 검색을 시작합니다...")
-                    await page.goto(f"https://www.tiktok.com/search/user?q={keyword}", wait_until="load")
-                    await page.wait_for_timeout(5000)
-        
-                    # 자동 스크롤
-                    await browser_manager.auto_scroll_async(scrolls=scrolls)
-        
-                    # 사용자 데이터 수집 - 다양한 셀렉터 시도
-                    users = await page.query_selector_all('div[data-e2e="search-user-container"]')
-
-                    # 대체 셀렉터 시도
-                    if len(users) == 0:
-                        print("⚠️ search-user-container를 찾을 수 없음. 대체 셀렉터 시도...")
-                        users = await page.query_selector_all('div[data-e2e="search-user-item"]')
+                    await browser_manager.goto(f"https://www.tiktok.com/search/user?q={keyword}", wait_until="load")
+                    await browser_manager.wait_for_search_results()
+
+                    async def resolve_followers(username: str, followers: int) -> int:
+                        """응답 캡처 사용 시 검색 API 의 정확한 팔로워 수로 교체 ("1.2M" 반올림 보정)"""
+                        if browser_manager.capture:
+                            await browser_manager.capture.drain()
+                            captured = browser_manager.capture.get_user(username)
+                            if captured and captured.get('followers') is not None:
+                                return captured['followers']
+                        return followers
+
+                    async def qualifies(card: Dict) -> bool:
+                        """1단계: 사용자명/팔로워 수만으로 min_followers 통과 여부 판단 (통과한 카드만 나머지 필드 추출)"""
+                        username = (card.get('username') or '').replace('@', '').strip()
+                        if not username or card.get('followers') is None:
+                            return False
+                        followers = await resolve_followers(username, TikTokDataParser.parse_count(card['followers']))
+                        return followers >= min_followers
+
+                    async def process_candidate(user_data: Optional[Dict]) -> None:
+                        """카드 하나를 필터링하고 즉시 DB에 저장 (None 이면 검색 카드 수만 집계)"""
+                        if user_data:
+                            user_data['followers'] = await resolve_followers(user_data['username'], user_data['followers'])
 
-                    if len(users) == 0:
-                        print("⚠️ search-user-item도 찾을 수 없음. 다른 셀렉터 시도...")
-                        users = await page.query_selector_all('div[class*="UserItemContainer"]')
+                        if user_data and user_data['followers'] >= min_followers:
+                            round_state['qualified'] += 1
 
-                    if len(users) == 0:
-                        print("⚠️ UserItemContainer도 찾을 수 없음. a 태그로 시도...")
-                        users = await page.query_selector_all('a[href*="/@"][class*="StyledLink"]')
+                            # 중복 체크
+                            if user_data['username'] not in seen_usernames:
+                                seen_usernames.add(user_data['username'])
+                                results['data'].append(user_data)
+        
+                                if use_index and known_user_index.is_unchanged(user_data['username'], user_data['followers']):
+                                    # 이미 저장된 사용자이고 팔로워 수도 같으면 DB/이미지 작업 생략
+                                    results['unchanged_user_count'] += 1
+                                    print(f"⏭️ 변경 없음 : {user_data['username']} ({user_data['followers']:,})", flush=True)
+                                # DB 저장은 파이프라인으로 넘기고 바로 다음 카드 처리
+                                elif pipeline:
+                                    print(f"사용자 저장 대기열 추가 : {user_data['username']} ({user_data['followers']:,})", flush=True)
+                                    await pipeline.put(user_data)
+                                else:
+                                    results['save_user_count'] += 1
+                                    print(f"✔ {user_data['username']} ({user_data['followers']:,})", flush=True)
 
-                    results['search_user_count'] = len(users)
+                        results['search_user_count'] += 1
+                        self._report_progress(processed=results['search_user_count'], saved=results['save_user_count'])
+
+                    # 스크롤하면서 새로 나타난 카드만 두 단계로 추출해 바로 처리
+                    # (사용자명/팔로워 수 → 기준 통과 카드만 나머지 필드와 프로필 이미지)
+                    async for raw in browser_manager.iter_search_user_cards(max_scrolls=scrolls, target_count=max_users, on_round_end=on_round_end, qualify=qualifies):
+                        user_data = self._build_search_user_data(raw, keyword) if raw['details_loaded'] else None
+                        await process_candidate(user_data)
+
+                    scroll_stats = browser_manager.last_scroll_stats
+                    yield_curve['stop_reason'] = scroll_stats['stop_reason']
+                    if scroll_stats['stop_reason'] == 'extract_failed' and results['search_user_count'] == 0:
+                        # 일괄 추출 실패 시 기존 방식(전체 스크롤 후 요소별 추출)으로 대체
+                        await browser_manager.auto_scroll_async(scrolls=scrolls)
+                        users = []
+                        for selector in TikTokBrowserConfig.SEARCH_USER_CONTAINER_SELECTORS:
+                            users = await page.query_selector_all(selector)
+                            if users:
+                                break
+                            print(f"⚠️ {selector} 를 찾을 수 없음. 대체 셀렉터 시도...")
+                        for block in users:
+                            raw = await self._extract_user_summary_async(block)
+                            if raw and await qualifies(raw):
+                                await self._extract_user_details_async(block, raw)
+                                await process_candidate(self._build_search_user_data(raw, keyword))
+                            else:
+                                await process_candidate(None)
+                    else:
+                        results['scroll_stats'] = scroll_stats
 
                     print(f"🔍 감지된 사용자: {results['search_user_count']}명", flush=True)
+                    self._report_progress(total=results['search_user_count'])
 
                     # 페이지 스크린샷 저장 (디버깅용)
                     if results['search_user_count'] == 0:
                         await page.screenshot(path=f'debug_search_{keyword}_no_results.png')
                         print(f"📸 디버그 스크린샷 저장: debug_search_{keyword}_no_results.png")
-        
-                    for block in users:
-                        user_data = await self._extract_user_data_async(block, keyword)
-                        if user_data and user_data['followers'] >= min_followers:
-                            # 중복 체크
-                            if not any(d.get("username") == user_data['username'] for d in results['data']):
-                                results['data'].append(user_data)
-        
-                                # 즉시 DB에 저장 (한 건씩)
-                                if save_to_db and self.db_session:
-                                    print(f"사용자 저장시도 : {user_data['username']}", flush=True)
-                                    save_result = self._save_single_user(user_data)
-                                    if save_result.get('created') == 1:
-                                        results['save_user_count'] += 1
-                                        print(f"✔ {user_data['username']} ({user_data['followers']:,}) - 저장 완료", flush=True)
-                                    elif save_result.get('updated') == 1:
-                                        print(f"↻ {user_data['username']} ({user_data['followers']:,}) - 업데이트 완료", flush=True)
-                                    else:
-                                        print(f"⬬ {user_data['username']} ({user_data['followers']:,}) - 스킵", flush=True)
-                                else:
-                                    results['save_user_count'] += 1
-                                    print(f"✔ {user_data['username']} ({user_data['followers']:,})", flush=True)
-        
-                        await page.wait_for_timeout(random.uniform(1000, 2000))
-                    
-                    print("\n" + "=" * 60)
-                    print("✅ 사용자 스크래핑 완료!")
-                    print("=" * 60)
-                    
-                    return results
+
+                    # 리소스 차단 통계 기록
+                    blocked = browser_manager.blocked_resource_stats()
+                    if blocked:
+                        results['resource_blocking'] = blocked
+                        self._report_progress(
+                            blocked_requests=blocked['blocked_requests'],
+                            estimated_bytes_saved=blocked['estimated_bytes_saved']
+                        )
+
+                # 브라우저 반납 후 남은 DB 저장/이미지 업로드 마무리
+                if pipeline:
+                    results['pipeline_stats'] = await pipeline.finish()
+                    self._report_progress(saved=results['save_user_count'])
+
+                print("\n" + "=" * 60)
+                print("✅ 사용자 스크래핑 완료!")
+                print("=" * 60)
+                
+                return results
         
             except Exception as e:
                 print(f"❗스크래핑 오류: {e}")
                 import traceback
                 traceback.print_exc()
                 results['error'] = str(e)
+                yield_curve['stop_reason'] = 'error'
+
+                # 이미 추출한 사용자는 끝까지 저장
+                if pipeline:
+                    results['pipeline_stats'] = await pipeline.finish()
                 
                 # 에러 발생 시 로그 업데이트
                 if tiktok_user_log_id and self.db_session:
                     self._update_user_log(tiktok_user_log_id, {
                         'search_user_count': results['search_user_count'],
                         'save_user_count': results['save_user_count'],
+                        'scroll_yield_curve': yield_curve,
                         'is_error': True
                     })
                     
                 return results
         
-        # 비동기 함수 실행
-        result = asyncio.run(_scrape_users_async())
+        # 브라우저 루프에서 비동기 함수 실행
+        result = browser_loop.run(_scrape_users_async())
         
-        # 최종 통계 (이미 개별 저장했으므로 통계만 반환)
+        # 최종 통계 (파이프라인에서 이미 저장했으므로 통계만 반환)
         if save_to_db and self.db_session:
             result['db_stats'] = {
                 'created': result['save_user_count'],
@@ -181,6 +332,7 @@ class TikTokService:
                 self._update_user_log(tiktok_user_log_id, {
                     'search_user_count': result['search_user_count'],
                     'save_user_count': result['save_user_count'],
+                    'scroll_yield_curve': result.get('scroll_yield_curve'),
                     'is_error': False
                 })
 
@@ -197,6 +349,19 @@ class TikTokService:
         Returns:
             사용자 데이터 딕셔너리 또는 None
         """
+        raw = await self._extract_user_summary_async(block)
+        if not raw:
+            return None
+        await self._extract_user_details_async(block, raw)
+        return self._build_search_user_data(raw, keyword)
+
+    async def _extract_user_summary_async(self, block) -> Optional[Dict]:
+        """
+        사용자 블록에서 필터링에 필요한 사용자명/팔로워 수만 추출합니다 (1단계)
+
+        Returns:
+            {username, followers} 원시 텍스트 또는 None (사용자명이 없거나 오류)
+        """
         try:
             # 사용자명 추출 - 다양한 셀렉터 시도
             username_elem = await block.query_selector('p[data-e2e="search-user-unique-id"]')
@@ -210,14 +375,7 @@ class TikTokService:
                 print("⚠️ 사용자명을 찾을 수 없음")
                 return None
 
-            username = await username_elem.inner_text()
-            username = username.replace('@', '').strip()  # @ 기호 제거
-
-            # 닉네임 추출
-            nickname_elem = await block.query_selector('p[data-e2e="search-user-nickname"]')
-            if not nickname_elem:
-                nickname_elem = await block.query_selector('h4[data-e2e="search-user-nickname"]')
-            nickname = await nickname_elem.inner_text() if nickname_elem else username
+            raw = {'username': await username_elem.inner_text()}
 
             # 팔로워 수 추출 - search-follow-count 셀렉터 우선 시도
             followers_elem = await block.query_selector('span[data-e2e="search-follow-count"]')
@@ -231,39 +389,40 @@ class TikTokService:
             if not followers_elem:
                 # "팔로워" 텍스트를 포함하는 요소 찾기
                 followers_elem = await block.query_selector('span:has-text("팔로워"), strong:has-text("팔로워")')
-            if not followers_elem:
-                print(f"⚠️ {username}의 팔로워 수를 찾을 수 없음")
-                return None
+            raw['followers'] = await followers_elem.inner_text() if followers_elem else None
 
-            followers_text = await followers_elem.inner_text()
-            followers = TikTokDataParser.parse_count(followers_text)
+            return raw
+
+        except Exception as e:
+            print(f"❗사용자 데이터 추출 오류: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+
+    async def _extract_user_details_async(self, block, raw: Dict) -> None:
+        """
+        기준을 통과한 사용자 블록에서 닉네임/소개/프로필 URL/프로필 이미지를 추출해 raw 에 채웁니다 (2단계)
+
+        오류가 나면 읽은 필드까지만 채웁니다 (빈 필드는 _build_search_user_data 에서 기본값 사용).
+        """
+        try:
+            # 닉네임 추출
+            nickname_elem = await block.query_selector('p[data-e2e="search-user-nickname"]')
+            if not nickname_elem:
+                nickname_elem = await block.query_selector('h4[data-e2e="search-user-nickname"]')
+            raw['nickname'] = await nickname_elem.inner_text() if nickname_elem else None
 
             # 소개 추출 (선택사항)
             bio_elem = await block.query_selector('[data-e2e="search-user-desc"]')
             if not bio_elem:
                 bio_elem = await block.query_selector('span[class*="SpanText"]')
-            bio = await bio_elem.inner_text() if bio_elem else ''
+            raw['bio'] = await bio_elem.inner_text() if bio_elem else None
 
             # 프로필 URL 추출
             profile_link = await block.query_selector('a[data-e2e="search-user-container"]')
             if not profile_link:
                 profile_link = await block.query_selector('a[href*="/@"]')
-
-            profile_url = ''
-            if profile_link:
-                href = await profile_link.get_attribute('href')
-                if href:
-                    # 상대 경로인 경우 전체 URL로 변환
-                    if href.startswith('/'):
-                        profile_url = f"https://www.tiktok.com{href}"
-                    elif not href.startswith('http'):
-                        profile_url = f"https://www.tiktok.com/{href}"
-                    else:
-                        profile_url = href
-
-            # profile_link가 없는 경우 username으로 URL 생성
-            if not profile_url and username:
-                profile_url = f"https://www.tiktok.com/@{username}"
+            raw['href'] = await profile_link.get_attribute('href') if profile_link else None
 
             # 프로필 이미지 URL 추출 - search-user-avatar 내부의 img 태그 찾기
             avatar_container = await block.query_selector('[data-e2e="search-user-avatar"]')
@@ -274,24 +433,60 @@ class TikTokService:
                 profile_img_elem = await block.query_selector('img[data-e2e="search-user-avatar"]')
                 if not profile_img_elem:
                     profile_img_elem = await block.query_selector('img[class*="Avatar"]')
+            raw['profile_image_url'] = await profile_img_elem.get_attribute('src') if profile_img_elem else None
 
-            profile_image_url = await profile_img_elem.get_attribute('src') if profile_img_elem else ''
-            
-            return {
-                'username': username,
-                'nickname': nickname,
-                'followers': followers,
-                'profile_url': profile_url,
-                'bio': bio,
-                'keyword': keyword,
-                'profile_image_url': profile_image_url
-            }
-            
         except Exception as e:
-            print(f"❗사용자 데이터 추출 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            print(f"❗사용자 상세 정보 추출 오류: {e}")
+
+    @staticmethod
+    def _build_search_user_data(raw: Dict, keyword: str) -> Optional[Dict]:
+        """
+        검색 카드에서 읽은 원시 값을 사용자 데이터로 정규화
+
+        Args:
+            raw: {username, nickname, followers, bio, href, profile_image_url} 원시 텍스트
+            keyword: 검색 키워드
+
+        Returns:
+            사용자 데이터 딕셔너리 또는 None (사용자명/팔로워 수가 없는 경우)
+        """
+        username = (raw.get('username') or '').replace('@', '').strip()  # @ 기호 제거
+        if not username:
+            print("⚠️ 사용자명을 찾을 수 없음")
+            return None
+
+        if raw.get('followers') is None:
+            print(f"⚠️ {username}의 팔로워 수를 찾을 수 없음")
             return None
+        followers = TikTokDataParser.parse_count(raw['followers'])
+
+        nickname = raw.get('nickname') or username
+        bio = raw.get('bio') or ''
+
+        profile_url = ''
+        href = raw.get('href')
+        if href:
+            # 상대 경로인 경우 전체 URL로 변환
+            if href.startswith('/'):
+                profile_url = f"https://www.tiktok.com{href}"
+            elif not href.startswith('http'):
+                profile_url = f"https://www.tiktok.com/{href}"
+            else:
+                profile_url = href
+
+        # profile_link가 없는 경우 username으로 URL 생성
+        if not profile_url:
+            profile_url = f"https://www.tiktok.com/@{username}"
+
+        return {
+            'username': username,
+            'nickname': nickname,
+            'followers': followers,
+            'profile_url': profile_url,
+            'bio': bio,
+            'keyword': keyword,
+            'profile_image_url': raw.get('profile_image_url') or ''
+        }
 
     def _extract_user_data(self, block, keyword: str) -> Optional[Dict]:
         """사용자 블록에서 데이터 추출
@@ -341,62 +536,86 @@ class TikTokService:
             print(f"❗데이터 추출 오류: {e}")
             return None
 
-    def _save_single_user(self, user_data: Dict) -> Dict:
-        """단일 사용자 데이터를 데이터베이스에 저장
+    def _save_user_batch(self, users_data: List[Dict]) -> Tuple[Dict, List[Dict]]:
+        """사용자 배치를 데이터베이스에 저장
         
         Args:
-            user_data: 저장할 사용자 데이터
+            users_data: 저장할 사용자 데이터 리스트
             
         Returns:
-            저장 결과
+            (저장 결과 통계, 프로필 이미지 업로드 작업 리스트)
         """
+        repo = TikTokUserRepository(self.db_session)
+        stats = repo.upsert_from_scrape(users_data)
+        print(f"💾 사용자 {len(users_data)}명 저장 (생성 {stats['created']}, 업데이트 {stats['updated']}, 스킵 {stats['skipped']})", flush=True)
+
+        # 프로필 이미지가 있는 사용자는 관리페이지 업로드 대상
+        image_tasks = [
+            {'username': u['username'], 'record_id': stats['ids'][u['username']], 'table_type': 'user'}
+            for u in {u['username']: u for u in users_data if u.get('username')}.values()
+            if u.get('profile_image') and u['username'] in stats['ids']
+        ]
+        return stats, image_tasks
+
+    def _find_local_profile_image(self, task: Dict) -> Optional[str]:
+        """이미 다운로드된 프로필 이미지 파일 경로 (가장 최근 파일, 없으면 None)"""
+        user_dir = self.image_base_dir / task['username']
+        existing_profiles = list(user_dir.glob("profile_*")) if user_dir.exists() else []
+        if not existing_profiles:
+            print(f"❗ 프로필 이미지 파일이 없어 관리페이지 업로드 불가: {task['username']}")
+            return None
+        return str(existing_profiles[-1])
+
+    def _download_thumbnail(self, task: Dict) -> Optional[str]:
+        """비디오 썸네일 다운로드"""
+        return TikTokImageUtils.download_image(task['url'], task['username'], task['image_type'], self.image_base_dir)
+
+    def _upload_image_task(self, task: Dict, local_path: str) -> Optional[str]:
+        """로컬 이미지를 관리페이지에 업로드하고 URL 컬럼 갱신을 UnitOfWork 에 추가 (워커 스레드용 별도 세션 사용)
         
-        try:
-            # 프로필 이미지 처리 (기존 다운로드된 파일 확인)
-            username = user_data.get('username', '')
-            original_profile_image = user_data.get('profile_image')
-            local_profile_path = None
-            
-            if original_profile_image and username:
-                # 이미 다운로드된 프로필 이미지가 있는지 확인
-                user_dir = self.image_base_dir / username
-                if user_dir.exists():
-                    # profile_로 시작하는 파일이 있는지 확인
-                    existing_profiles = list(user_dir.glob("profile_*"))
-                    if existing_profiles:
-                        # 가장 최근 파일 사용
-                        local_profile_path = str(existing_profiles[-1])
-            
-            repo = TikTokUserRepository(self.db_session)
-            stats = repo.upsert_from_scrape([user_data])  # 단일 항목 리스트로 전달
-            
-            # 사용자가 새로 생성되거나 업데이트된 경우, 프로필 이미지를 관리페이지에 업로드
-            if username:
-                # 저장된 사용자 레코드 찾기
-                user_record = self.db_session.query(TikTokUser).filter(
-                    TikTokUser.username == username
-                ).first()
-                
-                if user_record:
-                    if local_profile_path:
-                        uploaded_url = self._upload_downloaded_image(
-                            local_profile_path, username, user_record.id, "user"
-                        )
-                        if uploaded_url:
-                            # 테이블 업데이트: profile_image 컬럼에 업로드된 URL 저장
-                            user_record.profile_image = uploaded_url
-                            self.db_session.commit()
-                            print(f"🖼️ 프로필 이미지 관리페이지 업로드 완료 및 테이블 업데이트: user ID {user_record.id}, URL: {uploaded_url}")
-                        else:
-                            print(f"❗ 관리페이지 업로드 실패: {username}")
-                    else:
-                        print(f"❗ 프로필 이미지 파일이 없어 관리페이지 업로드 불가: {username}")
-            
-            return stats
-            
-        except Exception as e:
-            print(f"❗DB 저장 오류: {e}", flush=True)
-            return {'error': str(e)}
+        갱신은 UOW_FLUSH_SIZE 개 또는 UOW_FLUSH_INTERVAL_MS 단위로 커밋되며,
+        남은 것은 _flush_image_urls() (파이프라인 종료 시 on_finish) 에서 커밋 후 세션을 닫습니다.
+
+        Returns:
+            업로드된 이미지 URL 또는 None
+        """
+        from sqlalchemy import text
+
+        uploaded_url = TikTokImageUtils.upload_downloaded_image(
+            local_path, task['username'], task['record_id'], task['table_type'], settings.ADMIN_URL
+        )
+        if not uploaded_url:
+            print(f"❗ 관리페이지 업로드 실패: {task['username']} ({task['table_type']} ID {task['record_id']})")
+            return None
+
+        table, column = self.IMAGE_URL_COLUMNS[task['table_type']]
+        stmt = text(f"UPDATE {table} SET {column} = :url, updated_at = NOW() WHERE id = :record_id")
+        params = {'url': uploaded_url, 'record_id': task['record_id']}
+        self._image_url_writer().add(
+            lambda session: session.execute(stmt, params),
+            label=f"{task['table_type']} ID {task['record_id']}"
+        )
+        print(f"🖼️ 이미지 관리페이지 업로드 완료: {task['table_type']} ID {task['record_id']}")
+        return uploaded_url
+
+    def _image_url_writer(self):
+        """이미지 URL 갱신용 UnitOfWork (없으면 별도 세션으로 생성)"""
+        # 업로드 워커 여러 개가 동시에 처음 호출해도 세션은 하나만 생성
+        with self._image_url_lock:
+            if self._image_url_uow is None:
+                from app.core.database import SessionLocal
+                self._image_url_uow = TikTokDatabaseHandler(SessionLocal()).unit_of_work("image_urls")
+            return self._image_url_uow
+
+    def _flush_image_urls(self) -> None:
+        """남아 있는 이미지 URL 갱신 커밋 후 전용 세션 반납 (다음 수집에서 새로 생성)"""
+        with self._image_url_lock:
+            uow, self._image_url_uow = self._image_url_uow, None
+        if uow is None:
+            return
+        flushed = uow.close()
+        if flushed['applied'] or flushed['failed']:
+            print(f"🖼️ 이미지 URL {flushed['applied']}건 커밋 (실패 {flushed['failed']}건)")
 
     def _update_user_log(self, log_id: int, update_data: Dict) -> None:
         """TikTok 사용자 수집 로그 업데이트
@@ -409,7 +628,7 @@ class TikTokService:
             self.db_handler.update_user_log(log_id, update_data)
 
     # === VIDEO SCRAPING (USER VIDEOS) ===
-    def scrape_user_videos(self, usernames: List[str], use_session: bool = False, session_file: str = "tiktok_sessions/tiktok_session_2_1757409463.json") -> Dict:
+    def scrape_user_videos(self, usernames: List[str], use_session: bool = False, session_file: str = "tiktok_sessions/tiktok_session_2_1757409463.json", concurrency: int = 1, incremental: bool = False) -> Dict:
         """
         여러 TikTok 사용자의 비디오 정보를 스크래핑합니다.
         
@@ -417,6 +636,8 @@ class TikTokService:
             usernames: TikTok 사용자명 리스트
             use_session: 세션 파일 사용 여부
             session_file: 세션 파일 경로
+            concurrency: 동시에 사용할 페이지 수 (1 이면 순서대로 방문)
+            incremental: True 면 지난 수집 이후 새 비디오와 일부 최근 비디오(통계 갱신용)만 처리
             
         Returns:
             사용자별 비디오 정보 딕셔너리
@@ -426,63 +647,53 @@ class TikTokService:
             """내부 비동기 스크래핑 함수"""
             all_results = {}
             db_results = {}
+            incremental_stats = {}
+            pipeline = self._create_video_pipeline("scrape_videos", db_results, incremental_stats=incremental_stats)
 
             try:
-                async with AsyncBrowserManager() as browser_manager:
-                    # 브라우저 초기화
-                    session_file_to_use = session_file if use_session else None
-                    await browser_manager.initialize(headless=False, session_file=session_file_to_use)
-                    
-                    # TikTok 메인 페이지로 이동하여 세션 활성화
-                    await browser_manager.navigate_to_main_page()
-                    
-                    page = browser_manager.page
-                    
-                    # 로그인 상태 확인 (세션 사용 시)
-                    if use_session:
-                        try:
-                            await page.wait_for_selector('[data-e2e="nav-profile"]', timeout=10000)
-                            print("✅ 로그인 상태 확인됨")
-                        except:
-                            print("⚠️ 로그인 세션을 확인할 수 없습니다. 계속 진행합니다.")
-                    
-                    # 각 사용자별로 스크래핑 실행
-                    for idx, username in enumerate(usernames, 1):
-                        print("\n" + "=" * 60)
-                        print(f"[{idx}/{len(usernames)}] '{username}' 사용자 처리 중...")
-                        print("=" * 60)
-                        
-                        # page를 전달하여 스크래핑 함수 호출
-                        results = await self._scrape_single_user_videos_async(browser_manager, username)
-                        all_results[username] = results
-                        
-                        # 각 사용자별로 데이터베이스에 저장
-                        if results:
-                            db_result = self._save_video_results_to_db(results, username)
-                            db_results[username] = db_result
-                        
-                        # 마지막 사용자가 아니면 잠시 대기
-                        if idx < len(usernames):
-                            wait_time = random.uniform(5, 10)
-                            print(f"⏳ 다음 사용자 처리 전 {wait_time:.1f}초 대기...")
-                            await page.wait_for_timeout(wait_time * 1000)
-                    
-                    print("\n" + "=" * 60)
-                    print("✅ 모든 사용자 스크래핑 완료!")
-                    print("=" * 60)
-                    
-                    return {
-                        "success": True,
-                        "total_users": len(usernames),
-                        "results": all_results,
-                        "db_save_results": db_results,
-                        "message": f"Successfully scraped {len(usernames)} users and saved to database"
-                    }
-                    
+                scrape_one = self._scrape_single_user_videos_async
+                if incremental:
+                    # 지난 수집 기준점(최근 저장된 video_url) 까지만 처리
+                    marks = await asyncio.to_thread(self._load_video_high_water_marks, usernames, False)
+                    scrape_one = self._incremental_scraper(scrape_one, marks, incremental_stats)
+
+                pipeline.start()
+                # 프로필 방문 (concurrency > 1 이면 여러 페이지에서 동시에)
+                await self._scrape_profiles_async(
+                    usernames,
+                    scrape_one,
+                    pipeline,
+                    all_results,
+                    session_file=session_file if use_session else None,
+                    use_session=use_session,
+                    concurrency=concurrency,
+                    label="사용자"
+                )
+
+                # 브라우저 반납 후 남은 DB 저장/썸네일 업로드 마무리
+                pipeline_stats = await pipeline.finish()
+
+                print("\n" + "=" * 60)
+                print("✅ 모든 사용자 스크래핑 완료!")
+                print("=" * 60)
+                
+                return {
+                    "success": True,
+                    "total_users": len(usernames),
+                    "results": all_results,
+                    "db_save_results": db_results,
+                    "pipeline_stats": pipeline_stats,
+                    **({"incremental_stats": incremental_stats} if incremental else {}),
+                    "message": f"Successfully scraped {len(usernames)} users and saved to database"
+                }
+
             except Exception as e:
                 print(f"❌ 스크래핑 중 전체 오류 발생: {e}")
                 import traceback
                 traceback.print_exc()
+
+                # 이미 수집한 결과는 끝까지 저장
+                await pipeline.finish()
                 return {
                     "success": False,
                     "error": str(e),
@@ -490,16 +701,245 @@ class TikTokService:
                     "db_save_results": db_results
                 }
         
-        # 비동기 함수 실행
-        return asyncio.run(_scrape_videos())
+        # 브라우저 루프에서 비동기 함수 실행
+        return browser_loop.run(_scrape_videos())
 
-    async def _scrape_single_user_videos_async(self, browser_manager, username: str) -> List[Dict]:
+    async def _scrape_profiles_async(
+        self,
+        usernames: List[str],
+        scrape_one,
+        pipeline: ScrapePipeline,
+        all_results: Dict,
+        session_file: Optional[str] = None,
+        use_session: bool = False,
+        concurrency: int = 1,
+        label: str = "사용자"
+    ) -> None:
+        """
+        여러 프로필을 최대 concurrency 개의 페이지(컨텍스트)에서 수집하고 결과를 파이프라인에 전달합니다.
+
+        concurrency 가 1 이면 기존과 같이 한 페이지에서 순서대로 방문하며 사이마다 politeness_delay 를 둡니다.
+        2 이상이면 각 페이지가 대기열에서 사용자를 가져가 처리하고, 전체 방문 속도는
+        페이지 이동 공유 속도 제한(navigation_limiter)이 맞춥니다.
+        어느 사용자에서든 오류가 나면 남은 사용자는 시작하지 않고 그 오류를 다시 발생시킵니다.
+
+        Args:
+            usernames: 방문할 사용자명 리스트
+            scrape_one: (browser_manager, username) -> 결과 리스트 를 반환하는 async 함수
+            pipeline: 결과를 넘길 ScrapePipeline (항목: (username, results))
+            all_results: 사용자별 결과를 기록할 딕셔너리 (usernames 순서로 채워짐)
+            session_file: 로그인 세션 파일 (없으면 비로그인)
+            use_session: 로그인 상태 확인 여부
+            concurrency: 동시에 사용할 페이지 수 (SCRAPE_MAX_CONCURRENCY 로 제한)
+            label: 로그 표시용 이름
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for idx, username in enumerate(usernames, 1):
+            queue.put_nowait((idx, username))
+
+        workers = max(1, min(concurrency or 1, settings.SCRAPE_MAX_CONCURRENCY, len(usernames)))
+        collected: Dict[str, List[Dict]] = {}
+        errors: List[Exception] = []
+        processed = 0
+
+        async def worker(worker_id: int):
+            nonlocal processed
+            prefix = f"[페이지 {worker_id}] " if workers > 1 else ""
+            try:
+                async with AsyncBrowserManager() as browser_manager:
+                    # 브라우저 초기화
+                    await browser_manager.initialize(headless=False, session_file=session_file)
+
+                    # TikTok 메인 페이지로 이동하여 세션 활성화
+                    await browser_manager.navigate_to_main_page()
+
+                    # 로그인 상태 확인 (세션 사용 시)
+                    if use_session:
+                        if await browser_manager.wait_for_selector_ready('[data-e2e="nav-profile"]', timeout=10000):
+                            print(f"{prefix}✅ 로그인 상태 확인됨")
+                        else:
+                            print(f"{prefix}⚠️ 로그인 세션을 확인할 수 없습니다. 계속 진행합니다.")
+
+                    while not errors and not queue.empty():
+                        idx, username = queue.get_nowait()
+                        print("\n" + "=" * 60)
+                        print(f"{prefix}[{idx}/{len(usernames)}] '{username}' {label} 처리 중...")
+                        print("=" * 60)
+
+                        results = await scrape_one(browser_manager, username)
+                        collected[username] = results
+
+                        # DB 저장/썸네일 업로드는 파이프라인에서 처리하고 바로 다음 사용자로 진행
+                        if results:
+                            await pipeline.put((username, results))
+
+                        processed += 1
+                        self._report_progress(processed=processed, current_username=username)
+
+                        # 한 페이지로 순서대로 방문할 때는 사용자 사이 방문 간격 유지
+                        if workers == 1 and not queue.empty():
+                            await browser_manager.politeness_delay("다음 사용자 처리")
+            except Exception as e:
+                errors.append(e)
+
+        self._report_progress(total=len(usernames), processed=0, concurrency=workers)
+        if workers > 1:
+            print(f"🧵 {workers}개 페이지로 {len(usernames)}명 동시 수집")
+        try:
+            await asyncio.gather(*(worker(worker_id) for worker_id in range(1, workers + 1)))
+        finally:
+            # 요청 순서대로 결과 기록 (동시 모드에서도 응답 형태 동일)
+            for username in usernames:
+                if username in collected:
+                    all_results[username] = collected[username]
+
+        if errors:
+            raise errors[0]
+
+    def _create_video_pipeline(
+        self,
+        name: str,
+        db_results: Dict,
+        is_repost: bool = False,
+        incremental_stats: Optional[Dict] = None
+    ) -> ScrapePipeline:
+        """
+        사용자별 비디오 결과 저장 파이프라인 (DB 기록 → 썸네일 다운로드 → 관리페이지 업로드)
+
+        항목은 (username, results) 이며 사용자별 저장 결과는 db_results 에 기록됩니다.
+        증분 수집이면 results 는 선택된 일부 항목이므로 기준점은 incremental_stats 의 latest_video_url 을 사용합니다.
+        """
+        def write_videos(batch: List[Tuple[str, List[Dict]]]) -> List[Dict]:
+            image_tasks = []
+            for username, results in batch:
+                latest_video_url = (incremental_stats or {}).get(username, {}).get("latest_video_url")
+                stats, tasks = self._write_video_rows(results, username, is_repost, latest_video_url=latest_video_url)
+                db_results[username] = stats
+                image_tasks.extend(tasks)
+            return image_tasks
+
+        # 한 항목이 이미 사용자 한 명의 비디오 전체이므로 바로 기록
+        return ScrapePipeline(
+            name,
+            write_batch=write_videos,
+            download=self._download_thumbnail,
+            upload=self._upload_image_task,
+            on_finish=self._flush_image_urls,
+            batch_size=1
+        )
+
+    def _load_video_high_water_marks(self, usernames: List[str], is_repost: bool = False) -> Dict[str, Dict]:
+        """
+        사용자별 증분 수집 기준점 조회
+
+        Returns:
+            {username: {"latest_video_url": 마지막 수집 시 가장 위 video_url, "scraped_at": 마지막 수집 시각,
+                        "known_urls": 최근 저장된 video_url 집합 (최대 INCREMENTAL_KNOWN_WINDOW 개)}}
+            계정이 없으면 빈 기준점 (모든 항목을 새 항목으로 처리)
+        """
+        marks = {}
+        for username in usernames:
+            mark = {"latest_video_url": None, "scraped_at": None, "known_urls": set()}
+            marks[username] = mark
+
+            if is_repost:
+                account = self.db_session.query(TikTokBrandAccount).filter(TikTokBrandAccount.username == username).first()
+                if not account:
+                    continue
+                mark["latest_video_url"] = account.latest_repost_video_url
+                mark["scraped_at"] = account.last_scraped_at
+                query = self.db_session.query(TikTokRepostVideo.video_url).filter(
+                    TikTokRepostVideo.tiktok_brand_account_id == account.id
+                ).order_by(TikTokRepostVideo.id.desc())
+            else:
+                account = TikTokUserRepository(self.db_session).get_by_username(username)
+                if not account:
+                    continue
+                mark["latest_video_url"] = account.latest_video_url
+                mark["scraped_at"] = account.videos_scraped_at
+                query = self.db_session.query(TikTokVideo.video_url).filter(
+                    TikTokVideo.tiktok_user_id == account.id
+                ).order_by(TikTokVideo.id.desc())
+
+            mark["known_urls"] = {video_url for (video_url,) in query.limit(settings.INCREMENTAL_KNOWN_WINDOW)}
+            if mark["latest_video_url"]:
+                mark["known_urls"].add(mark["latest_video_url"])
+
+        # 세션을 다른 스레드(파이프라인)에서 이어 쓰기 전에 조회 트랜잭션 종료
+        self.db_session.commit()
+        return marks
+
+    def _incremental_scraper(self, scrape_one, marks: Dict[str, Dict], incremental_stats: Dict):
+        """scrape_one 결과에서 새 항목과 통계 갱신용 일부 항목만 남기는 async 함수 반환"""
+        async def scrape_incremental(browser_manager, username: str) -> List[Dict]:
+            mark = marks.get(username) or {}
+            # 고정 슬롯 뒤에서 이미 저장된 항목을 만나면 그리드 처리 중단
+            results = await scrape_one(browser_manager, username, known_urls=mark.get("known_urls"))
+            selected, stats = self._select_incremental_items(results, mark)
+            incremental_stats[username] = stats
+            print(
+                f"📌 {username}: 증분 수집 - 추출 {stats['extracted']}개 중 새 항목 {stats['new']}개, "
+                f"통계 갱신 {stats['refreshed']}개, 건너뜀 {stats['skipped']}개"
+            )
+            return selected
+
+        return scrape_incremental
+
+    @staticmethod
+    def _select_incremental_items(results: List[Dict], mark: Dict) -> Tuple[List[Dict], Dict]:
+        """
+        그리드 순서(최신순)로 훑다가 이미 저장된 항목을 만나면 멈추고,
+        그 앞의 새 항목 전부와 이미 저장된 항목 중 INCREMENTAL_REFRESH_SAMPLE 개를 골라 반환
+
+        고정(pinned) 게시물은 오래된 항목이어도 맨 위에 오므로 앞쪽 INCREMENTAL_PINNED_SLOTS 개 안에서
+        만난 저장된 항목으로는 멈추지 않습니다.
+        다음 기준점(latest_video_url)은 선택 결과가 아닌 추출된 그리드에서 고정 게시물을 뺀 가장 위 항목입니다.
+        """
+        known_urls = mark.get("known_urls") or set()
+        new_items, known_items = [], []
+        stopped_at = None
+
+        # 고정 슬롯 안의 이미 저장된 항목(고정 게시물로 간주)을 건너뛴 가장 위 항목
+        latest_video_url = next(
+            (item.get('link') for index, item in enumerate(results)
+             if index >= settings.INCREMENTAL_PINNED_SLOTS or item.get('link') not in known_urls),
+            results[0].get('link') if results else None
+        )
+
+        for index, item in enumerate(results):
+            if item.get('link') not in known_urls:
+                new_items.append(item)
+                continue
+            known_items.append(item)
+            if index >= settings.INCREMENTAL_PINNED_SLOTS:
+                stopped_at = index
+                break
+
+        refresh = random.sample(known_items, min(settings.INCREMENTAL_REFRESH_SAMPLE, len(known_items)))
+        keep = {id(item) for item in new_items + refresh}
+        selected = [item for item in results if id(item) in keep]
+
+        return selected, {
+            "extracted": len(results),
+            "new": len(new_items),
+            "refreshed": len(refresh),
+            "skipped": len(results) - len(selected),
+            "stopped_at": stopped_at,
+            "high_water_mark": mark.get("latest_video_url"),
+            "latest_video_url": latest_video_url,
+            "last_scraped_at": mark["scraped_at"].isoformat() if mark.get("scraped_at") else None
+        }
+
+    async def _scrape_single_user_videos_async(
+        self, browser_manager, username: str, known_urls: Optional[set] = None
+    ) -> List[Dict]:
         """
         단일 사용자의 비디오 정보를 추출합니다 (async 버전)
 
         Args:
             page: async playwright page 객체
             username: TikTok 사용자명
+            known_urls: 증분 수집 시 이미 저장된 video_url 집합 (고정 슬롯 뒤에서 만나면 그리드 처리 중단)
 
         Returns:
             비디오 정보 리스트
@@ -515,86 +955,185 @@ class TikTokService:
             print("⏳ 비디오 콘텐츠 로딩 대기 중...")
             await browser_manager.wait_for_video_containers()
 
-            # 비디오 컨테이너 찾기 (ID 기반으로 검색)
+            # 비디오 그리드 추출 (한 번의 page.evaluate, 실패 시 요소별 추출)
             print("🎬 비디오 항목들을 검색 중...")
-            video_containers = await browser_manager.get_video_containers()
+            results = await self._extract_video_grid_items_async(browser_manager, username, known_urls=known_urls)
 
-            print(f"📸 총 {len(video_containers)}개의 비디오를 발견했습니다.")
+            print(f"🎯 총 {len(results)}개의 비디오 정보를 추출했습니다.")
+            self._print_video_stats(results, "비디오")
 
-            for i, container in enumerate(video_containers, 1):
-                try:
-                    result_item = {
-                        'index': i,
-                        'username': username
-                    }
+        except Exception as e:
+            await browser_manager.take_screenshot(f'debug_{username}_error.png')
+            raise TikTokScrapingException(
+                f"비디오 수집 중 오류: {str(e)}",
+                context={"username": username, "operation": "scrape_videos"}
+            )
 
-                    # 링크 추출
-                    link = await container.get_attribute('href')
-                    if link:
-                        # 상대 경로인 경우 절대 경로로 변환
-                        if link.startswith('/'):
-                            link = f"https://www.tiktok.com{link}"
-                        result_item['link'] = link
-                    else:
-                        result_item['link'] = 'N/A'
-
-                    # picture 태그 내부의 img 태그 찾기 (alt 값 추출)
-                    img_element = await container.query_selector('picture img')
-                    if img_element:
-                        alt_text = await img_element.get_attribute('alt')
-                        src = await img_element.get_attribute('src')
-
-                        # '(으)로 만든' 뒤의 텍스트만 추출
-                        if alt_text:
-                            if '으로 만든' in alt_text:
-                                alt_text = alt_text.split('으로 만든', 1)[1].strip()
-                            elif '로 만든' in alt_text:
-                                alt_text = alt_text.split('로 만든', 1)[1].strip()
-
-                        result_item['alt'] = alt_text if alt_text else 'N/A'
-                        result_item['src'] = src if src else 'N/A'
-                    else:
-                        result_item['alt'] = 'N/A'
-                        result_item['src'] = 'N/A'
-
-                    # 조회수 추출 (strong 태그 with data-e2e="video-views")
-                    views_element = await container.query_selector('strong[data-e2e="video-views"]')
-                    if views_element:
-                        views_text = await views_element.inner_text()
-                        result_item['views'] = views_text.strip() if views_text else 'N/A'
-                    else:
-                        result_item['views'] = 'N/A'
+        return results
 
-                    results.append(result_item)
-                    print(f"✔ Video {i}: {result_item.get('alt', 'N/A')[:50]}... | Views: {result_item.get('views', 'N/A')}")
+    async def _extract_video_grid_items_async(
+        self,
+        browser_manager,
+        username: str,
+        is_repost: bool = False,
+        known_urls: Optional[set] = None
+    ) -> List[Dict]:
+        """
+        프로필 비디오 그리드를 결과 항목 리스트로 변환
+
+        한 번의 page.evaluate 로 전체 그리드를 읽고, 실패하거나 결과가 없을 때만
+        컨테이너별 요소 조회 방식으로 대체합니다.
+        known_urls 가 있으면 고정 슬롯 뒤에서 처음 만난 이미 저장된 항목까지만 처리합니다.
+
+        Args:
+            browser_manager: 현재 페이지를 가진 AsyncBrowserManager
+            username: TikTok 사용자명
+            is_repost: 리포스트 여부
+            known_urls: 증분 수집 시 이미 저장된 video_url 집합
 
+        Returns:
+            비디오 정보 리스트
+        """
+        raw_items = await browser_manager.extract_video_grid()
+
+        if raw_items:
+            raw_items = self._cut_at_known_video(raw_items, known_urls)
+        else:
+            print("⚠️ 일괄 추출 결과 없음. 요소별 추출로 대체합니다...")
+            raw_items = []
+            for container in await browser_manager.get_video_containers():
+                try:
+                    raw_items.append(await self._read_video_container_async(container))
                 except Exception as e:
-                    print(f"❗ Video {i} 처리 중 오류: {e}")
+                    print(f"❗ 비디오 요소 처리 중 오류: {e}")
                     continue
+                # 남은 컨테이너는 지난 수집에서 처리됨
+                if self._is_known_video_past_pinned(len(raw_items) - 1, raw_items[-1], known_urls):
+                    break
 
-            print(f"🎯 총 {len(results)}개의 비디오 정보를 추출했습니다.")
-
-            # 통계 표시
-            alt_with_text = len([r for r in results if r.get('alt', 'N/A') != 'N/A'])
-            views_with_data = len([r for r in results if r.get('views', 'N/A') != 'N/A'])
-            links_with_data = len([r for r in results if r.get('link', 'N/A') != 'N/A'])
+        print(f"📸 총 {len(raw_items)}개의 {'리포스트 ' if is_repost else ''}비디오를 발견했습니다.")
 
-            print(f"📊 상세 통계:")
-            print(f"   - alt 값이 있는 비디오: {alt_with_text}개")
-            print(f"   - 조회수가 있는 비디오: {views_with_data}개")
-            print(f"   - 링크가 있는 비디오: {links_with_data}개")
-            print(f"   - 전체 비디오: {len(results)}개")
+        # 응답 캡처 사용 시 처리 중인 API 응답 파싱 완료 대기
+        capture = browser_manager.capture
+        if capture:
+            await capture.drain()
 
-        except Exception as e:
-            await browser_manager.take_screenshot(f'debug_{username}_error.png')
-            raise TikTokScrapingException(
-                f"비디오 수집 중 오류: {str(e)}",
-                context={"username": username, "operation": "scrape_videos"}
-            )
+        label = "Repost" if is_repost else "Video"
+        results = []
+        for i, raw in enumerate(raw_items, 1):
+            result_item = self._build_video_item(raw, i, username, is_repost)
+            if capture:
+                self._merge_captured_video(result_item, capture.get_video(
+                    TikTokUrlUtils.extract_video_id_from_url(result_item['link'])
+                ))
+            results.append(result_item)
+            print(f"✔ {label} {i}: {result_item['alt'][:50]}... | Views: {result_item['views']}")
 
         return results
 
-    def scrape_user_repost_videos(self, usernames: List[str], use_session: bool = False, session_file: str = "tiktok_auth.json") -> Dict:
+    @staticmethod
+    def _absolute_video_link(link: Optional[str]) -> Optional[str]:
+        """상대 경로 비디오 링크를 절대 경로로 변환"""
+        if link and link.startswith('/'):
+            return f"https://www.tiktok.com{link}"
+        return link
+
+    @classmethod
+    def _is_known_video_past_pinned(cls, index: int, raw: Dict, known_urls: Optional[set]) -> bool:
+        """고정 슬롯 뒤에 있는 이미 저장된 항목인지 (증분 수집 중단 지점)"""
+        return bool(known_urls) and index >= settings.INCREMENTAL_PINNED_SLOTS \
+            and cls._absolute_video_link(raw.get('link')) in known_urls
+
+    @classmethod
+    def _cut_at_known_video(cls, raw_items: List[Dict], known_urls: Optional[set]) -> List[Dict]:
+        """고정 슬롯 뒤에서 처음 만난 이미 저장된 항목까지만 남김 (그 항목은 중단 지점 확인용으로 포함)"""
+        for index, raw in enumerate(raw_items):
+            if cls._is_known_video_past_pinned(index, raw, known_urls):
+                return raw_items[:index + 1]
+        return raw_items
+
+    @staticmethod
+    async def _read_video_container_async(container) -> Dict:
+        """비디오 컨테이너(a 태그) 하나에서 원시 값 추출 (대체 경로)"""
+        raw = {
+            'link': await container.get_attribute('href'),
+            'alt': None,
+            'src': None,
+            'views': None
+        }
+
+        img_element = await container.query_selector('picture img')
+        if img_element:
+            raw['alt'] = await img_element.get_attribute('alt')
+            raw['src'] = await img_element.get_attribute('src')
+
+        views_element = await container.query_selector('strong[data-e2e="video-views"]')
+        if views_element:
+            raw['views'] = await views_element.inner_text()
+
+        return raw
+
+    @staticmethod
+    def _build_video_item(raw: Dict, index: int, username: str, is_repost: bool = False) -> Dict:
+        """원시 그리드 값을 결과 항목 형식으로 정규화"""
+        result_item = {
+            'index': index,
+            'username': username
+        }
+        if is_repost:
+            result_item['is_repost'] = True  # 리포스트임을 표시
+
+        # 상대 경로인 경우 절대 경로로 변환
+        link = TikTokService._absolute_video_link(raw.get('link'))
+        result_item['link'] = link if link else 'N/A'
+
+        # '(으)로 만든' 뒤의 텍스트만 추출
+        alt_text = raw.get('alt')
+        if alt_text:
+            if '으로 만든' in alt_text:
+                alt_text = alt_text.split('으로 만든', 1)[1].strip()
+            elif '로 만든' in alt_text:
+                alt_text = alt_text.split('로 만든', 1)[1].strip()
+        result_item['alt'] = alt_text if alt_text else 'N/A'
+
+        src = raw.get('src')
+        result_item['src'] = src if src else 'N/A'
+
+        views_text = (raw.get('views') or '').strip()
+        result_item['views'] = views_text if views_text else 'N/A'
+
+        return result_item
+
+    @staticmethod
+    def _merge_captured_video(result_item: Dict, captured: Optional[Dict]) -> None:
+        """캡처된 API 데이터의 정확한 통계를 결과 항목에 병합 (DOM 값은 그대로 유지)"""
+        if not captured:
+            return
+
+        result_item['video_id'] = captured['video_id']
+        for key in ('view_count', 'like_count', 'comment_count', 'share_count', 'posted_at', 'hashtags'):
+            if captured.get(key) is not None:
+                result_item[key] = captured[key]
+
+        # 리포스트의 경우 원본 작성자 정보
+        if result_item.get('is_repost') and captured.get('author'):
+            result_item['original_username'] = captured['author']
+            result_item['original_video_id'] = captured['video_id']
+
+    @staticmethod
+    def _print_video_stats(results: List[Dict], label: str) -> None:
+        """비디오 추출 통계 출력"""
+        alt_with_text = len([r for r in results if r.get('alt', 'N/A') != 'N/A'])
+        views_with_data = len([r for r in results if r.get('views', 'N/A') != 'N/A'])
+        links_with_data = len([r for r in results if r.get('link', 'N/A') != 'N/A'])
+
+        print(f"📊 상세 통계:")
+        print(f"   - alt 값이 있는 {label}: {alt_with_text}개")
+        print(f"   - 조회수가 있는 {label}: {views_with_data}개")
+        print(f"   - 링크가 있는 {label}: {links_with_data}개")
+        print(f"   - 전체 {label}: {len(results)}개")
+
+    def scrape_user_repost_videos(self, usernames: List[str], use_session: bool = False, session_file: str = "tiktok_auth.json", concurrency: int = 1, incremental: bool = False) -> Dict:
         """
         여러 TikTok 사용자의 리포스트 비디오 정보를 스크래핑합니다.
         
@@ -602,6 +1141,8 @@ class TikTokService:
             usernames: TikTok 사용자명 리스트
             use_session: 세션 파일 사용 여부
             session_file: 세션 파일 경로
+            concurrency: 동시에 사용할 페이지 수 (1 이면 순서대로 방문)
+            incremental: True 면 지난 수집 이후 새 리포스트와 일부 최근 리포스트(통계 갱신용)만 처리
             
         Returns:
             사용자별 리포스트 비디오 정보 딕셔너리
@@ -611,63 +1152,55 @@ class TikTokService:
             """내부 비동기 리포스트 스크래핑 함수"""
             all_results = {}
             db_results = {}
-            
+            incremental_stats = {}
+            pipeline = self._create_video_pipeline(
+                "scrape_repost_videos", db_results, is_repost=True, incremental_stats=incremental_stats
+            )
+
             try:
-                async with AsyncBrowserManager() as browser_manager:
-                    # 브라우저 초기화
-                    session_file_to_use = session_file if use_session else None
-                    await browser_manager.initialize(headless=False, session_file=session_file_to_use)
-                    
-                    # TikTok 메인 페이지로 이동하여 세션 활성화
-                    await browser_manager.navigate_to_main_page()
-                    
-                    page = browser_manager.page
-                    
-                    # 로그인 상태 확인 (세션 사용 시)
-                    if use_session:
-                        try:
-                            await page.wait_for_selector('[data-e2e="nav-profile"]', timeout=10000)
-                            print("✅ 로그인 상태 확인됨")
-                        except:
-                            print("⚠️ 로그인 세션을 확인할 수 없습니다. 계속 진행합니다.")
-                    
-                    # 각 사용자별로 리포스트 스크래핑 실행
-                    for idx, username in enumerate(usernames, 1):
-                        print("\n" + "=" * 60)
-                        print(f"[{idx}/{len(usernames)}] '{username}' 사용자 리포스트 처리 중...")
-                        print("=" * 60)
-                        
-                        # page를 전달하여 스크래핑 함수 호출
-                        results = await self._scrape_single_user_repost_videos_async(page, username)
-                        all_results[username] = results
-                        
-                        # 각 사용자별로 데이터베이스에 저장 (리포스트는 별도 필드로 저장)
-                        if results:
-                            db_result = self._save_video_results_to_db(results, username, is_repost=True)
-                            db_results[username] = db_result
-                        
-                        # 마지막 사용자가 아니면 잠시 대기
-                        if idx < len(usernames):
-                            wait_time = random.uniform(5, 10)
-                            print(f"\n⏳ 다음 사용자 처리까지 {wait_time:.1f}초 대기...")
-                            await page.wait_for_timeout(wait_time * 1000)
-                    
-                    print("\n" + "=" * 60)
-                    print("✅ 모든 사용자 리포스트 스크래핑 완료!")
-                    print("=" * 60)
-                    
-                    return {
-                        "success": True,
-                        "total_users": len(usernames),
-                        "results": all_results,
-                        "db_save_results": db_results,
-                        "message": f"Successfully scraped repost videos for {len(usernames)} users"
-                    }
-                    
+                scrape_one = self._scrape_single_user_repost_videos_async
+                if incremental:
+                    # 지난 수집 기준점(최근 저장된 video_url) 까지만 처리
+                    marks = await asyncio.to_thread(self._load_video_high_water_marks, usernames, True)
+                    scrape_one = self._incremental_scraper(scrape_one, marks, incremental_stats)
+
+                pipeline.start()
+                # 프로필 방문 (concurrency > 1 이면 여러 페이지에서 동시에)
+                await self._scrape_profiles_async(
+                    usernames,
+                    scrape_one,
+                    pipeline,
+                    all_results,
+                    session_file=session_file if use_session else None,
+                    use_session=use_session,
+                    concurrency=concurrency,
+                    label="사용자 리포스트"
+                )
+
+                # 브라우저 반납 후 남은 DB 저장/썸네일 업로드 마무리
+                pipeline_stats = await pipeline.finish()
+
+                print("\n" + "=" * 60)
+                print("✅ 모든 사용자 리포스트 스크래핑 완료!")
+                print("=" * 60)
+                
+                return {
+                    "success": True,
+                    "total_users": len(usernames),
+                    "results": all_results,
+                    "db_save_results": db_results,
+                    "pipeline_stats": pipeline_stats,
+                    **({"incremental_stats": incremental_stats} if incremental else {}),
+                    "message": f"Successfully scraped repost videos for {len(usernames)} users"
+                }
+
             except Exception as e:
                 print(f"❌ 리포스트 스크래핑 중 전체 오류 발생: {e}")
                 import traceback
                 traceback.print_exc()
+
+                # 이미 수집한 결과는 끝까지 저장
+                await pipeline.finish()
                 return {
                     "success": False,
                     "error": str(e),
@@ -675,162 +1208,76 @@ class TikTokService:
                     "db_save_results": db_results
                 }
         
-        # 비동기 함수 실행
-        return asyncio.run(_scrape_repost_videos())
+        # 브라우저 루프에서 비동기 함수 실행
+        return browser_loop.run(_scrape_repost_videos())
 
-    async def _scrape_single_user_repost_videos_async(self, page, username: str) -> List[Dict]:
+    async def _scrape_single_user_repost_videos_async(
+        self, browser_manager, username: str, known_urls: Optional[set] = None
+    ) -> List[Dict]:
         """
         단일 사용자의 리포스트 비디오 정보를 추출합니다 (async 버전)
         
         Args:
-            page: async playwright page 객체
+            browser_manager: 초기화된 AsyncBrowserManager (응답 캡처가 있으면 함께 사용)
             username: TikTok 사용자명
+            known_urls: 증분 수집 시 이미 저장된 video_url 집합 (고정 슬롯 뒤에서 만나면 그리드 처리 중단)
             
         Returns:
             리포스트 비디오 정보 리스트
         """
         results = []
+        page = browser_manager.page
         try:
-            async with AsyncBrowserManager() as browser_manager:
-                # CAPTCHA 방지를 위한 안전한 프로필 페이지 이동
-                browser_manager.page = page
-                if not await browser_manager.navigate_to_profile(username):
-                    return results
-
-                # Repost 탭 클릭
-                print("🔄 Repost 탭을 찾는 중...")
-                try:
-                    # data-e2e="repost-tab" 속성을 가진 요소 찾기
-                    repost_tab = page.locator('[data-e2e="repost-tab"]')
-
-                    if await repost_tab.count() > 0:
-                        print("✅ Repost 탭을 찾았습니다. 클릭합니다...")
-                        try:
-                            # timeout을 5초로 제한하여 클릭 시도
-                            await repost_tab.click(timeout=5000)
-                            await page.wait_for_timeout(random.uniform(3000, 5000))  # 클릭 후 로딩 대기
-                            print("✅ Repost 탭이 활성화되었습니다.")
-                        except Exception as click_error:
-                            # Timeout 에러 발생 시 이 사용자 건너뛰기
-                            if "Timeout" in str(click_error):
-                                print(f"⚠️ Repost 탭 클릭 시 timeout 발생. 사용자 {username} 건너뜁니다.")
-                                return results
-                            else:
-                                print(f"⚠️ Repost 탭 클릭 중 오류: {click_error}")
-                                return results
-                    else:
-                        print("⚠️ Repost 탭을 찾을 수 없습니다. 사용자에게 리포스트가 없을 수 있습니다.")
-                        return results
-
-                except Exception as e:
-                    print(f"⚠️ Repost 탭 처리 중 오류: {e}")
-                    # 리포스트 탭 관련 오류 발생 시 이 사용자 건너뛰기
-                    return results
-
-                # 페이지 콘텐츠가 완전히 로드될 때까지 대기
-                print("⏳ 리포스트 비디오 콘텐츠 로딩 대기 중...")
-                try:
-                    # ID가 column-item-video-container-로 시작하는 요소가 나타날 때까지 대기 (최대 10초)
-                    await page.wait_for_selector('[id^="column-item-video-container-"]', timeout=10000)
-                    await page.wait_for_timeout(random.uniform(3000, 5000))  # 추가 대기
-                except:
-                    print("⚠️ 리포스트 비디오 컨테이너를 찾는 중 타임아웃. 계속 진행합니다...")
-
-                # 리포스트 비디오 컨테이너 찾기 (ID 기반으로 검색)
-                print("🎬 리포스트 비디오 항목들을 검색 중...")
-                containers = await page.query_selector_all('[id^="column-item-video-container-"]')
-                video_containers = []
-
-                for container in containers:
-                    # 각 컨테이너에서 첫 번째 a 태그만 가져오기
-                    first_link = await container.query_selector('a')
-                    if first_link:
-                        video_containers.append(first_link)
-
-                # 대체 방법: 직접 ID로 찾기
-                if len(video_containers) == 0:
-                    print("ID 선택자로 못 찾음. 다른 방법 시도...")
-                    video_containers = []
-                    # 0부터 시작하는 숫자로 ID를 직접 찾기
-                    for i in range(100):  # 최대 100개까지 확인
-                        container = await page.query_selector(f'#column-item-video-container-{i}')
-                        if container:
-                            # 컨테이너에서 첫 번째 a 태그만 가져오기
-                            first_link = await container.query_selector('a')
-                            if first_link:
-                                video_containers.append(first_link)
-                        else:
-                            # 연속된 번호가 없으면 중단 (처음 몇 개는 스킵 가능)
-                            if i > 10 and len(video_containers) > 0:
-                                break
+            # CAPTCHA 방지를 위한 안전한 프로필 페이지 이동
+            if not await browser_manager.navigate_to_profile(username):
+                return results
 
-                print(f"📸 총 {len(video_containers)}개의 리포스트 비디오를 발견했습니다.")
+            # Repost 탭 클릭
+            print("🔄 Repost 탭을 찾는 중...")
+            try:
+                # data-e2e="repost-tab" 속성을 가진 요소 찾기
+                repost_tab = page.locator('[data-e2e="repost-tab"]')
 
-                for i, container in enumerate(video_containers, 1):
+                if await repost_tab.count() > 0:
+                    print("✅ Repost 탭을 찾았습니다. 클릭합니다...")
                     try:
-                        result_item = {
-                            'index': i,
-                            'username': username,
-                            'is_repost': True  # 리포스트임을 표시
-                        }
-
-                        # 링크 추출
-                        link = await container.get_attribute('href')
-                        if link:
-                            # 상대 경로인 경우 절대 경로로 변환
-                            if link.startswith('/'):
-                                link = f"https://www.tiktok.com{link}"
-                            result_item['link'] = link
-                        else:
-                            result_item['link'] = 'N/A'
-
-                        # picture 태그 내부의 img 태그 찾기 (alt 값 추출)
-                        img_element = await container.query_selector('picture img')
-                        if img_element:
-                            alt_text = await img_element.get_attribute('alt')
-                            src = await img_element.get_attribute('src')
-
-                            # '(으)로 만든' 뒤의 텍스트만 추출
-                            if alt_text:
-                                if '으로 만든' in alt_text:
-                                    alt_text = alt_text.split('으로 만든', 1)[1].strip()
-                                elif '로 만든' in alt_text:
-                                    alt_text = alt_text.split('로 만든', 1)[1].strip()
-
-                            result_item['alt'] = alt_text if alt_text else 'N/A'
-                            result_item['src'] = src if src else 'N/A'
-                        else:
-                            result_item['alt'] = 'N/A'
-                            result_item['src'] = 'N/A'
-
-                        # 조회수 추출 (strong 태그 with data-e2e="video-views")
-                        views_element = await container.query_selector('strong[data-e2e="video-views"]')
-                        if views_element:
-                            views_text = await views_element.inner_text()
-                            result_item['views'] = views_text.strip() if views_text else 'N/A'
+                        # 클릭 후 리포스트 목록 API 응답을 받을 때까지 대기 (클릭 timeout 5초)
+                        if not await browser_manager.wait_for_response(
+                            "/api/repost/item_list",
+                            action=lambda: repost_tab.click(timeout=5000)
+                        ):
+                            print("⚠️ 리포스트 목록 응답을 확인하지 못했습니다. 계속 진행합니다...")
+                        print("✅ Repost 탭이 활성화되었습니다.")
+                    except Exception as click_error:
+                        # Timeout 에러 발생 시 이 사용자 건너뛰기
+                        if "Timeout" in str(click_error):
+                            print(f"⚠️ Repost 탭 클릭 시 timeout 발생. 사용자 {username} 건너뜁니다.")
+                            return results
                         else:
-                            result_item['views'] = 'N/A'
+                            print(f"⚠️ Repost 탭 클릭 중 오류: {click_error}")
+                            return results
+                else:
+                    print("⚠️ Repost 탭을 찾을 수 없습니다. 사용자에게 리포스트가 없을 수 있습니다.")
+                    return results
 
-                        results.append(result_item)
-                        print(f"✔ Repost {i}: {result_item.get('alt', 'N/A')[:50]}... | Views: {result_item.get('views', 'N/A')}")
+            except Exception as e:
+                print(f"⚠️ Repost 탭 처리 중 오류: {e}")
+                # 리포스트 탭 관련 오류 발생 시 이 사용자 건너뛰기
+                return results
 
-                    except Exception as e:
-                        print(f"❗ Repost {i} 처리 중 오류: {e}")
-                        continue
+            # 리포스트 그리드가 렌더링될 때까지 대기 (컨테이너 표시 + 네트워크 유휴)
+            print("⏳ 리포스트 비디오 콘텐츠 로딩 대기 중...")
+            await browser_manager.wait_for_video_containers()
 
-                print(f"🎯 총 {len(results)}개의 리포스트 비디오 정보를 추출했습니다.")
+            # 리포스트 비디오 그리드 추출 (한 번의 page.evaluate, 실패 시 요소별 추출)
+            print("🎬 리포스트 비디오 항목들을 검색 중...")
+            results = await self._extract_video_grid_items_async(
+                browser_manager, username, is_repost=True, known_urls=known_urls
+            )
 
-                # 통계 표시
-                alt_with_text = len([r for r in results if r.get('alt', 'N/A') != 'N/A'])
-                views_with_data = len([r for r in results if r.get('views', 'N/A') != 'N/A'])
-                links_with_data = len([r for r in results if r.get('link', 'N/A') != 'N/A'])
+            print(f"🎯 총 {len(results)}개의 리포스트 비디오 정보를 추출했습니다.")
+            self._print_video_stats(results, "리포스트")
 
-                print(f"📊 상세 통계:")
-                print(f"   - alt 값이 있는 리포스트: {alt_with_text}개")
-                print(f"   - 조회수가 있는 리포스트: {views_with_data}개")
-                print(f"   - 링크가 있는 리포스트: {links_with_data}개")
-                print(f"   - 전체 리포스트: {len(results)}개")
-            
         except Exception as e:
             await page.screenshot(path=f'debug_{username}_repost_error.png')
             raise TikTokScrapingException(
@@ -846,7 +1293,8 @@ class TikTokService:
         brand_username: str, 
         max_videos: int = 20,
         use_session: bool = False,
-        session_file: str = "tiktok_auth.json"
+        session_file: str = "tiktok_auth.json",
+        deep_pagination: bool = False
     ) -> Dict:
         """
         브랜드 계정의 리포스트 비디오를 수집합니다.
@@ -856,6 +1304,8 @@ class TikTokService:
             max_videos: 수집할 최대 비디오 수
             use_session: 세션 파일 사용 여부
             session_file: 세션 파일 경로
+            deep_pagination: True 면 처음 보이는 항목만이 아니라 리포스트 목록을 계속 불러와
+                max_videos 개 또는 이미 저장된 비디오를 만날 때까지 수집
             
         Returns:
             수집 결과 딕셔너리
@@ -863,217 +1313,394 @@ class TikTokService:
         
         async def _scrape_brand_reposts():
             """내부 비동기 브랜드 리포스트 스크래핑 함수"""
-            result = {
-                "brand_account": None,
-                "repost_videos": [],
-                "stats": {
-                    "total_videos": 0,
-                    "new_videos": 0,
-                    "updated_videos": 0,
-                    "errors": 0
-                }
-            }
-            
             try:
                 async with AsyncBrowserManager() as browser_manager:
-                    # 브라우저 초기화
-                    session_file_to_use = session_file if use_session else None
-                    await browser_manager.initialize(headless=False, session_file=session_file_to_use)
-                    
-                    # TikTok 메인 페이지로 이동하여 세션 활성화
-                    await browser_manager.navigate_to_main_page()
-                    
-                    page = browser_manager.page
-                    
-                    # 브랜드 계정 정보 확인/생성
-                    brand_account = self._get_or_create_brand_account(brand_username)
-                    
-                    result["brand_account"] = brand_account.to_dict()
-                    
-                    # 브랜드 계정 페이지 방문
-                    url = f"https://www.tiktok.com/@{brand_username}"
-                    print(f"Visiting brand account: {url}")
-                    await page.goto(url, wait_until="networkidle")
-                    await page.wait_for_timeout(random.uniform(3000, 5000))
-                    
-                    # 프로필 정보 업데이트
-                    try:
-                        # 닉네임
-                        nickname_elem = await page.query_selector('[data-e2e="user-title"]')
-                        if nickname_elem:
-                            brand_account.nickname = await nickname_elem.inner_text()
-                        
-                        # 팔로워 수
-                        followers_elem = await page.query_selector('[data-e2e="followers-count"]')
-                        if followers_elem:
-                            brand_account.followers = TikTokDataParser.parse_count(await followers_elem.inner_text())
-                        
-                        # 팔로잉 수
-                        following_elem = await page.query_selector('[data-e2e="following-count"]')
-                        if following_elem:
-                            brand_account.following_count = TikTokDataParser.parse_count(await following_elem.inner_text())
-                        
-                        # 비디오 수
-                        video_count_elem = await page.query_selector('[data-e2e="video-count"]')
-                        if video_count_elem:
-                            brand_account.video_count = TikTokDataParser.parse_count(await video_count_elem.inner_text())
-                        
-                        # 프로필 이미지
-                        profile_img_elem = await page.query_selector('[data-e2e="user-avatar"] img')
-                        if profile_img_elem:
-                            brand_account.profile_image = await profile_img_elem.get_attribute("src")
-                        
-                        # Bio
-                        bio_elem = await page.query_selector('[data-e2e="user-bio"]')
-                        if bio_elem:
-                            brand_account.bio = await bio_elem.inner_text()
-                        
-                        # 인증 마크
-                        verified_elem = await page.query_selector('[data-e2e="verified-badge"]')
-                        brand_account.is_verified = verified_elem is not None
-                        
-                        brand_account.profile_url = url
-                        brand_account.last_scraped_at = datetime.now()
-                        brand_account.updated_at = datetime.now()
-                        
-                        self.db_session.commit()
-                        print(f"Updated brand account profile: {brand_username}")
-                        
-                    except Exception as e:
-                        print(f"Error updating brand profile: {e}")
+                    await self._warm_up_brand_browser(browser_manager, use_session, session_file)
+                    return await self._scrape_brand_account_async(browser_manager, brand_username, max_videos, deep_pagination)
                     
-                    # 리포스트 탭으로 이동 (있는 경우)
+            except Exception as e:
+                print(f"Error in scrape_brand_repost_videos: {e}")
+                result = self._new_brand_result()
+                result["error"] = str(e)
+                return result
+        
+        # 브라우저 루프에서 비동기 함수 실행
+        return browser_loop.run(_scrape_brand_reposts())
+
+    def scrape_brand_repost_videos_batch(
+        self,
+        brand_usernames: List[str],
+        max_videos: int = 20,
+        use_session: bool = False,
+        session_file: str = "tiktok_auth.json",
+        deep_pagination: bool = False
+    ) -> Dict:
+        """
+        여러 브랜드 계정의 리포스트 비디오를 하나의 브라우저 세션에서 수집합니다.
+
+        브라우저 초기화와 메인 페이지 방문(세션 활성화)은 한 번만 하고, 같은 컨텍스트로
+        브랜드 계정을 차례로 방문합니다. 계정 사이에는 politeness_delay 를 둡니다.
+
+        Args:
+            brand_usernames: 브랜드 TikTok 계정명 리스트
+            max_videos: 계정별 수집할 최대 비디오 수
+            use_session: 세션 파일 사용 여부
+            session_file: 세션 파일 경로
+            deep_pagination: 리포스트 목록 깊은 수집 여부 (scrape_brand_repost_videos 참고)
+
+        Returns:
+            {"results": 계정별 결과 리스트, "total_stats": 합산 통계, "processed_accounts": 계정 수}
+        """
+        results: List[Dict] = []
+        total_stats = {key: 0 for key in self.BRAND_STAT_KEYS}
+
+        async def _scrape_brands():
+            async with AsyncBrowserManager() as browser_manager:
+                await self._warm_up_brand_browser(browser_manager, use_session, session_file)
+
+                for index, brand_username in enumerate(brand_usernames):
+                    if index > 0:
+                        await browser_manager.politeness_delay("다음 브랜드 계정 방문")
+
+                    print(f"Processing brand account: {brand_username} ({index + 1}/{len(brand_usernames)})")
+                    brand_result = await self._scrape_brand_account_async(browser_manager, brand_username, max_videos, deep_pagination)
+                    results.append(brand_result)
+
+                    # 통계 합산
+                    for key in total_stats:
+                        total_stats[key] += brand_result["stats"].get(key, 0)
+                    self._report_progress(processed_accounts=len(results), **total_stats)
+
+        self._report_progress(total_accounts=len(brand_usernames), processed_accounts=0)
+
+        try:
+            browser_loop.run(_scrape_brands())
+        except Exception as e:
+            # 브라우저를 띄우지 못했거나 세션이 중간에 끊긴 경우 남은 계정은 오류 결과로 기록
+            print(f"Error in scrape_brand_repost_videos_batch: {e}")
+            for _ in brand_usernames[len(results):]:
+                result = self._new_brand_result()
+                result["error"] = str(e)
+                results.append(result)
+
+        return {
+            "results": results,
+            "total_stats": total_stats,
+            "processed_accounts": len(brand_usernames)
+        }
+
+    @staticmethod
+    async def _warm_up_brand_browser(browser_manager, use_session: bool, session_file: str) -> None:
+        """브랜드 수집용 브라우저 초기화 후 TikTok 메인 페이지로 이동하여 세션 활성화"""
+        session_file_to_use = session_file if use_session else None
+        await browser_manager.initialize(headless=False, session_file=session_file_to_use)
+        await browser_manager.navigate_to_main_page()
+
+    @classmethod
+    def _new_brand_result(cls) -> Dict:
+        """브랜드 계정 하나의 빈 수집 결과"""
+        return {
+            "brand_account": None,
+            "repost_videos": [],
+            "stats": {key: 0 for key in cls.BRAND_STAT_KEYS}
+        }
+
+    async def _scrape_brand_account_async(self, browser_manager, brand_username: str, max_videos: int, deep_pagination: bool = False) -> Dict:
+        """
+        초기화된 브라우저에서 브랜드 계정 하나의 프로필과 리포스트 비디오를 수집해 저장합니다.
+
+        오류가 나도 예외를 올리지 않고 결과의 "error" 에 기록합니다 (배치 수집에서 다음 계정 계속 진행).
+        """
+        result = self._new_brand_result()
+
+        try:
+            # 이전 계정의 목록 커서 기록 제거 (같은 컨텍스트로 여러 계정 방문 시)
+            if browser_manager.list_cursors:
+                browser_manager.list_cursors.reset()
+
+            page = browser_manager.page
+            
+            # 브랜드 계정 정보 확인/생성 (DB 작업은 브라우저 루프를 막지 않도록 스레드에서)
+            brand_account = await asyncio.to_thread(self._get_or_create_brand_account, brand_username)
+            result["brand_account"] = await asyncio.to_thread(brand_account.to_dict)
+            brand_account_id = result["brand_account"]["id"]
+            
+            # 브랜드 계정 페이지 방문
+            url = f"https://www.tiktok.com/@{brand_username}"
+            print(f"Visiting brand account: {url}")
+            await browser_manager.goto(url, wait_until="networkidle")
+            await browser_manager.wait_for_selector_ready('[data-e2e="user-title"]')
+            
+            # 프로필 정보 업데이트
+            try:
+                profile = {}
+
+                # 닉네임
+                nickname_elem = await page.query_selector('[data-e2e="user-title"]')
+                if nickname_elem:
+                    profile['nickname'] = await nickname_elem.inner_text()
+                
+                # 팔로워 수
+                followers_elem = await page.query_selector('[data-e2e="followers-count"]')
+                if followers_elem:
+                    profile['followers'] = TikTokDataParser.parse_count(await followers_elem.inner_text())
+                
+                # 팔로잉 수
+                following_elem = await page.query_selector('[data-e2e="following-count"]')
+                if following_elem:
+                    profile['following_count'] = TikTokDataParser.parse_count(await following_elem.inner_text())
+                
+                # 비디오 수
+                video_count_elem = await page.query_selector('[data-e2e="video-count"]')
+                if video_count_elem:
+                    profile['video_count'] = TikTokDataParser.parse_count(await video_count_elem.inner_text())
+                
+                # 프로필 이미지
+                profile_img_elem = await page.query_selector('[data-e2e="user-avatar"] img')
+                if profile_img_elem:
+                    profile['profile_image'] = await profile_img_elem.get_attribute("src")
+                
+                # Bio
+                bio_elem = await page.query_selector('[data-e2e="user-bio"]')
+                if bio_elem:
+                    profile['bio'] = await bio_elem.inner_text()
+                
+                # 인증 마크
+                verified_elem = await page.query_selector('[data-e2e="verified-badge"]')
+                profile['is_verified'] = verified_elem is not None
+                
+                profile['profile_url'] = url
+                profile['last_scraped_at'] = datetime.now()
+                profile['updated_at'] = datetime.now()
+                
+                await asyncio.to_thread(self._update_brand_profile, brand_account, profile)
+                print(f"Updated brand account profile: {brand_username}")
+                
+            except Exception as e:
+                print(f"Error updating brand profile: {e}")
+            
+            # 리포스트 탭으로 이동 (있는 경우)
+            try:
+                # 리포스트 탭 찾기
+                repost_tab = await page.query_selector('a[href*="/reposts"], [data-e2e="reposts-tab"], [data-e2e="repost-tab"]')
+                if repost_tab:
+                    print("Found reposts tab, clicking...")
                     try:
-                        # 리포스트 탭 찾기
-                        repost_tab = await page.query_selector('a[href*="/reposts"], [data-e2e="reposts-tab"], [data-e2e="repost-tab"]')
-                        if repost_tab:
-                            print("Found reposts tab, clicking...")
-                            try:
-                                # timeout을 5초로 제한하여 클릭 시도
-                                await repost_tab.click(timeout=5000)
-                                await page.wait_for_timeout(random.uniform(3000, 5000))
-                            except Exception as click_error:
-                                # Timeout 에러 발생 시 이 계정 건너뛰기
-                                if "Timeout" in str(click_error):
-                                    print(f"⚠️ Repost 탭 클릭 시 timeout 발생. 브랜드 계정 {brand_username} 건너뜁니다.")
-                                    return result
-                                else:
-                                    print(f"⚠️ Repost 탭 클릭 중 오류: {click_error}")
-                                    # 메인 피드에서 수집 시도
-                                    print("메인 피드에서 수집을 시도합니다...")
+                        # 클릭 후 리포스트 목록 API 응답과 네트워크 유휴까지 대기 (클릭 timeout 5초)
+                        await browser_manager.wait_for_response(
+                            "/api/repost/item_list",
+                            action=lambda: repost_tab.click(timeout=5000)
+                        )
+                        await browser_manager.wait_for_network_idle()
+                    except Exception as click_error:
+                        # Timeout 에러 발생 시 이 계정 건너뛰기
+                        if "Timeout" in str(click_error):
+                            print(f"⚠️ Repost 탭 클릭 시 timeout 발생. 브랜드 계정 {brand_username} 건너뜁니다.")
+                            return result
                         else:
-                            print("No reposts tab found, collecting from main feed")
-                    except Exception as e:
-                        print(f"Could not navigate to reposts tab: {e}")
-                        # 메인 피드에서 수집 계속 진행
-                    
-                    # 비디오 수집 - 스크롤 없이 처음 보이는 것들만
-                    collected_videos = []
-                    
-                    # 현재 보이는 비디오 요소들 찾기 (스크롤 X)
-                    video_elements = await page.query_selector_all('[data-e2e="user-post-item"]')
-                    print(f"Found {len(video_elements)} video elements on page")
-                    
-                    for video_elem in video_elements:
-                        if len(collected_videos) >= max_videos:
-                            break
-                        
-                        try:
-                            # 비디오 링크
-                            link_elem = await video_elem.query_selector('a')
-                            if not link_elem:
-                                continue
-                            
-                            video_url = await link_elem.get_attribute('href')
-                            if not video_url:
-                                continue
-                            
-                            # 중복 체크
-                            if any(v['video_url'] == video_url for v in collected_videos):
-                                continue
-                            
-                            video_data = {
-                                'video_url': video_url,
-                                'repost_username': brand_username
-                            }
-                            
-                            # 썸네일
-                            thumbnail_elem = await video_elem.query_selector('img')
-                            if thumbnail_elem:
-                                video_data['thumbnail_url'] = await thumbnail_elem.get_attribute('src')
-                                video_data['title'] = await thumbnail_elem.get_attribute('alt') or ''
-                            
-                            # 조회수
-                            views_elem = await video_elem.query_selector('[data-e2e="video-views"]')
-                            if views_elem:
-                                video_data['view_count'] = TikTokDataParser.parse_count(await views_elem.inner_text())
-                            
-                            # 리포스트 정보 확인 (리포스트인 경우)
-                            repost_info_elem = await video_elem.query_selector('[data-e2e="repost-info"], .repost-info')
-                            if repost_info_elem:
-                                # 원본 사용자명 추출
-                                original_user_elem = await repost_info_elem.query_selector('a')
-                                if original_user_elem:
-                                    original_username = (await original_user_elem.inner_text()).replace('@', '')
-                                    video_data['original_username'] = original_username
-                            
-                            collected_videos.append(video_data)
-                            print(f"Collected video {len(collected_videos)}: {video_url}")
-                            
-                        except Exception as e:
-                            print(f"Error collecting video: {e}")
-                            result["stats"]["errors"] += 1
+                            print(f"⚠️ Repost 탭 클릭 중 오류: {click_error}")
+                            # 메인 피드에서 수집 시도
+                            print("메인 피드에서 수집을 시도합니다...")
+                else:
+                    print("No reposts tab found, collecting from main feed")
+            except Exception as e:
+                print(f"Could not navigate to reposts tab: {e}")
+                # 메인 피드에서 수집 계속 진행
+            
+            # 깊은 수집: 리포스트 목록을 계속 불러오며 나타나는 대로 저장
+            if deep_pagination:
+                await self._collect_brand_reposts_deep_async(browser_manager, brand_account_id, brand_username, max_videos, result)
+                self._print_brand_result(brand_username, result)
+                return result
+
+            # 비디오 수집 - 스크롤 없이 처음 보이는 것들만
+            collected_videos = []
+            
+            # 현재 보이는 비디오 요소들 찾기 (스크롤 X)
+            video_elements = await page.query_selector_all('[data-e2e="user-post-item"]')
+            print(f"Found {len(video_elements)} video elements on page")
+            
+            for video_elem in video_elements:
+                if len(collected_videos) >= max_videos:
+                    break
+                
+                try:
+                    # 비디오 링크
+                    link_elem = await video_elem.query_selector('a')
+                    if not link_elem:
+                        continue
                     
-                    result["stats"]["total_videos"] = len(collected_videos)
+                    video_url = await link_elem.get_attribute('href')
+                    if not video_url:
+                        continue
                     
-                    # DB에 저장
-                    for video_data in collected_videos:
-                        try:
-                            # 기존 비디오 확인
-                            existing_video = self.db_session.query(TikTokRepostVideo).filter(
-                                TikTokRepostVideo.tiktok_brand_account_id == brand_account.id,
-                                TikTokRepostVideo.video_url == video_data['video_url']
-                            ).first()
-                            
-                            if existing_video:
-                                # 업데이트
-                                if 'view_count' in video_data:
-                                    existing_video.view_count = video_data['view_count']
-                                if 'title' in video_data:
-                                    existing_video.title = video_data['title']
-                                if 'thumbnail_url' in video_data:
-                                    existing_video.thumbnail_url = video_data['thumbnail_url']
-                                existing_video.updated_at = datetime.now()
-                                result["stats"]["updated_videos"] += 1
-                            else:
-                                # 새로 생성
-                                new_video = TikTokRepostVideo.from_scrape_data(video_data, brand_account.id)
-                                self.db_session.add(new_video)
-                                result["stats"]["new_videos"] += 1
-                            
-                            self.db_session.commit()
-                            result["repost_videos"].append(video_data)
-                            
-                        except Exception as e:
-                            print(f"Error saving video to DB: {e}")
-                            self.db_session.rollback()
-                            result["stats"]["errors"] += 1
+                    # 중복 체크
+                    if any(v['video_url'] == video_url for v in collected_videos):
+                        continue
                     
-                    print(f"\nCollection complete for {brand_username}:")
-                    print(f"  Total videos: {result['stats']['total_videos']}")
-                    print(f"  New videos: {result['stats']['new_videos']}")
-                    print(f"  Updated videos: {result['stats']['updated_videos']}")
-                    print(f"  Errors: {result['stats']['errors']}")
+                    video_data = {
+                        'video_url': video_url,
+                        'repost_username': brand_username
+                    }
                     
-                    return result
+                    # 썸네일
+                    thumbnail_elem = await video_elem.query_selector('img')
+                    if thumbnail_elem:
+                        video_data['thumbnail_url'] = await thumbnail_elem.get_attribute('src')
+                        video_data['title'] = await thumbnail_elem.get_attribute('alt') or ''
+                    
+                    # 조회수
+                    views_elem = await video_elem.query_selector('[data-e2e="video-views"]')
+                    if views_elem:
+                        video_data['view_count'] = TikTokDataParser.parse_count(await views_elem.inner_text())
+                    
+                    # 리포스트 정보 확인 (리포스트인 경우)
+                    repost_info_elem = await video_elem.query_selector('[data-e2e="repost-info"], .repost-info')
+                    if repost_info_elem:
+                        # 원본 사용자명 추출
+                        original_user_elem = await repost_info_elem.query_selector('a')
+                        if original_user_elem:
+                            original_username = (await original_user_elem.inner_text()).replace('@', '')
+                            video_data['original_username'] = original_username
+                    
+                    collected_videos.append(video_data)
+                    print(f"Collected video {len(collected_videos)}: {video_url}")
                     
-            except Exception as e:
-                print(f"Error in scrape_brand_repost_videos: {e}")
-                result["error"] = str(e)
-                return result
-        
-        # 비동기 함수 실행
-        return asyncio.run(_scrape_brand_reposts())
+                except Exception as e:
+                    print(f"Error collecting video: {e}")
+                    result["stats"]["errors"] += 1
+            
+            result["stats"]["total_videos"] = len(collected_videos)
+
+            # 응답 캡처 사용 시 정확한 통계/게시일/원본 정보 병합
+            if browser_manager.capture:
+                await browser_manager.capture.drain()
+                for video_data in collected_videos:
+                    self._merge_captured_brand_repost(video_data, browser_manager.capture)
+            
+            # DB에 저장
+            await asyncio.to_thread(self._save_brand_repost_batch, brand_account_id, collected_videos, result)
+            
+            self._print_brand_result(brand_username, result)
+            return result
+
+        except Exception as e:
+            print(f"Error in scrape_brand_repost_videos: {e}")
+            # 같은 세션으로 다음 계정을 처리할 수 있도록 실패한 트랜잭션 정리
+            await asyncio.to_thread(self.db_session.rollback)
+            result["error"] = str(e)
+            return result
+
+    async def _collect_brand_reposts_deep_async(self, browser_manager, brand_account_id: int, brand_username: str, max_videos: int, result: Dict) -> None:
+        """
+        리포스트 목록을 계속 불러오며(무한 스크롤 → 다음 커서 요청) 수집
+
+        max_videos 개를 모으거나, 이미 저장된 video_url 을 만나거나(이후는 지난 수집분),
+        목록 API 가 마지막 페이지(hasMore=false)를 알리면 멈춥니다.
+        항목은 목록이 다 모이기를 기다리지 않고 파이프라인으로 바로 DB 에 기록합니다.
+        """
+        known_urls = await asyncio.to_thread(self._load_known_repost_urls, brand_account_id)
+        print(f"📚 저장된 리포스트 {len(known_urls)}개, 최대 {max_videos}개까지 깊은 수집")
+
+        pipeline = ScrapePipeline(
+            f"brand:{brand_username}",
+            lambda batch: self._save_brand_repost_batch(brand_account_id, batch, result)
+        )
+        stop_reason = None
+
+        async with pipeline:
+            async for raw in browser_manager.iter_post_items(
+                "/api/repost/item_list",
+                max_scrolls=settings.REPOST_MAX_SCROLLS,
+                target_count=max_videos
+            ):
+                video_data = self._build_brand_repost_item(raw, brand_username)
+                if browser_manager.capture:
+                    await browser_manager.capture.drain()
+                    self._merge_captured_brand_repost(video_data, browser_manager.capture)
+
+                result["stats"]["total_videos"] += 1
+                await pipeline.put(video_data)
+
+                if video_data['video_url'] in known_urls:
+                    # 이미 저장된 항목은 갱신만 하고 그 뒤(더 오래된 리포스트)는 불러오지 않음
+                    stop_reason = "known_video"
+                    print(f"⏹️ 이미 저장된 리포스트를 만나 수집 종료: {video_data['video_url']}")
+                    break
+
+        scroll_stats = browser_manager.last_scroll_stats or {}
+        result["pagination"] = {
+            "scrolls": scroll_stats.get("scrolls", 0),
+            "stop_reason": stop_reason or scroll_stats.get("stop_reason"),
+            "cursor": browser_manager.list_cursors.get("/api/repost/item_list") if browser_manager.list_cursors else None
+        }
+        result["pipeline_stats"] = pipeline.stats()
+
+    def _load_known_repost_urls(self, brand_account_id: int) -> set:
+        """브랜드 계정의 저장된 리포스트 video_url 전체"""
+        return {
+            video_url for (video_url,) in self.db_session.query(TikTokRepostVideo.video_url).filter(
+                TikTokRepostVideo.tiktok_brand_account_id == brand_account_id
+            )
+        }
+
+    def _update_brand_profile(self, brand_account: 'TikTokBrandAccount', profile: Dict) -> None:
+        """프로필 페이지에서 읽은 값으로 브랜드 계정 갱신 후 커밋"""
+        for key, value in profile.items():
+            setattr(brand_account, key, value)
+        self.db_session.commit()
+
+    @staticmethod
+    def _build_brand_repost_item(raw: Dict, brand_username: str) -> Dict:
+        """POST_ITEMS_SCRIPT 항목을 리포스트 비디오 데이터로 변환"""
+        video_data = {
+            'video_url': raw['link'],
+            'repost_username': brand_username
+        }
+        if raw.get('src') is not None:
+            video_data['thumbnail_url'] = raw['src']
+            video_data['title'] = raw.get('alt') or ''
+        if raw.get('views') is not None:
+            video_data['view_count'] = TikTokDataParser.parse_count(raw['views'])
+        if raw.get('original_user'):
+            video_data['original_username'] = raw['original_user'].replace('@', '')
+        return video_data
+
+    def _merge_captured_brand_repost(self, video_data: Dict, capture) -> None:
+        """응답 캡처의 정확한 통계/게시일/원본 정보를 리포스트 비디오 데이터에 병합"""
+        captured = capture.get_video(TikTokUrlUtils.extract_video_id_from_url(video_data['video_url']))
+        if not captured:
+            return
+        video_data.update({
+            key: captured[key]
+            for key in ('view_count', 'hashtags') + self.CAPTURED_STAT_FIELDS
+            if captured.get(key) is not None
+        })
+        if captured.get('author'):
+            video_data.setdefault('original_username', captured['author'])
+            video_data['original_video_id'] = captured['video_id']
+
+    def _save_brand_repost_batch(self, brand_account_id: int, videos: List[Dict], result: Dict) -> None:
+        """리포스트 비디오를 일괄 저장(있으면 갱신)하고 result 의 통계/목록에 반영"""
+        try:
+            # 브랜드 수집은 썸네일을 업로드하지 않으므로 최신 썸네일 URL 로 갱신
+            upsert = self.db_handler.bulk_upsert_repost_videos(videos, brand_account_id, ('thumbnail_url',))
+        except Exception as e:
+            print(f"Error saving videos to DB: {e}")
+            result["stats"]["errors"] += len(videos)
+            return
+
+        result["stats"]["new_videos"] += upsert["created"]
+        result["stats"]["updated_videos"] += upsert["updated"]
+        result["repost_videos"].extend(videos)
+
+    @staticmethod
+    def _print_brand_result(brand_username: str, result: Dict) -> None:
+        print(f"\nCollection complete for {brand_username}:")
+        print(f"  Total videos: {result['stats']['total_videos']}")
+        print(f"  New videos: {result['stats']['new_videos']}")
+        print(f"  Updated videos: {result['stats']['updated_videos']}")
+        print(f"  Errors: {result['stats']['errors']}")
 
     def _get_or_create_brand_account(self, username: str) -> 'TikTokBrandAccount':
         """
@@ -1091,9 +1718,26 @@ class TikTokService:
         return self.db_handler.get_or_create_brand_account(username)
 
     # === DATABASE OPERATIONS ===
+    @staticmethod
+    def _resolve_view_count(video_data: Dict) -> int:
+        """캡처된 정확한 조회수 우선, 없으면 DOM 텍스트("1.2M") 파싱"""
+        if video_data.get('view_count') is not None:
+            return video_data['view_count']
+        return TikTokDataParser.parse_count(video_data.get('views', '0'))
+
+    @classmethod
+    def _captured_video_fields(cls, video_data: Dict, extra_keys: Tuple[str, ...] = ()) -> Dict:
+        """결과 항목에서 캡처된 통계 필드만 추출 (값이 있는 것만)"""
+        return {
+            key: video_data[key]
+            for key in cls.CAPTURED_STAT_FIELDS + extra_keys
+            if video_data.get(key) is not None
+        }
+
     def _save_video_results_to_db(self, results: List[Dict], username: str, is_repost: bool = False) -> Dict:
         """
-        추출된 비디오 결과를 데이터베이스에 저장합니다.
+        추출된 비디오 결과를 데이터베이스에 저장하고 썸네일을 바로 업로드합니다.
+        (스크랩 루프에서는 ScrapePipeline 으로 _write_video_rows 와 이미지 단계를 분리해 사용)
         
         Args:
             results: 추출된 비디오 데이터
@@ -1103,212 +1747,136 @@ class TikTokService:
         Returns:
             저장 결과 통계
         """
+        stats, image_tasks = self._write_video_rows(results, username, is_repost)
+        for task in image_tasks:
+            try:
+                local_path = self._download_thumbnail(task)
+                if local_path:
+                    self._upload_image_task(task, local_path)
+            except Exception as e:
+                print(f"⚠️ 썸네일 업로드 중 오류 (무시됨): {e}")
+        self._flush_image_urls()
+        return stats
+
+    def _write_video_rows(
+        self,
+        results: List[Dict],
+        username: str,
+        is_repost: bool = False,
+        latest_video_url: Optional[str] = None
+    ) -> Tuple[Dict, List[Dict]]:
+        """
+        추출된 비디오 결과를 데이터베이스에 저장합니다. (썸네일 다운로드/업로드 제외)
+
+        계정의 비디오 전체를 일괄 upsert 로 저장합니다. (행마다 조회/커밋하지 않음)
+        
+        Args:
+            results: 추출된 비디오 데이터
+            username: 사용자명
+            is_repost: 리포스트 비디오 여부
+            latest_video_url: 다음 증분 수집 기준점 (없으면 results 의 첫 항목, 증분 수집 시 그리드 기준 값 전달)
+            
+        Returns:
+            (저장 결과 통계, 썸네일 다운로드/업로드 작업 리스트)
+        """
         if not self.db_session:
             print("⚠️ 데이터베이스 세션이 없습니다. 저장을 건너뜁니다.")
-            return {"error": "No database session"}
+            return {"error": "No database session"}, []
         
         try:
             if is_repost:
                 # 리포스트 비디오를 위한 브랜드 계정 조회/생성
                 brand_account = self._get_or_create_brand_account(username)
-                brand_account_id = brand_account.id
-                saved_count = 0
-                
-                # 리포스트 비디오 데이터를 tiktok_repost_videos 테이블에 저장
-                for video_data in results:
-                    try:
-                        # 썸네일 이미지 다운로드
-                        original_thumbnail = video_data.get('src', '')
-                        local_thumbnail_path = TikTokImageUtils.download_image(original_thumbnail, username, "repost_thumb", self.image_base_dir) if original_thumbnail else None
-                        
-                        # 데이터 매핑
-                        repost_data = {
-                            'video_url': video_data.get('link', ''),
-                            'title': video_data.get('alt', ''),
-                            'thumbnail_url': original_thumbnail,  # 원본 URL 저장 (관리페이지 업로드 후 업데이트)
-                            'view_count': TikTokDataParser.parse_count(video_data.get('views', '0')),
-                            'repost_username': username
-                        }
-                        
-                        # 중복 체크
-                        existing_video = self.db_session.query(TikTokRepostVideo).filter(
-                            TikTokRepostVideo.tiktok_brand_account_id == brand_account_id,
-                            TikTokRepostVideo.video_url == repost_data['video_url']
-                        ).first()
-                        
-                        repost_record = None
-                        if existing_video:
-                            # 동시성 문제 해결을 위한 재시도 로직
-                            max_retries = 3
-                            for attempt in range(max_retries):
-                                try:
-                                    # 세션 새로고침으로 최신 데이터 가져오기
-                                    self.db_session.refresh(existing_video)
-                                    
-                                    # 기존 리포스트 비디오 정보 업데이트
-                                    existing_video.title = repost_data['title']
-                                    existing_video.view_count = repost_data['view_count']
-                                    existing_video.updated_at = datetime.now()
-                                    
-                                    # 즉시 커밋하여 락 해제
-                                    self.db_session.commit()
-                                    repost_record = existing_video
-                                    print(f"🔄 기존 리포스트 비디오 업데이트: {repost_data['video_url'][:50]}...")
-                                    break
-                                    
-                                except Exception as retry_error:
-                                    self.db_session.rollback()
-                                    if attempt < max_retries - 1:
-                                        print(f"⚠️ 업데이트 재시도 {attempt + 1}/{max_retries}: {retry_error}")
-                                        time.sleep(0.1 * (attempt + 1))  # 지수 백오프
-                                        # 레코드 다시 조회
-                                        existing_video = self.db_session.query(TikTokRepostVideo).filter(
-                                            TikTokRepostVideo.tiktok_brand_account_id == brand_account_id,
-                                            TikTokRepostVideo.video_url == repost_data['video_url']
-                                        ).first()
-                                        if not existing_video:
-                                            print(f"⚠️ 레코드가 삭제됨, 새로 생성합니다.")
-                                            break
-                                    else:
-                                        print(f"❌ 최대 재시도 횟수 초과: {retry_error}")
-                                        raise retry_error
-                        
-                        if not repost_record:
-                            # 새 리포스트 비디오 생성 및 저장
-                            repost_video = TikTokRepostVideo.from_scrape_data(repost_data, brand_account_id)
-                            self.db_session.add(repost_video)
-                            self.db_session.commit()  # 즉시 커밋
-                            repost_record = repost_video
-                            print(f"✅ 새 리포스트 비디오 추가: {repost_data['video_url'][:50]}...")
-                        
-                        # 이미지를 관리페이지에 업로드하고 URL 업데이트
-                        if local_thumbnail_path and repost_record:
-                            try:
-                                uploaded_url = TikTokImageUtils.upload_downloaded_image(
-                                    local_thumbnail_path, username, repost_record.id, "repost_video", settings.ADMIN_URL
-                                )
-                                if uploaded_url:
-                                    # 별도의 트랜잭션으로 썸네일 URL 업데이트
-                                    max_retries = 3
-                                    for retry in range(max_retries):
-                                        try:
-                                            # 새로운 세션에서 레코드 다시 조회
-                                            updated_record = self.db_session.query(TikTokRepostVideo).filter(
-                                                TikTokRepostVideo.id == repost_record.id
-                                            ).first()
-                                            if updated_record:
-                                                updated_record.thumbnail_url = uploaded_url
-                                                self.db_session.commit()
-                                                print(f"🖼️ 리포스트 썸네일 관리페이지 업로드 완료: repost video ID {repost_record.id}")
-                                                break
-                                        except Exception as update_error:
-                                            self.db_session.rollback()
-                                            if retry < max_retries - 1:
-                                                time.sleep(0.1 * (retry + 1))
-                                            else:
-                                                print(f"⚠️ 썸네일 URL 업데이트 실패: {update_error}")
-                            except Exception as upload_error:
-                                print(f"⚠️ 썸네일 업로드 중 오류 (무시됨): {upload_error}")
-
-                        saved_count += 1
+                owner_key, owner_id = "brand_account_id", brand_account.id
 
-                    except Exception as e:
-                        print(f"⚠️ 리포스트 비디오 저장 중 오류: {e}")
-                        # 트랜잭션 롤백
-                        self.db_session.rollback()
-                        continue
-                        
+                # 데이터 매핑 (썸네일은 원본 URL 저장 후 관리페이지 업로드 시 업데이트)
+                rows = []
+                for video_data in results:
+                    repost_data = {
+                        'video_url': video_data.get('link', ''),
+                        'title': video_data.get('alt', ''),
+                        'thumbnail_url': video_data.get('src', ''),
+                        'view_count': self._resolve_view_count(video_data),
+                        'repost_username': username
+                    }
+                    # 응답 캡처로 얻은 정확한 통계/원본 정보
+                    repost_data.update(self._captured_video_fields(
+                        video_data, ('original_username', 'original_video_id', 'hashtags')
+                    ))
+                    rows.append(repost_data)
+
+                upsert = self.db_handler.bulk_upsert_repost_videos(rows, owner_id)
+                table_type, image_type = 'repost_video', 'repost_thumb'
             else:
-                # 일반 비디오 저장 (기존 로직)
+                # 일반 비디오 저장
                 user_repo = TikTokUserRepository(self.db_session)
                 tiktok_user = user_repo.get_by_username(username)
                 
                 if not tiktok_user:
                     raise TikTokUserNotFoundException(username, table="tiktok_users")
                 
-                tiktok_user_id = tiktok_user.id
-                saved_count = 0
-                
-                # 각 비디오 데이터를 데이터베이스에 저장
+                owner_key, owner_id = "tiktok_user_id", tiktok_user.id
+
+                # 데이터 매핑: link->video_url, alt->title, src->thumbnail_url, views->view_count
+                rows = []
                 for video_data in results:
-                    try:
-                        # 썸네일 이미지 다운로드
-                        original_thumbnail = video_data.get('src', '')
-                        local_thumbnail_path = TikTokImageUtils.download_image(original_thumbnail, username, "video_thumb", self.image_base_dir) if original_thumbnail else None
-                        
-                        # 데이터 매핑: link->video_url, alt->title, src->thumbnail_url, views->view_count
-                        mapped_data = {
-                            'link': video_data.get('link', ''),
-                            'alt': video_data.get('alt', ''),
-                            'src': original_thumbnail,  # 원본 URL 저장 (관리페이지 업로드 후 업데이트)
-                            'views': TikTokDataParser.parse_count(video_data.get('views', '0'))
-                        }
-                        
-                        # 중복 체크 (같은 video_url이 이미 있는지 확인)
-                        existing_video = self.db_session.query(TikTokVideo).filter(
-                            TikTokVideo.tiktok_user_id == tiktok_user_id,
-                            TikTokVideo.video_url == mapped_data['link']
-                        ).first()
-                        
-                        video_record = None
-                        if existing_video:
-                            # 기존 비디오 정보 업데이트
-                            existing_video.title = mapped_data['alt']
-                            existing_video.view_count = mapped_data['views']
-                            video_record = existing_video
-                            print(f"🔄 기존 비디오 업데이트: {mapped_data['link'][:50]}...")
-                        else:
-                            # 새 비디오 생성 및 저장
-                            video = TikTokVideo.from_scrape_data(mapped_data, tiktok_user_id)
-                            self.db_session.add(video)
-                            self.db_session.flush()  # ID 생성을 위해 flush
-                            video_record = video
-                            print(f"✅ 새 비디오 추가: {mapped_data['link'][:50]}...")
-                        
-                        # 이미지를 관리페이지에 업로드하고 URL 업데이트
-                        if local_thumbnail_path and video_record:
-                            uploaded_url = TikTokImageUtils.upload_downloaded_image(
-                                local_thumbnail_path, username, video_record.id, "video", settings.ADMIN_URL
-                            )
-                            if uploaded_url:
-                                video_record.thumbnail_url = uploaded_url
-                                print(f"🖼️ 썸네일 관리페이지 업로드 완료: video ID {video_record.id}")
-                        
-                        saved_count += 1
-                        
-                    except Exception as e:
-                        print(f"⚠️ 비디오 저장 중 오류: {e}")
-                        continue
-            
-            # 커밋
-            self.db_session.commit()
-            
-            print(f"✅ {username}: 총 {len(results)}개 중 {saved_count}개 비디오를 데이터베이스에 저장했습니다.")
+                    mapped_data = {
+                        'link': video_data.get('link', ''),
+                        'alt': video_data.get('alt', ''),
+                        'src': video_data.get('src', ''),
+                        'views': self._resolve_view_count(video_data)
+                    }
+                    # 응답 캡처로 얻은 정확한 통계 (posted_at, like/comment/share)
+                    mapped_data.update(self._captured_video_fields(video_data))
+                    rows.append(mapped_data)
+
+                upsert = self.db_handler.bulk_upsert_videos(rows, owner_id)
+                table_type, image_type = 'video', 'video_thumb'
+
+            # 썸네일은 커밋 후 다운로드/업로드 (URL 은 별도 세션으로 업데이트)
+            image_tasks = []
+            for video_data in results:
+                record_id = upsert['ids'].get(video_data.get('link'))
+                if video_data.get('src') and record_id:
+                    image_tasks.append({
+                        'url': video_data['src'],
+                        'username': username,
+                        'image_type': image_type,
+                        'record_id': record_id,
+                        'table_type': table_type
+                    })
+
+            # 다음 증분 수집 기준점 (이번에 추출한 그리드의 가장 위 항목)
+            if results:
+                latest_video_url = latest_video_url or results[0].get('link')
+                if is_repost:
+                    brand_account.latest_repost_video_url = latest_video_url
+                    brand_account.last_scraped_at = datetime.now()
+                else:
+                    tiktok_user.latest_video_url = latest_video_url
+                    tiktok_user.videos_scraped_at = datetime.now()
+                self.db_session.commit()
+
+            saved_count = upsert['created'] + upsert['updated']
+            print(f"✅ {username}: 총 {len(results)}개 중 {saved_count}개 비디오를 데이터베이스에 저장했습니다. (생성 {upsert['created']}, 업데이트 {upsert['updated']})")
             
-            if is_repost:
-                return {
-                    "success": True,
-                    "username": username,
-                    "total_videos": len(results),
-                    "saved_videos": saved_count,
-                    "brand_account_id": brand_account_id
-                }
-            else:
-                return {
-                    "success": True,
-                    "username": username,
-                    "total_videos": len(results),
-                    "saved_videos": saved_count,
-                    "tiktok_user_id": tiktok_user_id
-                }
+            return {
+                "success": True,
+                "username": username,
+                "total_videos": len(results),
+                "saved_videos": saved_count,
+                "created_videos": upsert['created'],
+                "updated_videos": upsert['updated'],
+                owner_key: owner_id
+            }, image_tasks
             
         except TikTokUserNotFoundException as e:
             print(f"❌ 사용자 '{e.username}'을 {e.table}에서 찾을 수 없습니다.")
-            return {"error": e.message}
+            return {"error": e.message}, []
         except Exception as e:
             print(f"❌ 데이터베이스 저장 중 오류: {e}")
             self.db_session.rollback()
-            return {"error": str(e)}
+            return {"error": str(e)}, []
 
     # === MESSAGE SYSTEM ===
     def send_bulk_tiktok_messages(
@@ -1495,13 +2063,9 @@ class TikTokService:
                 "details": results
             }
         
-        # Windows에서 이벤트 루프 정책 설정
-        if os.name == 'nt':
-            asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-        
         try:
-            # 새 이벤트 루프 실행
-            result = asyncio.run(_send_bulk_messages())
+            # 브라우저 루프에서 실행
+            result = browser_loop.run(_send_bulk_messages())
             
             # 메시지 전송 완료 후 처리
             if message_id:
@@ -2053,6 +2617,90 @@ class TikTokService:
 
         return self._upload_image_to_admin(local_path, username, "image", record_id, table_type)
 
+    async def _collect_profile_user_async(self, browser_manager, profile_url: str) -> Dict:
+        """
+        프로필 페이지로 이동해 사용자 정보를 수집합니다.
+
+        domcontentloaded 직후 하이드레이션 JSON 을 먼저 읽고, 데이터가 없을 때만
+        로딩 대기 후 DOM 셀렉터로 수집합니다. (패스키 모달은 등록된 핸들러가 처리)
+
+        Args:
+            browser_manager: 초기화된 AsyncBrowserManager
+            profile_url: 프로필 URL
+
+        Returns:
+            사용자 정보 딕셔너리 (username, nickname, followers, bio, profile_image, profile_url 등)
+        """
+        page = browser_manager.page
+
+        print(f"🔗 프로필 페이지로 직접 이동: {profile_url}")
+        await browser_manager.goto(profile_url, wait_until="domcontentloaded")
+
+        user_data = {}
+        hydration_user = await browser_manager.extract_hydration_user()
+        if hydration_user:
+            print("⚡ 하이드레이션 데이터에서 사용자 정보 추출")
+            for key in ('username', 'nickname', 'followers', 'bio', 'profile_image'):
+                if hydration_user.get(key) is not None:
+                    user_data[key] = hydration_user[key]
+        else:
+            print("⚠️ 하이드레이션 데이터 없음. DOM 에서 수집합니다...")
+
+            # 프로필 요소 표시 + 네트워크 유휴까지 대기
+            print("⏳ 프로필 페이지 로딩 대기 중...")
+            if await browser_manager.wait_for_ready(selector='[data-e2e="user-title"]'):
+                print("✅ 프로필 페이지 로드 완료")
+            else:
+                print("⚠️ 프로필 페이지 요소 확인 실패, 계속 진행...")
+
+            # username
+            username_element = await page.query_selector('[data-e2e="user-title"]')
+            if username_element:
+                username_text = await username_element.text_content()
+                user_data['username'] = username_text.strip() if username_text else None
+
+            # nickname
+            nickname_element = await page.query_selector('[data-e2e="user-subtitle"]')
+            if nickname_element:
+                nickname_text = await nickname_element.text_content()
+                user_data['nickname'] = nickname_text.strip() if nickname_text else None
+
+            # followers
+            followers_element = await page.query_selector('[data-e2e="followers-count"]')
+            if followers_element:
+                followers_text = await followers_element.text_content()
+                user_data['followers'] = TikTokDataParser.parse_follower_count(followers_text)
+
+            # bio
+            bio_element = await page.query_selector('[data-e2e="user-bio"]')
+            if bio_element:
+                bio_text = await bio_element.text_content()
+                user_data['bio'] = bio_text.strip() if bio_text else None
+
+            # profile image
+            avatar_element = await page.query_selector('[data-e2e="user-avatar"] img')
+            if avatar_element:
+                user_data['profile_image'] = await avatar_element.get_attribute('src')
+
+        # 프로필 이미지 다운로드
+        profile_image = user_data.get('profile_image')
+        if profile_image and user_data.get('username'):
+            local_image_path = await asyncio.to_thread(
+                self._download_image,
+                profile_image,
+                user_data['username'],
+                'profile'
+            )
+            if local_image_path:
+                print(f"✅ 프로필 이미지 저장: {local_image_path}")
+                # 로컬 이미지 경로를 user_data에 저장
+                user_data['local_profile_image_path'] = local_image_path
+
+        # profile URL
+        user_data['profile_url'] = page.url
+
+        return user_data
+
     def collect_user_from_video(self, video_url: str) -> Optional[Dict]:
         """
         비디오 페이지에서 사용자 정보를 수집합니다.
@@ -2079,83 +2727,15 @@ class TikTokService:
             """내부 비동기 사용자 수집 함수"""
             try:
                 async with AsyncBrowserManager() as browser_manager:
-                    # 브라우저 초기화
-                    await browser_manager.initialize(headless=False, session_file=None)
-                    page = browser_manager.page
-
-                    # 프로필 페이지로 직접 이동
-                    print(f"👤 프로필 페이지로 직접 이동: {profile_url}")
-                    await page.goto(profile_url, wait_until="domcontentloaded")
-
-                    # 페이지 로딩 대기 (초기 대기)
-                    print("⏳ 페이지 초기 로딩 대기 중...")
-                    await page.wait_for_timeout(3000)  # 3초 대기
-
-                    # 패스키 모달 처리
-                    await page.wait_for_timeout(2000)  # 모달이 나타날 시간을 주기 위해 짧은 대기
-                    await browser_manager.handle_passkey_modal()
-
-                    # 추가 페이지 로딩 대기
-                    print("⏳ 프로필 페이지 로딩 대기 중 (10초)...")
-                    await page.wait_for_timeout(10000)  # 10초 대기
-
-                    # 프로필 요소가 로드되었는지 확인
-                    try:
-                        await page.wait_for_selector('[data-e2e="user-title"]', timeout=5000)
-                        print("✅ 프로필 페이지 로드 완료")
-                    except:
-                        print("⚠️ 프로필 페이지 요소 확인 실패, 계속 진행...")
-
-                    # 추가 안정화 대기
-                    await page.wait_for_timeout(3000)
-
-                    # 사용자 정보 수집
-                    user_data = {}
-
-                    # username
-                    username_element = await page.query_selector('[data-e2e="user-title"]')
-                    if username_element:
-                        username_text = await username_element.text_content()
-                        user_data['username'] = username_text.strip() if username_text else None
-
-                    # nickname
-                    nickname_element = await page.query_selector('[data-e2e="user-subtitle"]')
-                    if nickname_element:
-                        nickname_text = await nickname_element.text_content()
-                        user_data['nickname'] = nickname_text.strip() if nickname_text else None
-
-                    # followers
-                    followers_element = await page.query_selector('[data-e2e="followers-count"]')
-                    if followers_element:
-                        followers_text = await followers_element.text_content()
-                        user_data['followers'] = TikTokDataParser.parse_follower_count(followers_text)
-
-                    # bio
-                    bio_element = await page.query_selector('[data-e2e="user-bio"]')
-                    if bio_element:
-                        bio_text = await bio_element.text_content()
-                        user_data['bio'] = bio_text.strip() if bio_text else None
-
-                    # profile image
-                    avatar_element = await page.query_selector('[data-e2e="user-avatar"] img')
-                    if avatar_element:
-                        profile_image = await avatar_element.get_attribute('src')
-                        user_data['profile_image'] = profile_image
-
-                        # 프로필 이미지 다운로드
-                        if profile_image and user_data.get('username'):
-                            local_image_path = self._download_image(
-                                profile_image,
-                                user_data['username'],
-                                'profile'
-                            )
-                            if local_image_path:
-                                print(f"✅ 프로필 이미지 저장: {local_image_path}")
-                                # 로컬 이미지 경로를 user_data에 저장
-                                user_data['local_profile_image_path'] = local_image_path
+                    # 브라우저 초기화 (텍스트/이미지 URL 만 필요하므로 리소스 차단)
+                    await browser_manager.initialize(
+                        headless=False,
+                        session_file=None,
+                        block_resources=TikTokBrowserConfig.text_only_block_resources()
+                    )
 
-                    # profile URL
-                    user_data['profile_url'] = page.url
+                    # 프로필 페이지 이동 및 사용자 정보 수집 (하이드레이션 JSON 우선)
+                    user_data = await self._collect_profile_user_async(browser_manager, profile_url)
 
                     print(f"✅ 사용자 정보 수집 완료: {user_data.get('username', 'Unknown')}")
                     return user_data
@@ -2166,13 +2746,8 @@ class TikTokService:
                 traceback.print_exc()
                 return None
 
-        # 동기 함수에서 비동기 함수 실행
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(_collect_user_async())
-        finally:
-            loop.close()
+        # 브라우저 루프에서 비동기 함수 실행
+        return browser_loop.run(_collect_user_async())
 
     def save_collected_user_with_upload(self, user_data: Dict, repost_video_id: int = None) -> Dict:
         """
@@ -2347,15 +2922,22 @@ class TikTokService:
         async def _collect_multiple_users_async():
             processed_count = 0
             collected_users = []
+            resource_blocking = None
             failed_videos = []
 
             try:
                 async with AsyncBrowserManager() as browser_manager:
-                    # 브라우저 초기화 (한 번만) - user_agent, session_file 전달
-                    await browser_manager.initialize(headless=False, session_file=session_file, user_agent=user_agent)
-                    page = browser_manager.page
+                    # 브라우저 초기화 (한 번만) - user_agent, session_file 전달, 텍스트만 필요하므로 리소스 차단
+                    await browser_manager.initialize(
+                        headless=False,
+                        session_file=session_file,
+                        user_agent=user_agent,
+                        block_resources=TikTokBrowserConfig.text_only_block_resources()
+                    )
 
-                    for video_data in video_data_list:
+                    self._report_progress(total=len(video_data_list), processed=0, collected=0, failed=0)
+                    visited_profiles = 0
+                    for video_idx, video_data in enumerate(video_data_list, 1):
                         video_url = video_data.get('video_url')
                         video_id = video_data.get('video_id')
                         country = video_data.get('country')
@@ -2373,74 +2955,13 @@ class TikTokService:
                             profile_url = f"https://www.tiktok.com/@{username}"
                             print(f"👤 추출된 사용자명: {username}")
 
-                            # 프로필 페이지로 직접 이동
-                            print(f"🔗 프로필 페이지로 직접 이동: {profile_url}")
-                            await page.goto(profile_url, wait_until="domcontentloaded")
-
-                            # 패스키 모달 처리
-                            await page.wait_for_timeout(2000)  # 모달이 나타날 시간을 주기 위해 짧은 대기
-                            await browser_manager.handle_passkey_modal()
-
-                            # 추가 페이지 로딩 대기
-                            print("⏳ 프로필 페이지 로딩 대기 중 (10초)...")
-                            await page.wait_for_timeout(10000)  # 10초 대기
-
-                            # 프로필 요소가 로드되었는지 확인
-                            try:
-                                await page.wait_for_selector('[data-e2e="user-title"]', timeout=5000)
-                                print("✅ 프로핀 페이지 로드 완료")
-                            except:
-                                print("⚠️ 프로필 페이지 요소 확인 실패, 계속 진행...")
-
-                            # 추가 안정화 대기
-                            await page.wait_for_timeout(3000)
-
-                            # 사용자 정보 수집
-                            user_data = {}
-
-                            # username
-                            username_element = await page.query_selector('[data-e2e="user-title"]')
-                            if username_element:
-                                username_text = await username_element.text_content()
-                                user_data['username'] = username_text.strip() if username_text else None
-
-                            # nickname
-                            nickname_element = await page.query_selector('[data-e2e="user-subtitle"]')
-                            if nickname_element:
-                                nickname_text = await nickname_element.text_content()
-                                user_data['nickname'] = nickname_text.strip() if nickname_text else None
-
-                            # followers
-                            followers_element = await page.query_selector('[data-e2e="followers-count"]')
-                            if followers_element:
-                                followers_text = await followers_element.text_content()
-                                user_data['followers'] = TikTokDataParser.parse_follower_count(followers_text)
-
-                            # bio
-                            bio_element = await page.query_selector('[data-e2e="user-bio"]')
-                            if bio_element:
-                                bio_text = await bio_element.text_content()
-                                user_data['bio'] = bio_text.strip() if bio_text else None
-
-                            # profile image
-                            avatar_element = await page.query_selector('[data-e2e="user-avatar"] img')
-                            if avatar_element:
-                                profile_image = await avatar_element.get_attribute('src')
-                                user_data['profile_image'] = profile_image
-
-                                # 프로필 이미지 다운로드
-                                if profile_image and user_data.get('username'):
-                                    local_image_path = self._download_image(
-                                        profile_image,
-                                        user_data['username'],
-                                        'profile'
-                                    )
-                                    if local_image_path:
-                                        print(f" 프로필 이미지 저장: {local_image_path}")
-                                        user_data['local_profile_image_path'] = local_image_path
-
-                            # profile URL
-                            user_data['profile_url'] = page.url
+                            # 이전 프로필 방문 후 방문 간격 유지
+                            if visited_profiles:
+                                await browser_manager.politeness_delay("다음 프로필 방문")
+                            visited_profiles += 1
+
+                            # 프로필 페이지 이동 및 사용자 정보 수집 (하이드레이션 JSON 우선)
+                            user_data = await self._collect_profile_user_async(browser_manager, profile_url)
 
                             # country 값 추가
                             if country:
@@ -2450,7 +2971,7 @@ class TikTokService:
 
                             # 사용자 정보 저장
                             if user_data and user_data.get('username'):
-                                save_result = self.save_collected_user_with_upload(user_data, video_id)
+                                save_result = await asyncio.to_thread(self.save_collected_user_with_upload, user_data, video_id)
                                 if save_result and save_result.get('success'):
                                     collected_users.append(user_data['username'])
                                     processed_count += 1
@@ -2463,6 +2984,20 @@ class TikTokService:
                             print(f" 비디오 {video_id} 처리 실패: {e}")
                             failed_videos.append(video_id)
                             continue
+                        finally:
+                            self._report_progress(
+                                processed=video_idx,
+                                collected=len(collected_users),
+                                failed=len(failed_videos)
+                            )
+
+                    # 리소스 차단 통계 기록
+                    resource_blocking = browser_manager.blocked_resource_stats()
+                    if resource_blocking:
+                        self._report_progress(
+                            blocked_requests=resource_blocking['blocked_requests'],
+                            estimated_bytes_saved=resource_blocking['estimated_bytes_saved']
+                        )
 
             except Exception as e:
                 print(f" 브라우저 오류: {e}")
@@ -2472,15 +3007,9 @@ class TikTokService:
             return {
                 "processed": processed_count,
                 "collected_users": collected_users,
-                "failed_videos": failed_videos
+                "failed_videos": failed_videos,
+                "resource_blocking": resource_blocking
             }
 
-        # 비동기 함수를 동기적으로 실행
-        import nest_asyncio
-        nest_asyncio.apply()
-
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(_collect_multiple_users_async())
-        finally:
-            loop.close()
\ No newline at end of file
+        # 브라우저 루프에서 비동기 함수 실행
+        return browser_loop.run(_collect_multiple_users_async())
\ No newline at end of file
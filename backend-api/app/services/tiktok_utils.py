@@ -10,6 +10,7 @@ TikTokService에서 중복되는 로직들을 모듈화한 유틸리티 클래
 
 import os
 import re
+import json
 import time
 import random
 import hashlib
@@ -138,6 +139,192 @@ class TikTokDataParser:
         return [tag.replace('#', '') for tag in hashtags]
 
 
+class TikTokApiParser:
+    """TikTok 웹 데이터 API(JSON) 응답 파싱 유틸리티
+
+    페이지가 자체적으로 받는 item_list / user detail / search 응답에서
+    DOM 텍스트보다 정확한 값(정수 카운트, 게시 시각 등)을 추출합니다.
+    """
+
+    @staticmethod
+    def _to_int(value: Any) -> Optional[int]:
+        """숫자 또는 숫자 문자열을 int 로 변환 (변환 불가 시 None)"""
+        if value is None or isinstance(value, bool):
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _pick_stat(stats: Dict, stats_v2: Dict, key: str) -> Optional[int]:
+        """statsV2(문자열, 큰 수 정밀도 유지) 우선, 없으면 stats 값 사용"""
+        value = TikTokApiParser._to_int(stats_v2.get(key))
+        if value is None:
+            value = TikTokApiParser._to_int(stats.get(key))
+        return value
+
+    @staticmethod
+    def parse_video_item(item: Dict) -> Optional[Dict]:
+        """
+        item_list 의 비디오 항목 하나를 정규화
+
+        Args:
+            item: itemList 원소
+
+        Returns:
+            {video_id, author, video_url, title, thumbnail_url, view_count, like_count,
+             comment_count, share_count, posted_at, hashtags} 또는 None
+        """
+        if not isinstance(item, dict) or not item.get('id'):
+            return None
+
+        video_id = str(item['id'])
+        author = item.get('author')
+        author_name = author.get('uniqueId') if isinstance(author, dict) else author
+        stats = item.get('stats') or {}
+        stats_v2 = item.get('statsV2') or {}
+        video = item.get('video') or {}
+
+        create_time = TikTokApiParser._to_int(item.get('createTime'))
+        posted_at = datetime.fromtimestamp(create_time) if create_time else None
+
+        hashtags = [extra.get('hashtagName') for extra in item.get('textExtra') or [] if extra.get('hashtagName')]
+        if not hashtags:
+            hashtags = [challenge.get('title') for challenge in item.get('challenges') or [] if challenge.get('title')]
+
+        return {
+            'video_id': video_id,
+            'author': author_name,
+            'video_url': TikTokUrlUtils.build_video_url(author_name, video_id) if author_name else None,
+            'title': item.get('desc'),
+            'thumbnail_url': video.get('cover') or video.get('originCover'),
+            'view_count': TikTokApiParser._pick_stat(stats, stats_v2, 'playCount'),
+            'like_count': TikTokApiParser._pick_stat(stats, stats_v2, 'diggCount'),
+            'comment_count': TikTokApiParser._pick_stat(stats, stats_v2, 'commentCount'),
+            'share_count': TikTokApiParser._pick_stat(stats, stats_v2, 'shareCount'),
+            'posted_at': posted_at,
+            'hashtags': hashtags or None
+        }
+
+    @staticmethod
+    def parse_item_list(payload: Dict) -> List[Dict]:
+        """/api/post/item_list, /api/repost/item_list 응답에서 비디오 목록 추출"""
+        if not isinstance(payload, dict):
+            return []
+        items = [TikTokApiParser.parse_video_item(item) for item in payload.get('itemList') or []]
+        return [item for item in items if item]
+
+    @staticmethod
+    def parse_list_cursor(payload: Dict) -> Optional[Dict]:
+        """
+        item_list 응답의 페이지네이션 정보 추출
+
+        Returns:
+            {cursor: 다음 요청 커서, has_more: 다음 페이지 존재 여부} 또는 None
+        """
+        if not isinstance(payload, dict) or 'hasMore' not in payload:
+            return None
+        cursor = payload.get('cursor')
+        return {
+            'cursor': str(cursor) if cursor is not None else None,
+            'has_more': bool(payload.get('hasMore'))
+        }
+
+    @staticmethod
+    def parse_user_info(user_info: Dict) -> Optional[Dict]:
+        """
+        userInfo({user, stats, statsV2}) 를 사용자 데이터로 정규화
+
+        Returns:
+            {username, nickname, followers, following_count, video_count, bio,
+             profile_image, is_verified} 또는 None
+        """
+        if not isinstance(user_info, dict):
+            return None
+        user = user_info.get('user') or {}
+        if not user.get('uniqueId'):
+            return None
+        stats = user_info.get('stats') or {}
+        stats_v2 = user_info.get('statsV2') or {}
+
+        return {
+            'username': user.get('uniqueId'),
+            'nickname': user.get('nickname'),
+            'followers': TikTokApiParser._pick_stat(stats, stats_v2, 'followerCount'),
+            'following_count': TikTokApiParser._pick_stat(stats, stats_v2, 'followingCount'),
+            'video_count': TikTokApiParser._pick_stat(stats, stats_v2, 'videoCount'),
+            'bio': user.get('signature'),
+            'profile_image': user.get('avatarLarger') or user.get('avatarMedium') or user.get('avatarThumb'),
+            'is_verified': bool(user.get('verified'))
+        }
+
+    @staticmethod
+    def parse_user_detail(payload: Dict) -> Optional[Dict]:
+        """/api/user/detail 응답에서 사용자 정보 추출"""
+        if not isinstance(payload, dict):
+            return None
+        return TikTokApiParser.parse_user_info(payload.get('userInfo'))
+
+    @staticmethod
+    def parse_hydration_user(script_text: Optional[str]) -> Optional[Dict]:
+        """
+        프로필 HTML 에 포함된 하이드레이션 JSON 에서 사용자 정보 추출
+
+        Args:
+            script_text: __UNIVERSAL_DATA_FOR_REHYDRATION__ 또는 SIGI_STATE 스크립트 내용
+
+        Returns:
+            parse_user_info 형식의 사용자 데이터 또는 None (구조가 다르거나 사용자 정보가 없는 경우)
+        """
+        if not script_text:
+            return None
+
+        try:
+            data = json.loads(script_text)
+        except (TypeError, ValueError):
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        # 현재 구조: __DEFAULT_SCOPE__["webapp.user-detail"].userInfo
+        scope = data.get('__DEFAULT_SCOPE__') or {}
+        user_detail = scope.get('webapp.user-detail') or {}
+        if user_detail.get('userInfo'):
+            return TikTokApiParser.parse_user_info(user_detail['userInfo'])
+
+        # 이전 구조(SIGI_STATE): UserModule.users / UserModule.stats
+        user_module = data.get('UserModule') or {}
+        users = user_module.get('users') or {}
+        if users:
+            unique_id, user = next(iter(users.items()))
+            stats = (user_module.get('stats') or {}).get(unique_id) or {}
+            return TikTokApiParser.parse_user_info({'user': user, 'stats': stats})
+
+        return None
+
+    @staticmethod
+    def parse_search_users(payload: Dict) -> List[Dict]:
+        """/api/search/user/full 응답에서 사용자 목록 추출"""
+        if not isinstance(payload, dict):
+            return []
+
+        users = []
+        for entry in payload.get('user_list') or []:
+            info = (entry or {}).get('user_info') or {}
+            if not info.get('unique_id'):
+                continue
+            avatar_urls = (info.get('avatar_thumb') or {}).get('url_list') or []
+            users.append({
+                'username': info.get('unique_id'),
+                'nickname': info.get('nickname'),
+                'followers': TikTokApiParser._to_int(info.get('follower_count')),
+                'bio': info.get('signature'),
+                'profile_image_url': avatar_urls[0] if avatar_urls else None
+            })
+        return users
+
+
 class TikTokWaitUtils:
     """대기 시간 관련 유틸리티"""
     
@@ -503,6 +690,18 @@ class TikTokUrlUtils:
         username = username.replace('@', '')
         return f"https://www.tiktok.com/@{username}"
     
+    @staticmethod
+    def extract_video_id_from_url(url: str) -> Optional[str]:
+        """비디오 URL에서 비디오 ID 추출"""
+        if not url:
+            return None
+
+        match = re.search(r'/(?:video|photo)/(\d+)', url)
+        if match:
+            return match.group(1)
+
+        return None
+
     @staticmethod
     def build_video_url(username: str, video_id: str) -> str:
         """비디오 URL 생성"""
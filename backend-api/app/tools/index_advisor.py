@@ -0,0 +1,431 @@
+"""
+인덱스 점검 도구
+
+백엔드가 자주 실행하는 조회 형태(QUERY_SHAPES)를 실제 스키마의 인덱스와 비교하고 EXPLAIN 결과를 보여줌
+- 조회 조건을 다 덮는 인덱스가 없으면 추가할 DDL 을 제안
+- 다른 인덱스의 앞부분과 같은 인덱스(중복)와, MySQL 에서는 서버 기동 후 한 번도 읽지 않은 인덱스도 표시
+- 스키마의 기준은 관리페이지(Laravel) 마이그레이션이므로 제안 DDL 은 마이그레이션으로 옮겨 적용
+
+사용 예:
+    python -m app.tools.index_advisor                      # .env 의 MySQL
+    python -m app.tools.index_advisor --url sqlite:///advisor.sqlite3 --create-schema
+    python -m app.tools.index_advisor --json
+"""
+
+import argparse
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Engine
+
+
+# 자주 실행되는 조회 형태
+# equality: = / IN 조건 컬럼, range: 범위 조건 또는 정렬 컬럼 (복합 인덱스에서 equality 다음에 와야 함)
+QUERY_SHAPES: List[Dict[str, Any]] = [
+    {
+        "name": "users_by_username",
+        "table": "tiktok_users",
+        "equality": ["username"],
+        "range": None,
+        "sources": [
+            "TikTokUserRepository.get_by_username / exists / upsert_from_scrape",
+            "TikTokDatabaseHandler.get_user_by_username / update_user_profile_image",
+            "TikTokService.save_collected_user_with_upload / send_bulk_messages"
+        ],
+        "sql": "SELECT id, followers FROM tiktok_users WHERE username = :username AND deleted_at IS NULL",
+        "params": {"username": "sample_user"}
+    },
+    {
+        "name": "users_changed_since",
+        "table": "tiktok_users",
+        "equality": [],
+        "range": "updated_at",
+        "sources": ["KnownUserIndex.refresh (변경분 갱신)"],
+        "sql": "SELECT username, followers, deleted_at FROM tiktok_users WHERE updated_at >= :since",
+        "params": {"since": "2025-01-01 00:00:00"}
+    },
+    {
+        "name": "users_by_keyword",
+        "table": "tiktok_users",
+        "equality": ["keyword"],
+        "range": "followers",
+        "sources": ["TikTokUserRepository.get_by_keyword"],
+        "sql": (
+            "SELECT id FROM tiktok_users WHERE keyword = :keyword AND deleted_at IS NULL "
+            "AND followers >= :min_followers ORDER BY followers DESC"
+        ),
+        "params": {"keyword": "sample", "min_followers": 1000}
+    },
+    {
+        "name": "videos_by_owner_url",
+        "table": "tiktok_videos",
+        "equality": ["tiktok_user_id", "video_url"],
+        "range": None,
+        "sources": ["TikTokDatabaseHandler.upsert_video / bulk_upsert_videos"],
+        "sql": "SELECT id FROM tiktok_videos WHERE tiktok_user_id = :owner_id AND video_url = :video_url",
+        "params": {"owner_id": 1, "video_url": "https://www.tiktok.com/@sample/video/1"}
+    },
+    {
+        "name": "videos_recent_by_owner",
+        "table": "tiktok_videos",
+        "equality": ["tiktok_user_id"],
+        "range": None,
+        "sources": [
+            "TikTokService._load_video_high_water_marks (증분 수집)",
+            "TikTokDatabaseHandler.get_videos_by_user_id"
+        ],
+        "sql": "SELECT video_url FROM tiktok_videos WHERE tiktok_user_id = :owner_id ORDER BY id DESC LIMIT 100",
+        "params": {"owner_id": 1}
+    },
+    {
+        "name": "reposts_by_owner_url",
+        "table": "tiktok_repost_videos",
+        "equality": ["tiktok_brand_account_id", "video_url"],
+        "range": None,
+        "sources": [
+            "TikTokDatabaseHandler.upsert_repost_video / bulk_upsert_repost_videos / get_repost_video_by_url"
+        ],
+        "sql": (
+            "SELECT id FROM tiktok_repost_videos "
+            "WHERE tiktok_brand_account_id = :owner_id AND video_url = :video_url"
+        ),
+        "params": {"owner_id": 1, "video_url": "https://www.tiktok.com/@sample/video/1"}
+    },
+    {
+        "name": "reposts_recent_by_owner",
+        "table": "tiktok_repost_videos",
+        "equality": ["tiktok_brand_account_id"],
+        "range": None,
+        "sources": [
+            "TikTokService._load_video_high_water_marks (증분 수집)",
+            "TikTokService._collect_brand_reposts_deep_async (저장된 URL 미리 읽기)"
+        ],
+        "sql": (
+            "SELECT video_url FROM tiktok_repost_videos WHERE tiktok_brand_account_id = :owner_id "
+            "ORDER BY id DESC LIMIT 100"
+        ),
+        "params": {"owner_id": 1}
+    },
+    {
+        "name": "reposts_page_by_owner",
+        "table": "tiktok_repost_videos",
+        "equality": ["tiktok_brand_account_id"],
+        "range": "posted_at",
+        "sources": ["GET /brand/{brand_id}/repost-videos (cursor 페이지네이션)"],
+        "sql": (
+            "SELECT id, posted_at FROM tiktok_repost_videos WHERE tiktok_brand_account_id = :owner_id "
+            "AND (posted_at < :posted_at OR (posted_at = :posted_at AND id < :id) OR posted_at IS NULL) "
+            "ORDER BY posted_at DESC, id DESC LIMIT 100"
+        ),
+        "params": {"owner_id": 1, "posted_at": "2025-01-01 00:00:00", "id": 1000}
+    },
+    {
+        "name": "reposts_unchecked",
+        "table": "tiktok_repost_videos",
+        "equality": ["is_checked"],
+        "range": None,
+        "sources": ["tiktok_jobs.run_collect_repost_users"],
+        "sql": "SELECT id, video_url FROM tiktok_repost_videos WHERE is_checked = :is_checked LIMIT 100",
+        "params": {"is_checked": "N"}
+    },
+    {
+        "name": "message_log_by_user_message",
+        "table": "tiktok_message_logs",
+        "equality": ["tiktok_user_id", "tiktok_message_id"],
+        "range": None,
+        "sources": ["TikTokMessageLogger.upsert_message_log"],
+        "sql": (
+            "SELECT id FROM tiktok_message_logs "
+            "WHERE tiktok_user_id = :user_id AND tiktok_message_id = :message_id"
+        ),
+        "params": {"user_id": 1, "message_id": 1}
+    },
+    {
+        "name": "upload_requests_pending",
+        "table": "tiktok_upload_requests",
+        "equality": ["is_uploaded", "is_confirm"],
+        "range": "deadline_date",
+        "sources": ["POST /tiktok/check-upload-requests"],
+        "sql": (
+            "SELECT id FROM tiktok_upload_requests WHERE is_uploaded = 0 AND is_confirm = 0 "
+            "AND (deadline_date IS NULL OR deadline_date >= :now)"
+        ),
+        "params": {"now": "2025-01-01 00:00:00"}
+    },
+    {
+        "name": "brand_by_username",
+        "table": "tiktok_brand_accounts",
+        "equality": ["username"],
+        "range": None,
+        "sources": ["TikTokDatabaseHandler.get_or_create_brand_account"],
+        "sql": "SELECT id FROM tiktok_brand_accounts WHERE username = :username",
+        "params": {"username": "sample_brand"}
+    }
+]
+
+
+class IndexAdvisor:
+    """QUERY_SHAPES 와 실제 스키마 비교"""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.dialect = engine.dialect.name
+        self.inspector = inspect(engine)
+        self._indexes: Dict[str, List[Dict]] = {}
+
+    def table_indexes(self, table: str) -> List[Dict]:
+        """
+        테이블의 인덱스 목록 (PRIMARY, 유니크 제약 포함, 이름 중복 제거)
+
+        Returns:
+            [{"name": 인덱스명, "columns": [컬럼...], "unique": bool}]
+        """
+        if table in self._indexes:
+            return self._indexes[table]
+
+        indexes: Dict[str, Dict] = {}
+        primary = self.inspector.get_pk_constraint(table)
+        if primary.get("constrained_columns"):
+            indexes["PRIMARY"] = {"name": "PRIMARY", "columns": primary["constrained_columns"], "unique": True}
+        for unique in self.inspector.get_unique_constraints(table):
+            # SQLite 에서는 이름 없는 유니크 제약이 있음
+            name = unique["name"] or f"unique({', '.join(unique['column_names'])})"
+            indexes[name] = {"name": name, "columns": unique["column_names"], "unique": True}
+        for index in self.inspector.get_indexes(table):
+            indexes.setdefault(index["name"], {
+                "name": index["name"],
+                "columns": [column for column in index["column_names"] if column],
+                "unique": bool(index.get("unique"))
+            })
+
+        self._indexes[table] = list(indexes.values())
+        return self._indexes[table]
+
+    @staticmethod
+    def coverage(shape: Dict, columns: List[str]) -> str:
+        """
+        인덱스가 조회 조건을 얼마나 덮는지
+
+        Returns:
+            "full": equality 컬럼 전체(순서 무관) 뒤에 range 컬럼까지
+            "partial": 앞부분 컬럼이 equality 일부만 덮거나 range 가 빠짐
+            "none": 첫 컬럼부터 조건에 쓰이지 않음
+        """
+        equality = shape["equality"]
+        prefix = columns[:len(equality)]
+        if equality and set(prefix) == set(equality):
+            if not shape["range"] or (len(columns) > len(equality) and columns[len(equality)] == shape["range"]):
+                return "full"
+            return "partial"
+        if not equality and shape["range"]:
+            return "full" if columns[:1] == [shape["range"]] else "none"
+
+        used = 0
+        for column in columns:
+            if column not in equality:
+                break
+            used += 1
+        return "partial" if used else "none"
+
+    def explain(self, shape: Dict) -> Dict[str, Any]:
+        """
+        EXPLAIN 실행 결과 요약
+
+        Returns:
+            {"index": 사용한 인덱스명 또는 None, "plan": 원본 계획(텍스트/행 목록)}
+        """
+        try:
+            with self.engine.connect() as conn:
+                if self.dialect == "sqlite":
+                    rows = conn.execute(text(f"EXPLAIN QUERY PLAN {shape['sql']}"), shape["params"]).mappings().all()
+                    details = [row["detail"] for row in rows]
+                    index = None
+                    for detail in details:
+                        match = re.search(r"USING (?:COVERING )?INDEX (\w+)", detail)
+                        if match:
+                            index = match.group(1)
+                            break
+                        if "INTEGER PRIMARY KEY" in detail:
+                            index = "PRIMARY"
+                            break
+                    return {"index": index, "plan": details}
+
+                rows = [dict(row) for row in conn.execute(text(f"EXPLAIN {shape['sql']}"), shape["params"]).mappings()]
+                index = rows[0].get("key") if rows else None
+                return {"index": index, "plan": [
+                    {key: row.get(key) for key in ("type", "possible_keys", "key", "key_len", "rows", "Extra")}
+                    for row in rows
+                ]}
+        except Exception as e:
+            return {"index": None, "plan": None, "error": str(e)}
+
+    def unused_indexes(self, tables: List[str]) -> Optional[List[Dict]]:
+        """
+        서버 기동 후 한 번도 읽지 않은 인덱스 (MySQL performance_schema, 다른 DB 이거나 권한이 없으면 None)
+        """
+        if self.dialect != "mysql":
+            return None
+        try:
+            with self.engine.connect() as conn:
+                rows = conn.execute(text(
+                    "SELECT object_name, index_name FROM performance_schema.table_io_waits_summary_by_index_usage "
+                    "WHERE object_schema = DATABASE() AND index_name IS NOT NULL AND index_name <> 'PRIMARY' "
+                    "AND count_read = 0"
+                )).all()
+        except Exception as e:
+            print(f"⚠️ performance_schema 조회 실패 (미사용 인덱스 점검 생략): {e}")
+            return None
+        return [{"table": table, "index": index} for table, index in rows if table in tables]
+
+    def redundant_indexes(self, table: str) -> List[Dict]:
+        """다른 인덱스의 앞부분과 컬럼이 같은 일반 인덱스 (긴 인덱스가 같은 조회와 외래 키를 대신할 수 있음)"""
+        indexes = self.table_indexes(table)
+        redundant = []
+        for index in indexes:
+            if index["unique"]:
+                continue
+            for other in indexes:
+                if other is not index and len(other["columns"]) > len(index["columns"]) \
+                        and other["columns"][:len(index["columns"])] == index["columns"]:
+                    redundant.append({
+                        "table": table,
+                        "index": index["name"],
+                        "covered_by": other["name"],
+                        "ddl": self.drop_index_ddl(table, index["name"])
+                    })
+                    break
+        return redundant
+
+    def create_index_ddl(self, shape: Dict) -> str:
+        """조회 조건을 다 덮는 인덱스 생성 DDL (Laravel 기본 인덱스명 규칙)"""
+        columns = shape["equality"] + ([shape["range"]] if shape["range"] else [])
+        name = f"{shape['table']}_{'_'.join(columns)}_index"
+        return f"CREATE INDEX {name} ON {shape['table']} ({', '.join(columns)});"
+
+    def drop_index_ddl(self, table: str, index: str) -> str:
+        if self.dialect == "mysql":
+            return f"DROP INDEX {index} ON {table};"
+        return f"DROP INDEX {index};"
+
+    def analyze(self) -> Dict[str, Any]:
+        """
+        전체 점검
+
+        Returns:
+            {"dialect", "shapes": [조회 형태별 결과], "missing": [제안 DDL 목록],
+             "redundant": [중복 인덱스], "unused": [미사용 인덱스] 또는 None}
+        """
+        tables = set(self.inspector.get_table_names())
+        shapes = []
+        for shape in QUERY_SHAPES:
+            result = {
+                "name": shape["name"],
+                "table": shape["table"],
+                "columns": shape["equality"] + ([shape["range"]] if shape["range"] else []),
+                "sources": shape["sources"]
+            }
+            if shape["table"] not in tables:
+                result["status"] = "missing_table"
+                shapes.append(result)
+                continue
+
+            matches = [
+                {"index": index["name"], "columns": index["columns"], "coverage": self.coverage(shape, index["columns"])}
+                for index in self.table_indexes(shape["table"])
+            ]
+            best = next((m for m in matches if m["coverage"] == "full"), None) \
+                or next((m for m in matches if m["coverage"] == "partial"), None)
+            result["status"] = best["coverage"] if best else "none"
+            result["best_index"] = best
+            result["explain"] = self.explain(shape)
+            if result["status"] != "full":
+                result["ddl"] = self.create_index_ddl(shape)
+            shapes.append(result)
+
+        hot_tables = sorted({shape["table"] for shape in QUERY_SHAPES} & tables)
+        return {
+            "dialect": self.dialect,
+            "shapes": shapes,
+            "missing": [shape["ddl"] for shape in shapes if shape.get("ddl")],
+            "redundant": [item for table in hot_tables for item in self.redundant_indexes(table)],
+            "unused": self.unused_indexes(hot_tables)
+        }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """점검 결과 출력"""
+    status_icons = {"full": "✅", "partial": "🟡", "none": "❌", "missing_table": "⛔"}
+    print(f"🔎 인덱스 점검 ({report['dialect']})\n")
+
+    for shape in report["shapes"]:
+        print(f"{status_icons[shape['status']]} {shape['name']}: {shape['table']} ({', '.join(shape['columns'])})")
+        for source in shape["sources"]:
+            print(f"   - {source}")
+        if shape["status"] == "missing_table":
+            print("   테이블 없음")
+            continue
+        best = shape.get("best_index")
+        if best:
+            print(f"   가장 가까운 인덱스: {best['index']} ({', '.join(best['columns'])}) → {best['coverage']}")
+        explain = shape["explain"]
+        if explain.get("error"):
+            print(f"   EXPLAIN 실패: {explain['error']}")
+        else:
+            print(f"   EXPLAIN 사용 인덱스: {explain['index'] or '없음 (전체 스캔)'}")
+            for line in explain["plan"] or []:
+                print(f"     {line}")
+        if shape.get("ddl"):
+            print(f"   제안: {shape['ddl']}")
+        print()
+
+    if report["missing"]:
+        print("🛠️ 추가 제안 인덱스 (관리페이지 마이그레이션으로 반영):")
+        for ddl in report["missing"]:
+            print(f"   {ddl}")
+    else:
+        print("🛠️ 추가할 인덱스 없음")
+
+    if report["redundant"]:
+        print("\n♻️ 중복 인덱스 (긴 인덱스가 대신할 수 있음, 관리페이지 쿼리 확인 후 제거):")
+        for item in report["redundant"]:
+            print(f"   {item['table']}.{item['index']} ⊂ {item['covered_by']}: {item['ddl']}")
+
+    if report["unused"] is None:
+        print("\n💤 미사용 인덱스: MySQL performance_schema 에서만 확인 가능")
+    elif report["unused"]:
+        print("\n💤 서버 기동 후 읽지 않은 인덱스:")
+        for item in report["unused"]:
+            print(f"   {item['table']}.{item['index']}")
+    else:
+        print("\n💤 미사용 인덱스 없음")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="자주 실행되는 조회 형태와 스키마 인덱스 점검")
+    parser.add_argument("--url", help="데이터베이스 URL (기본: .env 의 MySQL 설정)")
+    parser.add_argument("--create-schema", action="store_true", help="모델 기준으로 테이블 생성 (로컬 SQLite 대체 DB 용)")
+    parser.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    args = parser.parse_args(argv)
+
+    if args.url:
+        engine = create_engine(args.url)
+    else:
+        from app.core.database import engine
+
+    if args.create_schema:
+        from app.core.database import Base
+        import app.models.tiktok  # noqa: F401  (모델을 메타데이터에 등록)
+        Base.metadata.create_all(engine)
+
+    report = IndexAdvisor(engine).analyze()
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
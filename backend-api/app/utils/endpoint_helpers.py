@@ -1,14 +1,22 @@
 """
 TikTok 엔드포인트 공통 유틸리티 함수들
 """
-import asyncio
+import base64
+import json
+import threading
+import time
 import traceback
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
-from typing import Dict, Any, Optional
-from sqlalchemy.orm import Session
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional, Tuple
+from sqlalchemy.orm import Query, Session
 
+from app.core.config import settings
 from app.services.tiktok_service import TikTokService
+from app.services.blocking_executor import app_executor
+
+# 목록 total 캐시 (키 → (계산 시각, 개수))
+_count_cache: Dict[str, Tuple[float, int]] = {}
+_count_cache_lock = threading.Lock()
 
 
 async def execute_tiktok_service(
@@ -36,15 +44,8 @@ async def execute_tiktok_service(
         tiktok_service = TikTokService(db_session=db)
         method = getattr(tiktok_service, method_name)
         
-        # Windows 호환성을 위해 동기 함수를 ThreadPoolExecutor에서 실행
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(
-                executor,
-                method,
-                *args,
-                **kwargs
-            )
+        # 동기 함수를 공용 스레드 풀에서 실행 (요청마다 스레드 풀을 만들지 않음)
+        result = await app_executor.run(method, *args, **kwargs)
         
         return result
     except Exception as e:
@@ -144,6 +145,136 @@ def create_success_response(
     return response
 
 
+def submit_background_job(job_type: str, request) -> Dict[str, Any]:
+    """
+    요청을 비동기 작업(Job)으로 제출하고 job_id 를 담은 응답 반환
+
+    Args:
+        job_type: job_manager 에 등록된 작업 타입명
+        request: 요청 스키마 (model_dump() 결과가 작업 파라미터로 저장됨)
+
+    Returns:
+        job_id 와 상태 조회 URL 을 포함한 성공 응답
+    """
+    from app.services.job_manager import job_manager, JobStatus
+
+    job_id = job_manager.submit(job_type, request.model_dump())
+    return create_success_response({
+        "job_id": job_id,
+        "job_type": job_type,
+        "status": JobStatus.QUEUED,
+        "status_url": f"/api/v1/jobs/{job_id}"
+    }, "Job queued")
+
+
+# === LISTING (cursor pagination) ===
+
+# cursor 키별 허용 값 타입 (i: 정렬 기준 id, p: posted_at ISO 문자열)
+_CURSOR_VALUE_TYPES = {
+    'i': int,
+    'p': (str, type(None))
+}
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """
+    목록 마지막 행의 정렬 키를 불투명한 cursor 문자열로 변환
+
+    Args:
+        values: 정렬 키 값 (datetime 은 ISO 문자열로 저장)
+
+    Returns:
+        URL 에 그대로 쓸 수 있는 base64 문자열
+    """
+    payload = {
+        key: value.isoformat() if isinstance(value, (datetime, date)) else value
+        for key, value in values.items()
+    }
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    encode_cursor 로 만든 cursor 를 정렬 키 값으로 되돌림
+
+    키별 값 형식도 확인합니다. (i: 정수 id, p: ISO 문자열 또는 None)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 keys 또는 값 형식이 맞지 않는 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except Exception:
+        raise ValueError("잘못된 cursor 입니다.")
+    if not isinstance(values, dict) or set(values) != set(keys):
+        raise ValueError("이 목록의 cursor 가 아닙니다.")
+
+    for key, value in values.items():
+        valid_type = _CURSOR_VALUE_TYPES.get(key)
+        # bool 은 int 의 하위 타입이므로 따로 제외
+        if valid_type and (isinstance(value, bool) or not isinstance(value, valid_type)):
+            raise ValueError("잘못된 cursor 값입니다.")
+    if values.get('p') is not None:
+        try:
+            datetime.fromisoformat(values['p'])
+        except ValueError:
+            raise ValueError("잘못된 cursor 값입니다.")
+    return values
+
+
+def cached_count(key: str, query: Query) -> int:
+    """
+    목록 total 을 LISTING_COUNT_CACHE_SECONDS 동안 캐시해서 반환 (요청마다 COUNT(*) 하지 않음)
+
+    Args:
+        key: 캐시 키 (목록 종류와 필터 조건)
+        query: 개수를 셀 쿼리
+    """
+    now = time.monotonic()
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+    if cached and now - cached[0] < settings.LISTING_COUNT_CACHE_SECONDS:
+        return cached[1]
+
+    count = query.order_by(None).count()
+    with _count_cache_lock:
+        _count_cache[key] = (now, count)
+    return count
+
+
+def project_columns(model, fields: Optional[str], required: Tuple[str, ...] = ('id',)) -> Optional[List[Any]]:
+    """
+    fields(쉼표 구분) 에 해당하는 모델 컬럼 목록 (없으면 None → 전체 to_dict 사용)
+
+    cursor 계산에 필요한 required 컬럼은 항상 포함합니다.
+
+    Raises:
+        ValueError: 모델에 없는 컬럼명이 있는 경우
+    """
+    if not fields:
+        return None
+
+    names = [name.strip() for name in fields.split(',') if name.strip()]
+    unknown = [name for name in names if name not in model.__table__.columns]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드: {', '.join(unknown)}")
+
+    for name in reversed(required):
+        if name not in names:
+            names.insert(0, name)
+    return [getattr(model, name) for name in names]
+
+
+def serialize_row(row) -> Dict[str, Any]:
+    """컬럼 조회 결과(Row)를 to_dict 와 같은 형식의 딕셔너리로 변환"""
+    return {
+        key: value.isoformat() if isinstance(value, (datetime, date)) else value
+        for key, value in row._asdict().items()
+    }
+
+
 def validate_session_file(session_file_path: Optional[str]) -> bool:
     """
     세션 파일 존재 여부를 확인
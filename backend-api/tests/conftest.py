@@ -0,0 +1,51 @@
+import os
+import re
+
+# app.core.config 는 DB 접속 정보가 필수이므로 app 을 import 하기 전에 설정 (테스트는 SQLite 메모리 DB 사용)
+for _key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(_key, "test")
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from app.core.database import Base
+import app.models.tiktok  # noqa: F401  (모델을 Base.metadata 에 등록)
+
+
+@pytest.fixture
+def engine():
+    """모델 테이블을 만든 SQLite 메모리 엔진 (스레드 간 같은 연결 공유)"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+    # pysqlite 는 SAVEPOINT 전에 BEGIN 을 보내지 않으므로 트랜잭션 시작을 직접 처리
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            # SQLite 는 INTEGER PRIMARY KEY 만 자동 증가하므로 BIGINT id 를 INTEGER 로 생성
+            ddl = str(CreateTable(table).compile(engine))
+            connection.exec_driver_sql(re.sub(r"^(\s*)id BIGINT NOT NULL", r"\1id INTEGER NOT NULL", ddl, flags=re.M))
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
@@ -0,0 +1,96 @@
+from datetime import datetime
+
+import pytest
+
+from app.models.tiktok import TikTokBrandAccount, TikTokRepostVideo, TikTokUser, TikTokVideo
+from app.services.tiktok_db_handler import TikTokDatabaseHandler
+
+
+def _video(n, **extra):
+    return {"link": f"https://www.tiktok.com/@a/video/{n}", "alt": f"title {n}", "src": f"thumb {n}", "views": n * 10, **extra}
+
+
+def _add_user(db_session, username="creator"):
+    user = TikTokUser(username=username)
+    db_session.add(user)
+    db_session.commit()
+    return user.id
+
+
+def test_bulk_upsert_videos_creates_then_updates(db_session):
+    user_id = _add_user(db_session)
+    handler = TikTokDatabaseHandler(db_session)
+
+    first = handler.bulk_upsert_videos([_video(1), _video(2)], user_id)
+    assert (first["created"], first["updated"]) == (2, 0)
+    assert set(first["ids"]) == {_video(1)["link"], _video(2)["link"]}
+
+    second = handler.bulk_upsert_videos([_video(2, views=999), _video(3)], user_id)
+    assert (second["created"], second["updated"]) == (1, 1)
+    # 기존 행은 같은 id 로 갱신 (중복 행 없음)
+    assert second["ids"][_video(2)["link"]] == first["ids"][_video(2)["link"]]
+    assert db_session.query(TikTokVideo).count() == 3
+    assert db_session.get(TikTokVideo, first["ids"][_video(2)["link"]]).view_count == 999
+
+
+def test_bulk_upsert_keeps_captured_stats_when_missing(db_session):
+    user_id = _add_user(db_session)
+    handler = TikTokDatabaseHandler(db_session)
+    posted_at = datetime(2025, 1, 1, 12, 0)
+
+    handler.bulk_upsert_videos([_video(1, like_count=50, posted_at=posted_at)], user_id)
+    # 응답 캡처 없이 다시 수집해도 좋아요 수/게시일은 0/NULL 로 덮지 않음
+    result = handler.bulk_upsert_videos([_video(1, views=70)], user_id)
+
+    video = db_session.get(TikTokVideo, result["ids"][_video(1)["link"]])
+    db_session.refresh(video)
+    assert (video.view_count, video.like_count, video.posted_at) == (70, 50, posted_at)
+
+
+def test_bulk_upsert_uses_last_value_for_duplicate_urls(db_session):
+    user_id = _add_user(db_session)
+    result = TikTokDatabaseHandler(db_session).bulk_upsert_videos([_video(1, views=1), _video(1, views=2)], user_id)
+
+    assert (result["created"], result["updated"]) == (1, 0)
+    assert db_session.query(TikTokVideo.view_count).scalar() == 2
+
+
+def test_bulk_upsert_scopes_unique_key_to_owner(db_session):
+    handler = TikTokDatabaseHandler(db_session)
+    first_user, second_user = _add_user(db_session, "first"), _add_user(db_session, "second")
+
+    handler.bulk_upsert_videos([_video(1)], first_user)
+    result = handler.bulk_upsert_videos([_video(1)], second_user)
+
+    assert result["created"] == 1
+    assert db_session.query(TikTokVideo).count() == 2
+
+
+def test_bulk_upsert_repost_videos(db_session):
+    account = TikTokBrandAccount(username="brand", brand_name="Brand")
+    db_session.add(account)
+    db_session.commit()
+    handler = TikTokDatabaseHandler(db_session)
+    row = {"video_url": "https://www.tiktok.com/@b/video/1", "title": "t", "thumbnail_url": "old", "view_count": 1}
+
+    handler.bulk_upsert_repost_videos([row], account.id)
+    result = handler.bulk_upsert_repost_videos([dict(row, thumbnail_url="new")], account.id, extra_update_columns=("thumbnail_url",))
+
+    assert (result["created"], result["updated"]) == (0, 1)
+    assert db_session.query(TikTokRepostVideo.thumbnail_url).scalar() == "new"
+
+
+def test_bulk_upsert_without_rows(db_session):
+    assert TikTokDatabaseHandler(db_session).bulk_upsert_videos([], 1) == {"created": 0, "updated": 0, "ids": {}}
+
+
+def test_bulk_upsert_rejects_unsupported_dialect(db_session, monkeypatch):
+    user_id = _add_user(db_session)
+    bind = db_session.get_bind()
+    monkeypatch.setattr(bind.dialect, "name", "oracle")
+
+    with pytest.raises(RuntimeError, match="oracle"):
+        TikTokDatabaseHandler(db_session).bulk_upsert_videos([_video(1)], user_id)
+
+    monkeypatch.undo()
+    assert db_session.query(TikTokVideo).count() == 0
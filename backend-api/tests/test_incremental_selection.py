@@ -0,0 +1,70 @@
+import pytest
+
+from app.core.config import settings
+from app.services.tiktok_service import TikTokService
+
+
+def _url(n):
+    return f"https://www.tiktok.com/@a/video/{n}"
+
+
+def _grid(*numbers):
+    return [{"link": _url(n)} for n in numbers]
+
+
+@pytest.fixture(autouse=True)
+def incremental_settings(monkeypatch):
+    monkeypatch.setattr(settings, "INCREMENTAL_PINNED_SLOTS", 2)
+    monkeypatch.setattr(settings, "INCREMENTAL_REFRESH_SAMPLE", 0)
+
+
+def test_stops_at_first_known_item_past_pinned_slots():
+    known = {_url(1), _url(5), _url(6)}
+
+    selected, stats = TikTokService._select_incremental_items(_grid(1, 9, 8, 5, 6), {"known_urls": known})
+
+    # 고정 슬롯의 저장된 항목(1)으로는 멈추지 않고, 그 뒤의 5 에서 멈춤
+    assert [item["link"] for item in selected] == [_url(9), _url(8)]
+    assert (stats["new"], stats["stopped_at"], stats["skipped"]) == (2, 3, 3)
+
+
+def test_latest_video_url_skips_pinned_known_items():
+    known = {_url(1), _url(2), _url(5)}
+
+    selected, stats = TikTokService._select_incremental_items(_grid(1, 2, 5), {"known_urls": known})
+
+    # 선택된 항목이 없어도 기준점은 고정 슬롯 다음의 그리드 항목
+    assert selected == []
+    assert stats["latest_video_url"] == _url(5)
+
+
+def test_latest_video_url_is_top_new_item():
+    _, stats = TikTokService._select_incremental_items(_grid(9, 1, 5), {"known_urls": {_url(1), _url(5)}})
+
+    assert stats["latest_video_url"] == _url(9)
+
+
+def test_first_run_selects_everything():
+    selected, stats = TikTokService._select_incremental_items(_grid(3, 2, 1), {})
+
+    assert len(selected) == 3
+    assert stats["latest_video_url"] == _url(3)
+    assert stats["stopped_at"] is None
+
+
+def test_refresh_sample_comes_from_known_items(monkeypatch):
+    monkeypatch.setattr(settings, "INCREMENTAL_REFRESH_SAMPLE", 1)
+
+    selected, stats = TikTokService._select_incremental_items(_grid(9, 1, 5), {"known_urls": {_url(1), _url(5)}})
+
+    assert stats["refreshed"] == 1
+    assert selected[0]["link"] == _url(9)
+    assert selected[1]["link"] in {_url(1), _url(5)}
+
+
+def test_grid_is_cut_at_known_item_past_pinned_slots():
+    raw_items = [{"link": f"/@a/video/{n}"} for n in (1, 9, 5, 4)]
+
+    # 상대 경로 링크도 절대 URL 로 비교, 중단 지점 항목까지 포함
+    assert TikTokService._cut_at_known_video(raw_items, {_url(1), _url(5)}) == raw_items[:3]
+    assert TikTokService._cut_at_known_video(raw_items, None) == raw_items
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+from app.services.job_manager import JobManager, JobStatus
+
+
+def _finish(manager, job_id, status, hours_ago):
+    manager.store.update(job_id, status=status, finished_at=(datetime.now() - timedelta(hours=hours_ago)).isoformat())
+
+
+def test_purge_expired_deletes_only_old_finished_jobs(tmp_path):
+    manager = JobManager(str(tmp_path / "jobs.sqlite3"), retention_hours=24)
+    manager.store.initialize()
+    old_completed = manager.store.create("test", {})
+    old_failed = manager.store.create("test", {})
+    recent = manager.store.create("test", {})
+    queued = manager.store.create("test", {})
+    _finish(manager, old_completed, JobStatus.COMPLETED, 48)
+    _finish(manager, old_failed, JobStatus.FAILED, 25)
+    _finish(manager, recent, JobStatus.COMPLETED, 1)
+
+    assert manager.purge_expired() == 2
+    assert manager.get(old_completed) is None
+    assert manager.get(old_failed) is None
+    # 보관 기간 안의 작업과 아직 끝나지 않은 작업은 유지
+    assert manager.get(recent) is not None
+    assert manager.get(queued)["status"] == JobStatus.QUEUED
+
+
+def test_zero_retention_keeps_everything(tmp_path):
+    manager = JobManager(str(tmp_path / "jobs.sqlite3"), retention_hours=0)
+    manager.store.initialize()
+    job_id = manager.store.create("test", {})
+    _finish(manager, job_id, JobStatus.COMPLETED, 24 * 365)
+
+    assert manager.purge_expired() == 0
+    assert manager.get(job_id) is not None
+
+
+def test_start_purges_expired_jobs(tmp_path):
+    db_path = str(tmp_path / "jobs.sqlite3")
+    previous = JobManager(db_path, retention_hours=24)
+    previous.store.initialize()
+    job_id = previous.store.create("test", {})
+    _finish(previous, job_id, JobStatus.COMPLETED, 48)
+
+    manager = JobManager(db_path, retention_hours=24)
+    manager.start()
+    try:
+        assert manager.get(job_id) is None
+    finally:
+        manager.shutdown()
@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints.tiktok import get_brand_accounts, get_brand_repost_videos
+from app.models.tiktok import TikTokBrandAccount, TikTokRepostVideo
+from app.utils.endpoint_helpers import decode_cursor, encode_cursor, project_columns
+
+
+def test_cursor_round_trip():
+    posted_at = datetime(2025, 3, 1, 9, 30)
+
+    cursor = encode_cursor({"p": posted_at, "i": 42})
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, ("p", "i")) == {"p": posted_at.isoformat(), "i": 42}
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    encode_cursor({"i": 1}),
+    # 키는 맞지만 값 형식이 다른 직접 만든 cursor
+    encode_cursor({"p": 5, "i": 1}),
+    encode_cursor({"p": None, "i": "1"}),
+    encode_cursor({"p": None, "i": True}),
+    encode_cursor({"p": "yesterday", "i": 1})
+])
+def test_decode_cursor_rejects_foreign_values(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, ("p", "i"))
+
+
+def test_project_columns_keeps_required_columns():
+    columns = project_columns(TikTokRepostVideo, "title, view_count", ("id", "posted_at"))
+
+    assert [column.key for column in columns] == ["id", "posted_at", "title", "view_count"]
+    assert project_columns(TikTokRepostVideo, None) is None
+    with pytest.raises(ValueError):
+        project_columns(TikTokRepostVideo, "title,password")
+
+
+@pytest.mark.parametrize("params", [
+    {"cursor": "garbage"},
+    {"cursor": encode_cursor({"i": "1"})},
+    {"fields": "title,password"}
+])
+def test_invalid_listing_params_return_400(db_session, params):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(get_brand_accounts(db=db_session, **params))
+
+    assert error.value.status_code == 400
+
+
+def test_hand_built_repost_cursor_returns_400(db_session):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(get_brand_repost_videos(1, cursor=encode_cursor({"p": 5, "i": 1}), db=db_session))
+
+    assert error.value.status_code == 400
+
+
+def test_repost_video_cursor_pages_without_gaps(db_session):
+    account = TikTokBrandAccount(username="brand", brand_name="Brand")
+    db_session.add(account)
+    db_session.commit()
+    for n in range(5):
+        db_session.add(TikTokRepostVideo(
+            tiktok_brand_account_id=account.id,
+            video_url=f"https://www.tiktok.com/@b/video/{n}",
+            title=f"t{n}",
+            repost_username="brand",
+            # 같은 posted_at, NULL posted_at 이 섞여도 빠짐/중복 없이 이어져야 함
+            posted_at=None if n == 0 else datetime(2025, 1, 1 + n // 2)
+        ))
+    db_session.commit()
+
+    seen, cursor = [], None
+    while True:
+        page = asyncio.run(get_brand_repost_videos(
+            account.id, limit=2, cursor=cursor, include_total=False, fields="video_url", db=db_session
+        ))
+        seen.extend(video["id"] for video in page["videos"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert sorted(seen) == sorted(video.id for video in db_session.query(TikTokRepostVideo))
+    assert len(seen) == len(set(seen))
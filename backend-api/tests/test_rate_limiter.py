@@ -0,0 +1,40 @@
+import asyncio
+
+from app.services.rate_limiter import TokenBucket
+
+
+def test_burst_then_waits_for_refill():
+    bucket = TokenBucket(rate_per_minute=600, burst=2)  # 0.1초마다 토큰 1개
+
+    async def acquire_three():
+        return [await bucket.acquire() for _ in range(3)]
+
+    waits = asyncio.run(acquire_three())
+
+    assert waits[:2] == [0.0, 0.0]
+    assert 0.05 < waits[2] <= 0.1
+    assert bucket.stats()["acquired"] == 3
+    assert bucket.stats()["waited"] == 1
+
+
+def test_concurrent_acquires_share_the_budget():
+    bucket = TokenBucket(rate_per_minute=1200, burst=1)  # 0.05초마다 토큰 1개
+
+    async def acquire_concurrently():
+        return await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+    waits = asyncio.run(acquire_concurrently())
+
+    assert sorted(waits)[0] == 0.0
+    assert bucket.waited == 3
+    assert bucket.total_wait_seconds >= 0.1
+
+
+def test_non_positive_rate_disables_limit():
+    bucket = TokenBucket(rate_per_minute=0, burst=1)
+
+    async def acquire_many():
+        return [await bucket.acquire() for _ in range(5)]
+
+    assert asyncio.run(acquire_many()) == [0.0] * 5
+    assert bucket.stats()["waited"] == 0
@@ -0,0 +1,90 @@
+import time
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.services import tiktok_db_handler
+from app.services.tiktok_db_handler import TikTokDatabaseHandler
+
+
+def _insert(video_url):
+    return lambda session: session.execute(
+        text("INSERT INTO tiktok_videos (tiktok_user_id, video_url, title, view_count, like_count, comment_count, share_count) "
+             "VALUES (1, :url, '', 0, 0, 0, 0)"),
+        {"url": video_url}
+    )
+
+
+def _video_urls(engine):
+    with engine.connect() as connection:
+        return sorted(connection.execute(text("SELECT video_url FROM tiktok_videos")).scalars())
+
+
+def test_failed_change_is_rolled_back_alone(engine, session_factory):
+    uow = TikTokDatabaseHandler(session_factory()).unit_of_work("test", flush_size=10, flush_interval_ms=60_000)
+    uow.add(_insert("a"))
+    uow.add(_insert("a"))  # 유니크 키 위반 → 이 변경만 SAVEPOINT 롤백
+    uow.add(_insert("b"))
+
+    assert uow.flush() == {"applied": 2, "failed": 1}
+    assert _video_urls(engine) == ["a", "b"]
+    uow.close()
+
+
+def test_flush_when_size_reached(engine, session_factory):
+    uow = TikTokDatabaseHandler(session_factory()).unit_of_work("test", flush_size=2, flush_interval_ms=60_000)
+    uow.add(_insert("a"))
+    assert _video_urls(engine) == []
+
+    uow.add(_insert("b"))
+    assert _video_urls(engine) == ["a", "b"]
+    assert uow.stats()["commits"] == 1
+    uow.close()
+
+
+def test_flush_on_deadline_without_further_adds(engine, session_factory):
+    uow = TikTokDatabaseHandler(session_factory()).unit_of_work("test", flush_size=10, flush_interval_ms=50)
+    uow.add(_insert("a"))
+
+    # 타이머 스레드의 커밋이 끝날 때까지 대기 (테스트 엔진은 연결 하나를 공유)
+    deadline = time.monotonic() + 2
+    while not uow.stats()["commits"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert _video_urls(engine) == ["a"]
+    uow.close()
+
+
+def test_close_commits_pending_and_closes_session(engine, session_factory):
+    session = session_factory()
+    uow = TikTokDatabaseHandler(session).unit_of_work("test", flush_size=10, flush_interval_ms=60_000)
+    uow.add(_insert("a"))
+
+    assert uow.close() == {"applied": 1, "failed": 0}
+    assert _video_urls(engine) == ["a"]
+    assert not session.in_transaction()
+
+
+def test_failed_commit_is_not_counted_and_backoff_releases_lock(engine, session_factory, monkeypatch):
+    session = session_factory()
+    uow = TikTokDatabaseHandler(session).unit_of_work("test", flush_size=10, flush_interval_ms=60_000)
+    uow.add(_insert("a"))
+
+    def fail_commit():
+        raise OperationalError("COMMIT", {}, Exception("deadlock"))
+
+    sleeps = []
+
+    def sleep_without_lock(seconds):
+        # 재시도 대기 중에는 다른 스레드가 add() 할 수 있어야 함
+        assert uow._lock.acquire(blocking=False)
+        uow._lock.release()
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(session, "commit", fail_commit)
+    monkeypatch.setattr(tiktok_db_handler.time, "sleep", sleep_without_lock)
+
+    assert uow.flush() == {"applied": 0, "failed": 1}
+    assert (uow.stats()["commits"], uow.stats()["failed"]) == (0, 1)
+    assert len(sleeps) == uow.MAX_COMMIT_RETRIES - 1
+    assert _video_urls(engine) == []
@@ -0,0 +1,43 @@
+from app.models.tiktok import TikTokUser, TikTokUserRepository
+
+
+def _user(n, followers=100):
+    return {"username": f"user{n}", "keyword": "kw", "nickname": f"nick {n}", "followers": followers}
+
+
+def test_upsert_from_scrape_across_chunks(db_session, monkeypatch):
+    monkeypatch.setattr(TikTokUserRepository, "UPSERT_CHUNK_SIZE", 2)
+    repo = TikTokUserRepository(db_session)
+
+    created = repo.upsert_from_scrape([_user(n) for n in range(5)])
+    assert (created["created"], created["updated"], created["skipped"]) == (5, 0, 0)
+    assert set(created["ids"]) == {f"user{n}" for n in range(5)}
+
+    # 팔로워 수가 바뀐 사용자만 갱신, 나머지는 스킵
+    result = repo.upsert_from_scrape([_user(0, followers=500), _user(3, followers=700), _user(1), _user(5)])
+    assert (result["created"], result["updated"], result["skipped"]) == (1, 2, 1)
+    assert result["ids"]["user0"] == created["ids"]["user0"]
+    assert repo.get_by_username("user3").followers == 700
+    assert db_session.query(TikTokUser).count() == 6
+
+
+def test_upsert_from_scrape_skips_duplicates_and_missing_usernames(db_session):
+    repo = TikTokUserRepository(db_session)
+
+    result = repo.upsert_from_scrape([_user(1, followers=1), {"followers": 3}, _user(1, followers=2)])
+
+    assert (result["created"], result["skipped"]) == (1, 2)
+    assert repo.get_by_username("user1").followers == 2
+
+
+def test_upsert_from_scrape_ignores_deleted_users(db_session):
+    repo = TikTokUserRepository(db_session)
+    repo.upsert_from_scrape([_user(1)])
+    deleted = repo.get_by_username("user1")
+    deleted.deleted_at = deleted.created_at
+    db_session.commit()
+
+    result = repo.upsert_from_scrape([_user(1)])
+
+    assert result["created"] == 1
+    assert result["ids"]["user1"] != deleted.id
@@ -0,0 +1,57 @@
+import asyncio
+
+from app.services.tiktok_service import TikTokService
+
+
+class FakeGridBrowser:
+    """extract_video_grid 결과만 돌려주는 AsyncBrowserManager 대역 (응답 캡처 없음)"""
+
+    capture = None
+
+    def __init__(self, raw_items):
+        self.raw_items = raw_items
+
+    async def extract_video_grid(self):
+        return self.raw_items
+
+    async def get_video_containers(self):
+        return []
+
+
+def test_build_video_item_normalizes_grid_values():
+    raw = {"link": "/@creator/video/1", "alt": "creator님이 Capcut으로 만든 여름 브이로그", "src": "https://img/1.jpg", "views": " 1.2K "}
+
+    item = TikTokService._build_video_item(raw, 1, "creator", is_repost=True)
+
+    assert item == {
+        "index": 1,
+        "username": "creator",
+        "is_repost": True,
+        "link": "https://www.tiktok.com/@creator/video/1",
+        "alt": "여름 브이로그",
+        "src": "https://img/1.jpg",
+        "views": "1.2K"
+    }
+
+
+def test_build_video_item_marks_missing_values():
+    item = TikTokService._build_video_item({"link": None, "alt": None, "src": None, "views": None}, 3, "creator")
+
+    assert (item["link"], item["alt"], item["src"], item["views"]) == ("N/A", "N/A", "N/A", "N/A")
+    assert "is_repost" not in item
+
+
+def test_extract_video_grid_items_from_single_evaluate():
+    browser = FakeGridBrowser([
+        {"link": "https://www.tiktok.com/@creator/video/2", "alt": "two", "src": None, "views": "10"},
+        {"link": "/@creator/video/1", "alt": "one", "src": None, "views": "20"}
+    ])
+    service = TikTokService()
+
+    results = asyncio.run(service._extract_video_grid_items_async(browser, "creator"))
+
+    assert [item["index"] for item in results] == [1, 2]
+    assert [item["link"] for item in results] == [
+        "https://www.tiktok.com/@creator/video/2",
+        "https://www.tiktok.com/@creator/video/1"
+    ]